@@ -6,6 +6,34 @@ from pathlib import Path
 
 # --- Configuration and Utility ---
 
+# hashlib.file_digest (Python 3.11+) reads files into a reusable buffer and feeds
+# the hasher directly; older interpreters use the chunked read loop instead.
+_HAS_FILE_DIGEST = hasattr(hashlib, 'file_digest')
+
+# Algorithm families whose output length is configurable (SHAKE, BLAKE2).
+_VARIABLE_LENGTH_PREFIXES = ('blake2', 'shake')
+
+# Optional fast backends for integrity-only hashing (change detection, cache
+# keys). They are exposed under their own names next to the hashlib algorithms
+# when the 'xxhash' / 'blake3' packages are installed. They do not support HMAC.
+_EXTRA_ALGORITHMS = {}
+
+try:
+    import xxhash
+    _EXTRA_ALGORITHMS.update({
+        'xxh64': xxhash.xxh64,
+        'xxh3_64': xxhash.xxh3_64,
+        'xxh3_128': xxhash.xxh3_128,
+    })
+except ImportError:
+    pass
+
+try:
+    import blake3
+    _EXTRA_ALGORITHMS['blake3'] = blake3.blake3
+except ImportError:
+    pass
+
 class HashTools:
     """
     A comprehensive utility class for hashing and HMAC generation, supporting 
@@ -15,12 +43,13 @@ class HashTools:
     @staticmethod
     def get_algorithms() -> List[str]:
         """Returns a sorted list of all available hashing algorithms in the environment."""
-        return sorted(hashlib.algorithms_available)
+        return sorted(hashlib.algorithms_available.union(_EXTRA_ALGORITHMS))
 
     @staticmethod
     def is_supported(algorithm: str) -> bool:
         """Checks if a specific algorithm is supported."""
-        return algorithm.lower() in hashlib.algorithms_available
+        algo_lower = algorithm.lower()
+        return algo_lower in hashlib.algorithms_available or algo_lower in _EXTRA_ALGORITHMS
 
     @staticmethod
     def _get_hasher(
@@ -46,6 +75,11 @@ class HashTools:
                 f"Supported algorithms include: {', '.join(HashTools.get_algorithms()[:10])}..."
             )
         
+        if algo_lower in _EXTRA_ALGORITHMS:
+            if key is not None:
+                raise ValueError(f"HMAC is not supported for the '{algo_lower}' algorithm.")
+            return _EXTRA_ALGORITHMS[algo_lower]()
+
         kwargs = {}
         
         # BLAKE2 (blake2b, blake2s) requires the size to be passed as 'digest_size' 
@@ -55,11 +89,10 @@ class HashTools:
             
         if key is not None:
             # Key provided: Initialize as an HMAC object
-            # Note: hmac.new must be passed the digestmod *object* for BLAKE2 with kwargs
+            # Note: for BLAKE2 with kwargs hmac.new needs a digestmod *constructor*; it
+            # builds separate inner and outer hash objects from it
             if 'digest_size' in kwargs:
-                # Initialize the base hash object with parameters first
-                base_hash_obj = hashlib.new(algo_lower, **kwargs)
-                return hmac.new(key, digestmod=lambda: base_hash_obj)
+                return hmac.new(key, digestmod=lambda d=b'': hashlib.new(algo_lower, d, **kwargs))
             else:
                 return hmac.new(key, digestmod=algo_lower)
         else:
@@ -68,7 +101,7 @@ class HashTools:
 
     @staticmethod
     def calculate_digest(
-        data_source: Union[str, bytes, os.PathLike],
+        data_source: Union[str, bytes, bytearray, memoryview, os.PathLike],
         algorithm: str = 'sha256',
         key: Optional[Union[str, bytes]] = None,
         encoding: str = 'utf-8',
@@ -76,19 +109,26 @@ class HashTools:
         digest_length: Optional[int] = None
     ) -> str:
         """
-        Calculates the hash digest for text, raw bytes, or a file path.
+        Calculates the hash digest for text, raw bytes (including bytearray and
+        memoryview buffers), or a file path.
         If a 'key' is provided, it calculates the HMAC (Hash-based Message 
         Authentication Code) instead of a standard hash.
 
         The optional 'digest_length' parameter is used for variable-output-length 
-        algorithms (SHAKE128, SHAKE256, BLAKE2b, BLAKE2s).
+        algorithms (SHAKE128, SHAKE256, BLAKE2b, BLAKE2s, BLAKE3).
+
+        When the optional 'xxhash' / 'blake3' packages are installed, the
+        non-cryptographic 'xxh64', 'xxh3_64', 'xxh3_128' and the fast 'blake3'
+        algorithms are also accepted (without a key). Use them for integrity
+        checks and cache keys, not for security.
 
-        :param data_source: The data to hash (string, bytes, or file path).
+        :param data_source: The data to hash (string, bytes-like object, or file path).
         :param algorithm: The hashing algorithm (e.g., 'md5', 'sha256').
         :param key: Optional secret key (string or bytes) for HMAC calculation.
         :param encoding: Encoding to use if data_source is a string.
-        :param chunk_size: Chunk size (in bytes) for file processing (ignored for strings/bytes).
-        :param digest_length: The desired output length in bytes (for SHAKE/BLAKE2 only).
+        :param chunk_size: Chunk size (in bytes) for file processing (ignored for strings/bytes,
+                           and on Python 3.11+ where hashlib.file_digest manages the buffer).
+        :param digest_length: The desired output length in bytes (for SHAKE/BLAKE2/BLAKE3 only).
         :return: The hexadecimal hash digest string.
         :raises TypeError: If input data type is invalid.
         :raises FileNotFoundError: If the file path is invalid.
@@ -103,43 +143,137 @@ class HashTools:
         else:
             raise TypeError("Key must be a string or bytes.")
 
-        # 2. Initialize Hasher (Standard Hash or HMAC, includes BLAKE2 size setup)
+        algo_lower = algorithm.lower()
+        source_type = type(data_source)
+
+        # 2. One-shot HMAC for in-memory text/bytes with fixed-size algorithms:
+        # hmac.digest runs entirely in C without building an HMAC object.
+        if (key_bytes is not None
+                and (source_type is bytes or source_type is str)
+                and not algo_lower.startswith(_VARIABLE_LENGTH_PREFIXES)
+                and algo_lower in hashlib.algorithms_available):
+            data_bytes = data_source if source_type is bytes else data_source.encode(encoding)
+            return hmac.digest(key_bytes, data_bytes, algo_lower).hex()
+
+        # 3. Initialize Hasher (Standard Hash or HMAC, includes BLAKE2 size setup)
         try:
             hasher = HashTools._get_hasher(algorithm, key_bytes, digest_length)
         except ValueError:
             raise
         
-        # 3. Process Input
-        if isinstance(data_source, (str, bytes)):
-            if isinstance(data_source, str):
-                data_bytes = data_source.encode(encoding)
-            else:
-                data_bytes = data_source
-            hasher.update(data_bytes)
-            
-        elif isinstance(data_source, os.PathLike) or (isinstance(data_source, str) and Path(data_source).is_file()):
+        # 4. Process Input
+        # Exact type checks first: they are cheaper than isinstance and cover the
+        # common in-memory inputs. Buffers (bytearray/memoryview) are hashed
+        # without copying.
+        if source_type is bytes:
+            hasher.update(data_source)
+        elif source_type is str:
+            hasher.update(data_source.encode(encoding))
+        elif source_type is bytearray or source_type is memoryview:
+            hasher.update(data_source)
+        elif isinstance(data_source, (bytes, bytearray, memoryview)):
+            # Subclasses of the buffer types above
+            hasher.update(data_source)
+        elif isinstance(data_source, str):
+            hasher.update(data_source.encode(encoding))
+        elif isinstance(data_source, os.PathLike):
             filepath = Path(data_source)
             if not filepath.is_file():
                 raise FileNotFoundError(f"File not found: {filepath}")
 
             with open(filepath, 'rb') as f:
-                while chunk := f.read(chunk_size):
-                    hasher.update(chunk)
+                if _HAS_FILE_DIGEST:
+                    # Feeds the already-configured hasher (plain, BLAKE2-sized or HMAC)
+                    hashlib.file_digest(f, lambda: hasher)
+                else:
+                    while chunk := f.read(chunk_size):
+                        hasher.update(chunk)
         else:
             raise TypeError(
-                "Input 'data_source' must be a string, byte sequence, or a valid file path."
+                "Input 'data_source' must be a string, bytes-like object, or a valid file path."
             )
 
-        # 4. Return the Digest
-        algo_lower = algorithm.lower()
-        
-        # SHAKE algorithms require the length to be specified when calling hexdigest()
-        if algo_lower.startswith('shake') and digest_length is not None:
+        # 5. Return the Digest
+        # SHAKE (and BLAKE3) require the length to be specified when calling hexdigest()
+        if (algo_lower.startswith('shake') or algo_lower == 'blake3') and digest_length is not None:
             return hasher.hexdigest(digest_length)
         else:
             # Standard hexdigest for fixed-length algorithms or BLAKE2 (where length was set during initialization)
             return hasher.hexdigest()
 
+    @staticmethod
+    def prefix_hasher(
+        prefix: Union[str, bytes, bytearray, memoryview],
+        algorithm: str = 'sha256',
+        key: Optional[Union[str, bytes]] = None,
+        encoding: str = 'utf-8',
+        digest_length: Optional[int] = None
+    ) -> 'PrefixHasher':
+        """
+        Creates a reusable hasher that has already absorbed a common prefix.
+        Each call to digest_of(suffix) hashes prefix + suffix by copying the
+        saved state, so the prefix is processed only once no matter how many
+        suffixes are hashed (e.g., one header signed with many bodies).
+
+        :param prefix: The shared leading data (string or bytes-like object).
+        :param algorithm: The hashing algorithm (e.g., 'sha256').
+        :param key: Optional secret key (string or bytes) for HMAC calculation.
+        :param encoding: Encoding to use for string prefix/suffix values.
+        :param digest_length: The desired output length in bytes (for SHAKE/BLAKE2/BLAKE3 only).
+        :return: A PrefixHasher instance.
+        :raises TypeError: If the key or prefix type is invalid.
+        :raises ValueError: If the algorithm is unsupported.
+        """
+        return PrefixHasher(prefix, algorithm, key, encoding, digest_length)
+
+
+class PrefixHasher:
+    """
+    Holds a hash (or HMAC) state after absorbing a fixed prefix.
+    Created through HashTools.prefix_hasher().
+    """
+
+    def __init__(
+        self,
+        prefix: Union[str, bytes, bytearray, memoryview],
+        algorithm: str = 'sha256',
+        key: Optional[Union[str, bytes]] = None,
+        encoding: str = 'utf-8',
+        digest_length: Optional[int] = None
+    ):
+        if isinstance(key, str):
+            key = key.encode(encoding)
+        elif not (isinstance(key, bytes) or key is None):
+            raise TypeError("Key must be a string or bytes.")
+
+        self.encoding = encoding
+        self._template = HashTools._get_hasher(algorithm, key, digest_length)
+        self._template.update(self._to_bytes(prefix))
+
+        algo_lower = algorithm.lower()
+        # Variable-length algorithms that take the length at hexdigest() time
+        self._hexdigest_length = (
+            digest_length
+            if (algo_lower.startswith('shake') or algo_lower == 'blake3') and digest_length is not None
+            else None
+        )
+
+    def _to_bytes(self, data: Union[str, bytes, bytearray, memoryview]) -> Union[bytes, bytearray, memoryview]:
+        """Internal helper to encode strings and pass bytes-like objects through."""
+        if isinstance(data, str):
+            return data.encode(self.encoding)
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return data
+        raise TypeError("Data must be a string or bytes-like object.")
+
+    def digest_of(self, suffix: Union[str, bytes, bytearray, memoryview]) -> str:
+        """Returns the hexadecimal digest of prefix + suffix."""
+        hasher = self._template.copy()
+        hasher.update(self._to_bytes(suffix))
+        if self._hexdigest_length is not None:
+            return hasher.hexdigest(self._hexdigest_length)
+        return hasher.hexdigest()
+
 
 # --- Example Usage (Test/Demo) ---
 
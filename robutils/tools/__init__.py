@@ -1,81 +1,100 @@
 """Tools utilities package for configuration, database, CSV, datetime, file operations, hashing, logging, and security."""
 
-from .configFactory import (
-    BaseConfig,
-    INIConfig,
-    JSONConfig,
-    XMLConfig,
-)
+import importlib
 
+# These two classes share their name with the submodule that defines them. A
+# submodule import binds the module object to that name on the package, which
+# would shadow a lazily resolved class, so they are imported eagerly (both
+# only depend on lightweight standard library modules).
 from .CSVManager import CSVManager
+from .HashTools import HashTools
 
-from .databaseManager import (
-    DBConnection,
-    DBNotSupportedError,
-    DBConnectionError,
-    SQLiteConnection,
-    MySQLConnection,
-    PostgreSQLConnection,
-    DatabaseManager,
-)
+# Public names mapped to the submodule that defines them. Submodules are only
+# imported on first attribute access (PEP 562), so importing one tool does not
+# pull in the dependencies of all the others (sqlite3, xml, configparser, ...).
+_LAZY = {
+    'BaseConfig': '.configFactory',
+    'INIConfig': '.configFactory',
+    'JSONConfig': '.configFactory',
+    'XMLConfig': '.configFactory',
+    'DBConnection': '.databaseManager',
+    'DBNotSupportedError': '.databaseManager',
+    'DBConnectionError': '.databaseManager',
+    'SQLiteConnection': '.databaseManager',
+    'MySQLConnection': '.databaseManager',
+    'PostgreSQLConnection': '.databaseManager',
+    'DatabaseManager': '.databaseManager',
+    'ConnectionPool': '.databaseManager',
+    'DateTimeManager': '.datetimeManager',
+    'get_path_object': '.filesystemManager',
+    'StatCache': '.filesystemManager',
+    'read_file_content': '.filesystemManager',
+    'read_files_batch': '.filesystemManager',
+    'write_file_content': '.filesystemManager',
+    'atomic_write_file_content': '.filesystemManager',
+    'get_file_size': '.filesystemManager',
+    'batch_file_sizes': '.filesystemManager',
+    'get_file_checksum': '.filesystemManager',
+    'get_file_checksums': '.filesystemManager',
+    'get_file_times': '.filesystemManager',
+    'create_directory': '.filesystemManager',
+    'create_temp_directory': '.filesystemManager',
+    'delete_path': '.filesystemManager',
+    'list_directory_contents': '.filesystemManager',
+    'iter_directory_contents': '.filesystemManager',
+    'walk_directory_contents': '.filesystemManager',
+    'iwalk_directory_contents': '.filesystemManager',
+    'get_directory_size': '.filesystemManager',
+    'move_path': '.filesystemManager',
+    'copy_path': '.filesystemManager',
+    'join_paths': '.filesystemManager',
+    'get_absolute_path': '.filesystemManager',
+    'get_parent_directory': '.filesystemManager',
+    'get_filename_and_extension': '.filesystemManager',
+    'is_file': '.filesystemManager',
+    'is_directory': '.filesystemManager',
+    'path_exists': '.filesystemManager',
+    'AbstractFilter': '.logger',
+    'LevelFilter': '.logger',
+    'NameFilter': '.logger',
+    'ContextFilter': '.logger',
+    'AbstractHandler': '.logger',
+    'ConsoleHandler': '.logger',
+    'MemoryHandler': '.logger',
+    'FileHandler': '.logger',
+    'RotatingFileHandler': '.logger',
+    'SQLiteHandler': '.logger',
+    'SocketHandler': '.logger',
+    'HTTPHandler': '.logger',
+    'Logger': '.logger',
+    'LoggerManager': '.logger',
+    'StreamHandler': '.logger',
+    'get_logger': '.logger',
+    'hash_password': '.passwordManager',
+    'hash_passwords': '.passwordManager',
+    'verify_password': '.passwordManager',
+    'calibrate_iterations': '.passwordManager',
+    'generate_strong_password': '.passwordManager',
+    'generate_pin': '.passwordManager',
+    'calculate_entropy': '.passwordManager',
+    'calculate_entropy_many': '.passwordManager',
+    'is_strong_password': '.passwordManager',
+    'InvalidCredentialsError': '.passwordManager',
+}
 
-from .datetimeManager import DateTimeManager
 
-from .filesystemManager import (
-    get_path_object,
-    read_file_content,
-    write_file_content,
-    atomic_write_file_content,
-    get_file_size,
-    get_file_checksum,
-    get_file_times,
-    create_directory,
-    create_temp_directory,
-    delete_path,
-    list_directory_contents,
-    walk_directory_contents,
-    get_directory_size,
-    move_path,
-    copy_path,
-    join_paths,
-    get_absolute_path,
-    get_parent_directory,
-    get_filename_and_extension,
-    is_file,
-    is_directory,
-    path_exists,
-)
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .HashTools import HashTools
 
-from .logger import (
-    AbstractFilter,
-    LevelFilter,
-    NameFilter,
-    ContextFilter,
-    AbstractHandler,
-    ConsoleHandler,
-    MemoryHandler,
-    FileHandler,
-    RotatingFileHandler,
-    SQLiteHandler,
-    SocketHandler,
-    HTTPHandler,
-    Logger,
-    LoggerManager,
-    StreamHandler,
-    get_logger,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-from .passwordManager import (
-    hash_password,
-    verify_password,
-    generate_strong_password,
-    generate_pin,
-    calculate_entropy,
-    is_strong_password,
-    InvalidCredentialsError,
-)
 
 __all__ = [
     'BaseConfig',
@@ -90,19 +109,26 @@ __all__ = [
     'MySQLConnection',
     'PostgreSQLConnection',
     'DatabaseManager',
+    'ConnectionPool',
     'DateTimeManager',
     'get_path_object',
+    'StatCache',
     'read_file_content',
+    'read_files_batch',
     'write_file_content',
     'atomic_write_file_content',
     'get_file_size',
+    'batch_file_sizes',
     'get_file_checksum',
+    'get_file_checksums',
     'get_file_times',
     'create_directory',
     'create_temp_directory',
     'delete_path',
     'list_directory_contents',
+    'iter_directory_contents',
     'walk_directory_contents',
+    'iwalk_directory_contents',
     'get_directory_size',
     'move_path',
     'copy_path',
@@ -131,10 +157,13 @@ __all__ = [
     'StreamHandler',
     'get_logger',
     'hash_password',
+    'hash_passwords',
     'verify_password',
+    'calibrate_iterations',
     'generate_strong_password',
     'generate_pin',
     'calculate_entropy',
+    'calculate_entropy_many',
     'is_strong_password',
     'InvalidCredentialsError',
 ]
@@ -0,0 +1,26 @@
+"""
+Numba-compiled kernel behind DateTimeManager.decompose_durations().
+
+Kept in its own module so that 'numba' (a heavy import) is only loaded the
+first time decompose_durations() runs, never when datetimeManager is imported.
+The compiled machine code is written to __pycache__ (cache=True), so the
+compile cost of the first call (a few hundred milliseconds) is paid once per
+installation rather than once per process.
+"""
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, parallel=True)
+def decompose(seconds):
+    """Splits non-negative int64 seconds into an (N, 4) array of days, hours, minutes, seconds."""
+    out = np.empty((seconds.size, 4), np.int64)
+    for i in numba.prange(seconds.size):
+        remainder = seconds[i]
+        out[i, 0] = remainder // 86400
+        remainder %= 86400
+        out[i, 1] = remainder // 3600
+        remainder %= 3600
+        out[i, 2] = remainder // 60
+        out[i, 3] = remainder % 60
+    return out
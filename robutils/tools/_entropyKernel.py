@@ -0,0 +1,25 @@
+"""
+Numba-compiled kernel behind passwordManager.calculate_entropy_many().
+
+Kept in its own module so that 'numba' (a heavy import) is only loaded the
+first time calculate_entropy_many() runs, never when passwordManager is
+imported. The compiled machine code is written to __pycache__ (cache=True).
+"""
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, parallel=True)
+def entropies(buf, offsets, lengths, class_table, log2_space):
+    """
+    Entropy of each password stored back to back in the uint8 buffer `buf`
+    (password i spans buf[offsets[i]:offsets[i + 1]]; lengths[i] is its length in characters).
+    """
+    n = lengths.size
+    out = np.empty(n, np.float64)
+    for i in numba.prange(n):
+        mask = 0
+        for j in range(offsets[i], offsets[i + 1]):
+            mask |= class_table[buf[j]]
+        out[i] = lengths[i] * log2_space[mask]
+    return out
@@ -1,13 +1,48 @@
+import io
 import os
+import functools
 import json
+import tempfile
 import configparser
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
 
+# orjson is an optional accelerator for JSONConfig; the standard library
+# json module is used when it is not installed. Both paths produce bytes
+# with a 2-space indent so the on-disk format does not depend on the backend.
+try:
+    import orjson
+
+    def _json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data):
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    _json_loads = json.loads
+
 # -----------------------------------------------------------
 # 1. ABSTRACT BASE CLASS
 # -----------------------------------------------------------
 
+@functools.lru_cache(maxsize=1024)
+def _split_key(key):
+    """Internal helper splitting a dotted key into its path parts, cached per key string."""
+    return tuple(key.split('.'))
+
+def _flatten(data, prefix=''):
+    """Internal helper to flatten nested dicts into a {'a.b.c': value} mapping."""
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(_flatten(value, path + '.'))
+        else:
+            flat[path] = value
+    return flat
+
 class BaseConfig(ABC):
     """
     Abstract Base Class for all configuration handlers.
@@ -27,55 +62,77 @@ class BaseConfig(ABC):
         pass
     
     @abstractmethod
-    def save(self):
+    def save(self, fsync=False):
         """Save the internal data to the configuration file."""
         pass
+
+    def _atomic_write(self, payload, fsync=False):
+        """
+        Internal helper to replace the config file atomically. The payload (bytes)
+        is written to a temporary file in the same directory, then moved over the
+        target with os.replace, so a crash never leaves a truncated config.
+        fsync=True forces the data to disk before the rename.
+        """
+        directory = os.path.dirname(os.path.abspath(self.filepath))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            # mkstemp creates files as 0600; keep the existing file's permissions
+            try:
+                os.chmod(tmp_path, os.stat(self.filepath).st_mode & 0o777)
+            except FileNotFoundError:
+                os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.filepath)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
     
     def get(self, key, default=None):
         """
         Retrieve a value by key. Supports dotted path notation (e.g., 'section.key').
+        If the key names a section, the section is returned as a dictionary.
         Returns the default value if the key is not found.
         """
-        try:
-            return self._resolve_path(key)
-        except (KeyError, IndexError, TypeError):
-            return default
+        current = self.data
+        for part in _split_key(key):
+            if not isinstance(current, dict):
+                return default
+            try:
+                current = current[part]
+            except KeyError:
+                return default
+        return current
 
     def set(self, key, value):
         """
         Set a value for a given key. Supports dotted path notation.
-        Creates intermediate dictionaries/sections if they don't exist.
+        Creates intermediate dictionaries/sections if they don't exist,
+        replacing any value that was stored in their place.
         """
-        self._set_path(key, value)
-        
-    def _resolve_path(self, key):
-        """Internal helper to traverse and return a value from the data structure."""
-        parts = key.split('.')
+        parts = _split_key(key)
         current = self.data
-        
-        for part in parts:
-            if isinstance(current, dict):
-                current = current[part]
-            else:
-                # Structure break
-                raise KeyError(f"Path part '{part}' not found or structure invalid at {key}")
-                
-        return current
-
-    def _set_path(self, key, value):
-        """Internal helper to traverse and set a value in the data structure."""
-        parts = key.split('.')
-        current = self.data
-        
-        # Traverse until the second to last part
         for part in parts[:-1]:
-            if part not in current or not isinstance(current[part], dict):
-                current[part] = {} # Create the section/nested dict if it doesn't exist
-            current = current[part]
-            
-        # Set the final key/value
+            child = current.get(part)
+            if not isinstance(child, dict):
+                child = current[part] = {}
+            current = child
         current[parts[-1]] = value
 
+    def section(self, prefix):
+        """
+        Return the flat entries below a dotted prefix, with the prefix stripped
+        (e.g., section('server') -> {'host': ..., 'tls.cert': ...}).
+        """
+        section = self.get(prefix)
+        return _flatten(section) if isinstance(section, dict) else {}
+
 # -----------------------------------------------------------
 # 2. STANDARD LIBRARY FORMAT-SPECIFIC HANDLERS
 # -----------------------------------------------------------
@@ -85,15 +142,17 @@ class INIConfig(BaseConfig):
     
     def load(self):
         config = configparser.ConfigParser()
-        if os.path.exists(self.filepath):
-            # Read files without raising error if missing
-            config.read(self.filepath)
-            # Convert configparser object to a standard dict structure
-            self.data = {s: dict(config.items(s)) for s in config.sections()}
-        else:
+        try:
+            f = open(self.filepath, 'r', encoding='utf-8')
+        except FileNotFoundError:
             self.data = {}
+            return
+        with f:
+            config.read_file(f)
+        # Convert configparser object to a standard dict structure
+        self.data = {s: dict(config.items(s)) for s in config.sections()}
             
-    def save(self):
+    def save(self, fsync=False):
         config = configparser.ConfigParser()
         
         # Restructure the internal dict for configparser
@@ -101,27 +160,32 @@ class INIConfig(BaseConfig):
             if section != 'DEFAULT':
                 config[section] = items
             
-        with open(self.filepath, 'w') as configfile:
-            config.write(configfile)
+        buffer = io.StringIO()
+        config.write(buffer)
+        self._atomic_write(buffer.getvalue().encode('utf-8'), fsync)
 
 class JSONConfig(BaseConfig):
-    """Handles JSON configuration files using standard library's json module."""
+    """Handles JSON configuration files using orjson when available, else the standard library's json module."""
     
     def load(self):
-        if os.path.exists(self.filepath):
-            with open(self.filepath, 'r') as f:
-                # Handle empty file case
-                try:
-                    self.data = json.load(f)
-                except json.JSONDecodeError:
-                    self.data = {}
-        else:
+        try:
+            f = open(self.filepath, 'rb')
+        except FileNotFoundError:
             self.data = {}
+            return
+        with f:
+            # Handle empty file case (orjson's decode error subclasses json's)
+            try:
+                data = _json_loads(f.read())
+            except json.JSONDecodeError:
+                data = {}
+        if not isinstance(data, dict):
+            raise ValueError(f"JSON config root must be an object, not {type(data).__name__}: {self.filepath}")
+        self.data = data
             
-    def save(self):
-        with open(self.filepath, 'w') as f:
-            # Use indent=4 for human-readable output
-            json.dump(self.data, f, indent=4)
+    def save(self, fsync=False):
+        # Indented for human-readable output
+        self._atomic_write(_json_dumps(self.data), fsync)
             
 class XMLConfig(BaseConfig):
     """Handles XML configuration files using standard library's xml.etree.ElementTree.
@@ -130,23 +194,32 @@ class XMLConfig(BaseConfig):
     """
     
     def load(self):
-        self.data = {}
-        if os.path.exists(self.filepath):
+        data = {}
+        try:
+            f = open(self.filepath, 'rb')
+        except FileNotFoundError:
+            self.data = data
+            return
+        with f:
             try:
-                tree = ET.parse(self.filepath)
-                root = tree.getroot()
-                for section_element in root:
-                    section_name = section_element.tag
-                    self.data[section_name] = {}
-                    for item_element in section_element:
-                        key = item_element.tag
-                        value = item_element.text
-                        self.data[section_name][key] = value
+                # Stream the document instead of building the full tree first.
+                # Depth 0 is the root, depth 1 a section, depth 2 a key.
+                depth = 0
+                for event, element in ET.iterparse(f, events=('start', 'end')):
+                    if event == 'start':
+                        depth += 1
+                        continue
+                    depth -= 1
+                    if depth == 1:
+                        # Section is complete: copy its items and free the subtree
+                        data[element.tag] = {item.tag: item.text for item in element}
+                        element.clear()
             except ET.ParseError as e:
                 print(f"Error parsing XML file {self.filepath}: {e}")
-                self.data = {}
+                data = {}
+        self.data = data
         
-    def save(self):
+    def save(self, fsync=False):
         # Create the root element (e.g., <config>)
         root = ET.Element("config") 
         
@@ -157,8 +230,9 @@ class XMLConfig(BaseConfig):
                 item_element.text = str(value)
                 
         tree = ET.ElementTree(root)
-        # Write to file
-        tree.write(self.filepath, encoding='utf-8', xml_declaration=True)
+        buffer = io.BytesIO()
+        tree.write(buffer, encoding='utf-8', xml_declaration=True)
+        self._atomic_write(buffer.getvalue(), fsync)
 
 # -----------------------------------------------------------
 # 3. CONFIG FACTORY
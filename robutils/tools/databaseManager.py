@@ -1,9 +1,121 @@
-import sqlite3
-from typing import Any, Dict, List, Optional, Tuple
-
-# Note: The 'sqlite3' module is part of Python's standard library and is imported here.
-# External drivers for MySQL and PostgreSQL are now imported conditionally within
-# their respective connect() methods to support the "dependency-on-demand" pattern.
+import copy
+import functools
+import hmac
+import importlib
+import logging
+import os
+import queue
+import re
+import threading
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# Note: All drivers, including the standard library's 'sqlite3', are imported
+# on the first connect() of their connection class ("dependency-on-demand") and
+# cached on that class, so importing this module does not load any database
+# extension until a connection is opened.
+
+# Default PRAGMAs applied to every SQLite connection: WAL journaling with
+# synchronous=NORMAL avoids an fsync per commit, and the larger page cache,
+# in-memory temp storage and memory-mapped I/O cut read overhead.
+# Override or disable individual entries through config['pragmas'] (None skips one);
+# config['pragmas'] = None skips them all.
+SQLITE_DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'cache_size': -64000,       # Negative means KiB: ~64 MB page cache
+    'mmap_size': 268435456,     # 256 MB
+}
+
+# Size of sqlite3's per-connection compiled-statement cache (the driver default is 128).
+# Statements are matched by SQL text, so repeated queries skip the parse/plan step.
+SQLITE_CACHED_STATEMENTS = 256
+
+# Configuration keys consumed by this module rather than by the database driver.
+# They are removed before a config dictionary is passed through to a driver.
+_CLIENT_OPTION_KEYS = frozenset({'pragmas', 'cached_statements', 'prepared', 'result_cache_size', 'row_factory', 'driver'})
+
+# Row shapes selectable through config['row_factory'] (rows are plain tuples by default).
+# 'row' is the driver's dual index/name row type (sqlite3.Row, psycopg2 DictRow).
+ROW_FACTORIES = ('tuple', 'row', 'dict', 'namedtuple')
+
+@functools.lru_cache(maxsize=64)
+def _row_class(fields: Tuple[str, ...]) -> type:
+    """Returns a namedtuple class for a result shape (one class per distinct column list)."""
+    return namedtuple('Row', fields, rename=True)
+
+def _sqlite_namedtuple_factory(cursor, row):
+    """sqlite3 row factory producing namedtuples (attribute access by column name)."""
+    return _row_class(tuple(col[0] for col in cursor.description))._make(row)
+
+def _copy_rows(rows: List[Any]) -> List[Any]:
+    """
+    Returns a new list of rows for a result-cache caller. Mutable rows (dicts, psycopg2
+    DictRow lists) are copied one by one so no caller can change another caller's rows.
+    """
+    if rows and isinstance(rows[0], (dict, list)):
+        return [copy.copy(row) for row in rows]
+    return list(rows)
+
+def _sqlite_dict_factory(cursor, row):
+    """sqlite3 row factory producing {column: value} dictionaries."""
+    return {col[0]: value for col, value in zip(cursor.description, row)}
+
+# ORDER BY terms accepted by fetch_advanced: column (optionally qualified) with an
+# optional direction, comma-separated (e.g., 'age DESC', 'T1.name ASC, id').
+_ORDER_BY_PATTERN = re.compile(
+    r'^\s*[A-Za-z_][\w.]*(\s+(ASC|DESC))?(\s*,\s*[A-Za-z_][\w.]*(\s+(ASC|DESC))?)*\s*$',
+    re.IGNORECASE
+)
+
+@functools.lru_cache(maxsize=128)
+def _format_order_by(order_by: str) -> str:
+    """Validates an ORDER BY specification and returns the clause (cached per spec)."""
+    if not _ORDER_BY_PATTERN.match(order_by):
+        raise ValueError(f"Invalid order_by specification: '{order_by}'. Use 'column [ASC|DESC], ...'.")
+    return f"ORDER BY {order_by.strip()}"
+
+@functools.lru_cache(maxsize=128)
+def _build_query(select_fields: str,
+                 table: str,
+                 join_clause: Optional[str],
+                 order_by: Optional[str],
+                 has_limit: bool,
+                 placeholder: str) -> Tuple[str, str]:
+    """
+    Assembles the fixed parts of a fetch_advanced query, cached per query shape.
+    Returns (head, tail); the optional WHERE clause goes between the two.
+    No trailing ';' is added, since the drivers execute single statements without it.
+    """
+    head = f"SELECT {select_fields} FROM {table}"
+    if join_clause:
+        head = f"{head} {join_clause}"
+
+    tail = ""
+    if order_by:
+        tail = f" {_format_order_by(order_by)}"
+    if has_limit:
+        # LIMIT is the standard SQL keyword used by SQLite, MySQL, and PostgreSQL for TOP/N.
+        tail = f"{tail} LIMIT {placeholder}"
+    return head, tail
+
+# Generic config keys mapped to the libpq keywords accepted by both psycopg2 and
+# psycopg 3 (e.g., dbname instead of database): (config key, driver key, default).
+_PG_KEYMAP = (
+    ('host', 'host', None),
+    ('database', 'dbname', None),
+    ('user', 'user', None),
+    ('password', 'password', None),
+    ('port', 'port', 5432),
+)
+
+# Per-process secret for the password digest in pool keys (see DatabaseManager.get_pooled),
+# so the pool registry never holds a password or an offline-guessable hash of one
+_POOL_KEY_SECRET = os.urandom(32)
 
 # --- 1. Custom Exception ---
 
@@ -23,62 +135,273 @@ class DBConnection:
 
     Defines the standard interface for connecting, executing queries,
     and closing the connection, ensuring consistency across different SQL backends.
+
+    Setting config['result_cache_size'] to a positive number enables an in-process
+    LRU cache of fetch_all()/fetch_advanced() results keyed by (query, params).
+    Any execute()/execute_many() call clears it. Only enable it when this
+    connection is the sole writer, since changes made elsewhere are not seen.
     """
+    # Bind-parameter marker used in generated SQL (sqlite3 uses qmark style)
+    PARAM_PLACEHOLDER = '?'
+    # DB-API driver module imported on the first connect() and cached afterwards
+    DRIVER_MODULE: Optional[str] = None
+    _drivers: Dict[str, Any] = {} # Imported driver modules by name (shared by all backends)
+
+    # Fixed instance layout: attribute access on the per-query path uses slot
+    # descriptors instead of an instance __dict__
+    __slots__ = ('config', 'connection', '_cursors', '_in_txn',
+                 'result_cache_size', '_result_cache',
+                 '_has_commit', '_has_rollback', '_has_close')
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize the connection configuration."""
         self.config = config
         self.connection: Optional[Any] = None
-        self.cursor: Optional[Any] = None
+        self._cursors = threading.local() # Per-thread (connection, cursor) pair
+        self._in_txn = False
+        self._has_commit = self._has_rollback = self._has_close = False
+        self.result_cache_size: int = config.get('result_cache_size', 0)
+        self._result_cache: OrderedDict = OrderedDict()
 
     def connect(self):
         """Establishes the database connection."""
         raise NotImplementedError("Subclasses must implement the 'connect' method.")
 
+    @classmethod
+    def _get_driver(cls, module_name: Optional[str] = None) -> Any:
+        """
+        Returns a driver module (DRIVER_MODULE unless module_name is given),
+        importing it only on first use. Raises ImportError if it is not installed.
+        """
+        module_name = module_name or cls.DRIVER_MODULE
+        driver = cls._drivers.get(module_name)
+        if driver is None:
+            driver = cls._drivers[module_name] = importlib.import_module(module_name)
+        return driver
+
+    def __enter__(self) -> 'DBConnection':
+        """Connects and returns the connection, for use as 'with ... as db:'."""
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Closes the connection when the 'with' block exits."""
+        self.close()
+
+    def clear_result_cache(self) -> None:
+        """Discards all cached query results."""
+        self._result_cache.clear()
+
+    def _probe_capabilities(self) -> None:
+        """Records once, right after connecting, which optional methods the driver connection provides."""
+        connection = self.connection
+        self._has_commit = hasattr(connection, 'commit')
+        self._has_rollback = hasattr(connection, 'rollback')
+        self._has_close = hasattr(connection, 'close')
+
+    def _new_cursor(self) -> Any:
+        """Creates a cursor on the open connection (subclasses add driver options)."""
+        return self.connection.cursor()
+
+    def _get_cursor(self) -> Optional[Any]:
+        """
+        Returns the calling thread's cursor, creating it on first use so
+        concurrent threads never share (and serialize on) one cursor object.
+        Returns None if the connection is not established.
+        """
+        connection = self.connection
+        if connection is None:
+            return None
+        entry = getattr(self._cursors, 'entry', None)
+        if entry is None or entry[0] is not connection:
+            # First use in this thread, or a cursor left over from a previous connection
+            entry = self._cursors.entry = (connection, self._new_cursor())
+        return entry[1]
+
+    @property
+    def cursor(self) -> Optional[Any]:
+        """The calling thread's cursor (None if the connection is not established)."""
+        return self._get_cursor()
+
+    def _row_factory_option(self) -> str:
+        """Returns the validated config['row_factory'] name ('tuple' if unset)."""
+        row_factory = self.config.get('row_factory') or 'tuple'
+        if row_factory not in ROW_FACTORIES:
+            raise ValueError(f"Invalid row_factory '{row_factory}'. Use one of: {', '.join(ROW_FACTORIES)}.")
+        return row_factory
+
+    def _driver_config(self) -> Dict[str, Any]:
+        """Returns the config without the options handled by this module."""
+        return {k: v for k, v in self.config.items() if k not in _CLIENT_OPTION_KEYS}
+
     def close(self):
         """Closes the database connection."""
-        if self.connection and hasattr(self.connection, 'close'):
-            print(f"Closing connection for {self.__class__.__name__}...")
+        if self.connection and self._has_close:
+            log.debug("Closing connection for %s...", type(self).__name__)
             # Safely close the connection object if it exists
             self.connection.close()
             self.connection = None
-            self.cursor = None
+            self._cursors = threading.local()
+            self._has_commit = self._has_rollback = self._has_close = False
+            self._result_cache.clear()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups several execute()/execute_many() calls into one transaction.
+
+        Per-call commits are suspended inside the block and a single COMMIT is
+        issued when it exits. If any statement fails, the error is raised out of
+        the block and the whole transaction is rolled back.
+        """
+        if not self.connection:
+            raise DBConnectionError(f"Connection not established for {self.__class__.__name__}.")
+        if self._in_txn:
+            # Nested use joins the outer transaction
+            yield self
+            return
+
+        self._in_txn = True
+        try:
+            yield self
+        except BaseException:
+            if self._has_rollback:
+                self.connection.rollback()
+            # Rows read inside the block may reflect writes that were just undone
+            self._result_cache.clear()
+            raise
+        else:
+            if self._has_commit:
+                self.connection.commit()
+        finally:
+            self._in_txn = False
 
     def execute(self, query: str, params: Optional[Tuple] = None, commit: bool = True) -> Optional[int]:
         """
         Executes a query and optionally commits the transaction.
+        Inside transaction() the commit is deferred to the end of the block.
 
         Returns the row count or None if the operation failed.
         """
-        if not self.cursor:
-            print(f"Error: Connection not established for {self.__class__.__name__}.")
+        cursor = self._get_cursor()
+        if cursor is None:
+            log.error("Connection not established for %s.", type(self).__name__)
             return None
 
+        if self._result_cache:
+            self._result_cache.clear()
+
         try:
             params = params or ()
-            self.cursor.execute(query, params)
-            if commit and self.connection and hasattr(self.connection, 'commit'):
+            cursor.execute(query, params)
+            if commit and self._has_commit and not self._in_txn:
                 self.connection.commit()
-            return self.cursor.rowcount
+            return cursor.rowcount
         except Exception as e:
-            print(f"Database Error during execution in {self.__class__.__name__}: {e}")
-            if self.connection and hasattr(self.connection, 'rollback'):
+            if self._in_txn:
+                raise
+            log.error("Database error during execution in %s: %s", type(self).__name__, e)
+            if self._has_rollback:
                 self.connection.rollback()
             return None
 
+    def execute_many(self, query: str, seq_of_params: Iterable[Tuple], commit: bool = True) -> Optional[int]:
+        """
+        Executes a query once per parameter tuple in a single driver call
+        (cursor.executemany) and commits once at the end (or at the end of the
+        enclosing transaction() block).
+
+        Returns the row count or None if the operation failed (the batch is rolled back).
+        """
+        cursor = self._get_cursor()
+        if cursor is None:
+            log.error("Connection not established for %s.", type(self).__name__)
+            return None
+
+        if self._result_cache:
+            self._result_cache.clear()
+
+        try:
+            cursor.executemany(query, list(seq_of_params))
+            if commit and self._has_commit and not self._in_txn:
+                self.connection.commit()
+            return cursor.rowcount
+        except Exception as e:
+            if self._in_txn:
+                raise
+            log.error("Database error during batch execution in %s: %s", type(self).__name__, e)
+            if self._has_rollback:
+                self.connection.rollback()
+            return None
+
+    def _execute_fetch(self, query: str, params: Tuple) -> List[Tuple]:
+        """Runs a query and returns all of its rows (backends may override with a single driver call)."""
+        cursor = self._get_cursor()
+        cursor.execute(query, params)
+        return cursor.fetchall()
+
     def fetch_all(self, query: str, params: Optional[Tuple] = None) -> List[Tuple]:
-        """Executes a query and returns all results."""
-        if not self.cursor:
-            print(f"Error: Connection not established for {self.__class__.__name__}.")
+        """
+        Executes a query and returns all results.
+        Served from the result cache when it is enabled and holds this (query, params).
+        """
+        if self.connection is None:
+            log.error("Connection not established for %s.", type(self).__name__)
             return []
 
+        params = params or ()
+        cache_key = None
+        if self.result_cache_size > 0:
+            cache_key = (query, params)
+            try:
+                rows = self._result_cache[cache_key]
+            except KeyError:
+                pass
+            except TypeError:
+                cache_key = None # Unhashable params (e.g., a list): bypass the cache
+            else:
+                self._result_cache.move_to_end(cache_key)
+                return _copy_rows(rows)
+
         try:
-            params = params or ()
-            self.cursor.execute(query, params)
-            return self.cursor.fetchall()
+            rows = self._execute_fetch(query, params)
         except Exception as e:
-            print(f"Database Error during fetch in {self.__class__.__name__}: {e}")
+            log.error("Database error during fetch in %s: %s", type(self).__name__, e)
             return []
 
+        if cache_key is not None:
+            self._result_cache[cache_key] = rows
+            if len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
+            return _copy_rows(rows)
+        return rows
+
+    def fetch_iter(self, query: str, params: Optional[Tuple] = None, chunk: int = 1000) -> Iterator[Tuple]:
+        """
+        Executes a query and yields its rows, fetching them from the driver
+        `chunk` rows at a time (cursor.fetchmany) instead of materializing the
+        whole result set. The iterator uses its own cursor. On SQLite other queries
+        can run on the connection while it is consumed; on MySQL the cursor is
+        unbuffered, so the connection is busy until the iterator is exhausted or
+        closed, and other queries need a second connection (e.g., from a pool).
+        """
+        if not self.connection:
+            log.error("Connection not established for %s.", type(self).__name__)
+            return
+
+        cursor = self._new_cursor()
+        try:
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(chunk)
+                if not rows:
+                    return
+                yield from rows
+        except Exception as e:
+            log.error("Database error during fetch in %s: %s", type(self).__name__, e)
+        finally:
+            cursor.close()
+
     def fetch_advanced(self,
                        select_fields: str,
                        table: str,
@@ -100,50 +423,84 @@ class DBConnection:
             join_clause: Optional JOIN clause (e.g., 'INNER JOIN orders ON users.id = orders.user_id').
             where_clause: Optional WHERE clause (e.g., 'age > 25 AND city = "London"').
             order_by: Optional ORDER BY clause (e.g., 'name ASC', 'price DESC').
-            limit: Optional integer to limit the number of rows (TOP N).
+                      Must be a list of columns with optional ASC/DESC.
+            limit: Optional integer to limit the number of rows (TOP N); None or a
+                   value <= 0 means no limit. Sent as a bind parameter, so queries
+                   that differ only in limit share one cached statement.
 
         Returns:
             A list of tuples containing the query results.
-        """
-        query_parts = [f"SELECT {select_fields} FROM {table}"]
 
-        if join_clause:
-            query_parts.append(join_clause)
+        Raises:
+            ValueError: If order_by is not a valid column/direction list or limit is not an integer.
+        """
+        if limit is not None and (type(limit) is bool or not isinstance(limit, int)):
+            raise ValueError(f"Invalid limit: {limit!r}. Must be an integer.")
+        has_limit = limit is not None and limit > 0
+        head, tail = _build_query(select_fields, table, join_clause, order_by,
+                                  has_limit, self.PARAM_PLACEHOLDER)
+        params: Tuple = (limit,) if has_limit else ()
 
         if where_clause:
-            query_parts.append(f"WHERE {where_clause}")
-
-        if order_by:
-            query_parts.append(f"ORDER BY {order_by}")
+            full_query = f"{head} WHERE {where_clause}{tail}"
+        else:
+            full_query = head + tail
 
-        if limit is not None and limit > 0:
-            # LIMIT is the standard SQL keyword used by SQLite, MySQL, and PostgreSQL for TOP/N.
-            query_parts.append(f"LIMIT {limit}")
-
-        full_query = " ".join(query_parts) + ";"
-
-        print(f"Executing advanced query: {full_query}")
+        log.debug("Executing advanced query: %s %s", full_query, params)
 
         # Re-use the existing fetch_all implementation
-        return self.fetch_all(full_query)
+        return self.fetch_all(full_query, params)
 
 # --- 3. Concrete Implementation: SQLite (Natively Supported) ---
 
 class SQLiteConnection(DBConnection):
     """
     Handles SQLite database connections using the built-in 'sqlite3' module.
+
+    SQLITE_DEFAULT_PRAGMAS are applied on connect; the optional config['pragmas']
+    dictionary overrides them (e.g., {'journal_mode': 'DELETE', 'mmap_size': None}),
+    and config['pragmas'] = None applies none of them.
+    config['cached_statements'] sets the statement cache size (default SQLITE_CACHED_STATEMENTS).
+    config['row_factory'] selects the row shape: 'tuple' (default), 'row' (sqlite3.Row),
+    'dict' or 'namedtuple'.
     """
+    DRIVER_MODULE = 'sqlite3'
+    __slots__ = ()
+
+    def _execute_fetch(self, query: str, params: Tuple) -> List[Tuple]:
+        """Runs a query through Connection.execute(), which returns a fresh cursor, and fetches all rows."""
+        return self.connection.execute(query, params).fetchall()
+
     def connect(self):
         """Establishes connection to the SQLite database file."""
         db_path = self.config.get('database')
         if not db_path:
             raise ValueError("SQLite configuration must include 'database' path.")
 
+        sqlite3 = self._get_driver()
+
+        overrides = self.config.get('pragmas', {})
+        # pragmas=None opts out of every default PRAGMA
+        pragmas = {} if overrides is None else {**SQLITE_DEFAULT_PRAGMAS, **overrides}
+        row_factory = {
+            'tuple': None,
+            'row': sqlite3.Row,
+            'dict': _sqlite_dict_factory,
+            'namedtuple': _sqlite_namedtuple_factory,
+        }[self._row_factory_option()]
+
         try:
-            # Set connection and cursor
-            self.connection = sqlite3.connect(db_path)
-            self.cursor = self.connection.cursor()
-            print(f"Successfully connected to SQLite database: '{db_path}'")
+            # Set connection (cursors are created per thread on first use)
+            self.connection = sqlite3.connect(
+                db_path,
+                cached_statements=self.config.get('cached_statements', SQLITE_CACHED_STATEMENTS)
+            )
+            self._probe_capabilities()
+            self.connection.row_factory = row_factory
+            self.connection.executescript("".join(
+                f"PRAGMA {name}={value};" for name, value in pragmas.items() if value is not None
+            ))
+            log.info("Successfully connected to SQLite database: '%s'", db_path)
         except sqlite3.Error as e:
             raise DBConnectionError(f"SQLite connection failed: {e}") from e
 
@@ -153,17 +510,40 @@ class MySQLConnection(DBConnection):
     """
     Handles MySQL database connections. Requires 'mysql-connector-python' or 'PyMySQL'.
     The import is handled within this method.
+
+    With config['prepared'] = True the cursor uses server-side prepared statements,
+    so repeated queries are parsed and planned by the server only once.
+    config['row_factory'] may be 'tuple' (default), 'dict' or 'namedtuple'.
     """
+    PARAM_PLACEHOLDER = '%s'
+    DRIVER_MODULE = 'mysql.connector'
+    __slots__ = ('_cursor_options',)
+
+    def _new_cursor(self) -> Any:
+        """Creates a cursor with the prepared/row-shape options from the config."""
+        return self.connection.cursor(**self._cursor_options)
+
     def connect(self):
         """Attempts to establish the MySQL database connection."""
+        row_factory = self._row_factory_option()
+        if row_factory == 'row':
+            raise ValueError("row_factory 'row' is not supported for MySQL; use 'dict' or 'namedtuple'.")
+        self._cursor_options = {}
+        if self.config.get('prepared'):
+            self._cursor_options['prepared'] = True
+        if row_factory == 'dict':
+            self._cursor_options['dictionary'] = True
+        elif row_factory == 'namedtuple':
+            self._cursor_options['named_tuple'] = True
+
         try:
-            # Conditional Import
-            import mysql.connector as db_driver
+            # Conditional Import (cached on the class after the first connect)
+            db_driver = self._get_driver()
 
-            # The full config dictionary is passed to the driver
-            self.connection = db_driver.connect(**self.config)
-            self.cursor = self.connection.cursor()
-            print("Successfully connected to MySQL database.")
+            # The config dictionary (minus module-level options) is passed to the driver
+            self.connection = db_driver.connect(**self._driver_config())
+            self._probe_capabilities()
+            log.info("Successfully connected to MySQL database.")
 
         except ImportError as e:
             raise DBConnectionError(
@@ -177,38 +557,175 @@ class MySQLConnection(DBConnection):
 
 class PostgreSQLConnection(DBConnection):
     """
-    Handles PostgreSQL database connections. Requires 'psycopg2' (or similar driver).
+    Handles PostgreSQL database connections. Requires 'psycopg2' or 'psycopg' (v3).
     The import is handled within this method.
+
+    config['driver'] selects the binding: 'psycopg2' (default) or 'psycopg'
+    (psycopg 3, generally faster). Both use the same '%s' parameter style.
+
+    config['row_factory'] may be 'tuple' (default), 'dict' or 'namedtuple';
+    'row' (DictCursor rows) is only available with psycopg2.
     """
+    PARAM_PLACEHOLDER = '%s'
+    DRIVER_MODULE = 'psycopg2'
+    DRIVERS = ('psycopg2', 'psycopg')
+    __slots__ = ('_cursor_factory', '_pg_config')
+
+    def __init__(self, config: Dict[str, Any]):
+        """Initialize the connection configuration and translate it to driver keywords once."""
+        super().__init__(config)
+        self._pg_config = {pg_key: config.get(key, default) for key, pg_key, default in _PG_KEYMAP}
+
+    def _new_cursor(self) -> Any:
+        """Creates a cursor using the cursor factory selected by config['row_factory']."""
+        if self._cursor_factory is None:
+            return self.connection.cursor()
+        return self.connection.cursor(cursor_factory=self._cursor_factory)
+
     def connect(self):
         """Attempts to establish the PostgreSQL database connection."""
+        row_factory = self._row_factory_option()
+        driver_name = self.config.get('driver') or self.DRIVER_MODULE
+        if driver_name not in self.DRIVERS:
+            raise ValueError(f"Invalid PostgreSQL driver '{driver_name}'. Use one of: {', '.join(self.DRIVERS)}.")
+        if driver_name == 'psycopg' and row_factory == 'row':
+            raise ValueError("row_factory 'row' requires the psycopg2 driver; use 'dict' or 'namedtuple'.")
+
         try:
-            # Conditional Import
-            import psycopg2 as db_driver
-
-            # The full config dictionary is passed to the driver
-            # psycopg2 uses different keyword arguments (e.g., dbname instead of database)
-            # We map generic keys to psycopg2 keys for demonstration purposes.
-            pg_config = {
-                'host': self.config.get('host'),
-                'database': self.config.get('database'),
-                'user': self.config.get('user'),
-                'password': self.config.get('password'),
-                'port': self.config.get('port', 5432)
-            }
+            # Conditional Import (cached after the first connect)
+            db_driver = self._get_driver(driver_name)
+
+            pg_config = self._pg_config
+
+            self._cursor_factory = None
+            if driver_name == 'psycopg':
+                # psycopg 3 sets the row shape on the connection
+                if row_factory != 'tuple':
+                    rows = self._get_driver('psycopg.rows')
+                    pg_config = dict(pg_config)
+                    pg_config['row_factory'] = {
+                        'dict': rows.dict_row,
+                        'namedtuple': rows.namedtuple_row,
+                    }[row_factory]
+            elif row_factory != 'tuple':
+                extras = self._get_driver('psycopg2.extras')
+                self._cursor_factory = {
+                    'row': extras.DictCursor,
+                    'dict': extras.RealDictCursor,
+                    'namedtuple': extras.NamedTupleCursor,
+                }[row_factory]
+
             self.connection = db_driver.connect(**pg_config)
-            self.cursor = self.connection.cursor()
-            print("Successfully connected to PostgreSQL database.")
+            self._probe_capabilities()
+            log.info("Successfully connected to PostgreSQL database (%s).", driver_name)
 
         except ImportError as e:
+            package = 'psycopg[binary]' if driver_name == 'psycopg' else 'psycopg2-binary'
             raise DBConnectionError(
                 "PostgreSQL driver not found. Please install the necessary library "
-                "(e.g., 'pip install psycopg2-binary')."
+                f"(e.g., 'pip install {package}')."
             ) from e
         except Exception as e:
             raise DBConnectionError(f"PostgreSQL connection failed with configuration error: {e}") from e
 
-# --- 6. Database Manager/Factory ---
+# --- 6. Connection Pool ---
+
+class ConnectionPool:
+    """
+    A thread-safe pool of connected DBConnection instances for one database
+    configuration. Reusing open connections avoids the connect/authenticate
+    round trip on every request, which dominates short queries on MySQL/PostgreSQL.
+
+    Note: sqlite3 connections may only be used in the thread that opened them
+    unless the driver's check_same_thread option is disabled.
+    """
+    def __init__(self, connection_class: type, config: Dict[str, Any], min_size: int = 1, max_size: int = 10):
+        """Opens min_size connections up front; at most max_size are ever open."""
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1.")
+        self.connection_class = connection_class
+        self.config = config
+        self.min_size = min_size
+        self.max_size = max_size
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._size = 0 # Connections currently open (idle + in use)
+
+        for _ in range(min_size):
+            self._size += 1
+            self._idle.put(self._open())
+
+    def _open(self) -> DBConnection:
+        """Internal helper to create and connect a new pooled connection."""
+        conn = self.connection_class(self.config)
+        conn.connect()
+        return conn
+
+    def get(self, timeout: Optional[float] = None) -> DBConnection:
+        """
+        Takes a connection from the pool, opening a new one while below max_size.
+        Waits up to timeout seconds (forever if None) when the pool is exhausted.
+        Every connection obtained this way must be returned with put().
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_open = self._size < self.max_size
+            if can_open:
+                self._size += 1
+        if can_open:
+            try:
+                return self._open()
+            except BaseException:
+                with self._lock:
+                    self._size -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise DBConnectionError(f"No connection available in the pool within {timeout} seconds.") from None
+
+    def put(self, conn: DBConnection) -> None:
+        """Returns a connection to the pool (closed connections are discarded)."""
+        if conn.connection is None:
+            with self._lock:
+                self._size -= 1
+            return
+        self._idle.put(conn)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Context manager yielding a pooled connection and returning it on exit.
+        Uncommitted work is rolled back if the block raises.
+        """
+        conn = self.get(timeout)
+        try:
+            yield conn
+        except BaseException:
+            if conn.connection is not None and conn._has_rollback:
+                conn.connection.rollback()
+            conn.clear_result_cache()
+            raise
+        finally:
+            self.put(conn)
+
+    def close_all(self) -> None:
+        """Closes every idle connection. Connections in use are closed when returned."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._size -= 1
+
+# --- 7. Database Manager/Factory ---
 
 class DatabaseManager:
     """
@@ -221,6 +738,63 @@ class DatabaseManager:
         'postgres': PostgreSQLConnection
     }
 
+    _pools: Dict[Tuple, ConnectionPool] = {}
+    _pools_lock = threading.Lock()
+
+    @staticmethod
+    def get_pooled(db_type: str,
+                   config: Dict[str, Any],
+                   min_size: int = 1,
+                   max_size: int = 10) -> ConnectionPool:
+        """
+        Returns the shared ConnectionPool for this database type and configuration,
+        creating it (and opening min_size connections) on first use.
+
+        Pools are keyed by the database type and every config item, so connections
+        with different options (row_factory, pragmas, ...) never share a pool. The
+        password enters the key only as a keyed digest. Asking for an existing pool
+        with different min_size/max_size raises ValueError.
+
+        Usage:
+            pool = DatabaseManager.get_pooled('postgres', PG_CONFIG)
+            with pool.acquire() as db:
+                rows = db.fetch_all("SELECT ...")
+        """
+        db_type_lower = db_type.lower()
+        ConnectionClass = DatabaseManager.DB_TYPES.get(db_type_lower)
+
+        if not ConnectionClass:
+            raise DBNotSupportedError(f"Database type '{db_type}' is not supported by this manager.")
+
+        # Config values may be unhashable (e.g., the 'pragmas' dict), so key on their repr
+        password = config.get('password')
+        pool_key = (
+            db_type_lower,
+            tuple(sorted((k, repr(v)) for k, v in config.items() if k != 'password')),
+            None if password is None
+            else hmac.digest(_POOL_KEY_SECRET, str(password).encode('utf-8'), 'sha256'),
+        )
+        with DatabaseManager._pools_lock:
+            pool = DatabaseManager._pools.get(pool_key)
+            if pool is None:
+                pool = ConnectionPool(ConnectionClass, config, min_size, max_size)
+                DatabaseManager._pools[pool_key] = pool
+            elif (pool.min_size, pool.max_size) != (min_size, max_size):
+                raise ValueError(
+                    f"A pool for this database already exists with min_size={pool.min_size}, "
+                    f"max_size={pool.max_size}; requested min_size={min_size}, max_size={max_size}."
+                )
+        return pool
+
+    @staticmethod
+    def close_pools() -> None:
+        """Closes the idle connections of every pool and forgets the pools."""
+        with DatabaseManager._pools_lock:
+            pools = list(DatabaseManager._pools.values())
+            DatabaseManager._pools.clear()
+        for pool in pools:
+            pool.close_all()
+
     @staticmethod
     def get_connection(db_type: str, config: Dict[str, Any]) -> DBConnection:
         """
@@ -234,9 +808,14 @@ class DatabaseManager:
 
         return ConnectionClass(config)
 
-# --- 7. Example Usage ---
+# --- 8. Example Usage ---
 
 if __name__ == '__main__':
+    import sqlite3
+
+    # Show the module's connection/query messages on the console
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     # ----------------------------------------------------
     # A. SQLite Example (Fully Functional)
     # ----------------------------------------------------
@@ -246,88 +825,81 @@ if __name__ == '__main__':
     print("=" * 60)
 
     SQLITE_CONFIG = {'database': 'test_data.db'}
-    db_sqlite = None
 
     try:
-        # 1. Get Connection
-        db_sqlite = DatabaseManager.get_connection('sqlite', SQLITE_CONFIG)
-
-        # 2. Connect
-        db_sqlite.connect()
-
-        # 3. Execute: Create Table (and a second one for joins)
-        create_users_table_query = """
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            age INTEGER
-        );
-        """
-        db_sqlite.execute(create_users_table_query)
-
-        create_orders_table_query = """
-        CREATE TABLE IF NOT EXISTS orders (
-            order_id INTEGER PRIMARY KEY,
-            user_id INTEGER,
-            amount REAL
-        );
-        """
-        db_sqlite.execute(create_orders_table_query)
-        print("Tables 'users' and 'orders' created (if they didn't exist).")
-
-        # 4. Execute: Insert Data
-        insert_user_query = "INSERT INTO users (id, name, age) VALUES (?, ?, ?);"
-        db_sqlite.execute(insert_user_query, (1, "Alice", 30))
-        db_sqlite.execute(insert_user_query, (2, "Bob", 25))
-        db_sqlite.execute(insert_user_query, (3, "Charlie", 40))
-        db_sqlite.execute(insert_user_query, (4, "Zoe", 20))
-
-        insert_order_query = "INSERT INTO orders (user_id, amount) VALUES (?, ?);"
-        db_sqlite.execute(insert_order_query, (1, 99.99))
-        db_sqlite.execute(insert_order_query, (3, 45.00))
-        db_sqlite.execute(insert_order_query, (1, 20.50))
-        print("Data inserted.")
-
-        # 5. Fetch Advanced Data (TOP 2, sorted descending by age)
-        print("\n--- Advanced Query Demo: TOP 2, Descending Sort (age) ---")
-        advanced_results_limit = db_sqlite.fetch_advanced(
-            select_fields="name, age",
-            table="users",
-            order_by="age DESC", # Decending sort
-            limit=2 # Top 2
-        )
-        print(f"Fetched Top 2 users (Count: {len(advanced_results_limit)}):")
-        for row in advanced_results_limit:
-            print(f"  Name: {row[0]}, Age: {row[1]}")
-
-        # 6. Fetch Advanced Data (All, ascending name)
-        print("\n--- Advanced Query Demo: Ascending Sort (name) ---")
-        advanced_results_asc = db_sqlite.fetch_advanced(
-            select_fields="name",
-            table="users",
-            order_by="name ASC" # Ascending sort
-        )
-        print(f"Fetched all users sorted by name (Count: {len(advanced_results_asc)}):")
-        for row in advanced_results_asc:
-            print(f"  Name: {row[0]}")
-
-        # 7. Fetch Advanced Data (JOIN Example)
-        print("\n--- Advanced Query Demo: JOIN and WHERE ---")
-        advanced_results_join = db_sqlite.fetch_advanced(
-            select_fields="T1.name, T2.amount",
-            table="users T1",
-            join_clause="INNER JOIN orders T2 ON T1.id = T2.user_id",
-            where_clause="T2.amount > 40"
-        )
-        print(f"Fetched users with orders > 40 (Count: {len(advanced_results_join)}):")
-        for row in advanced_results_join:
-            print(f"  User: {row[0]}, Order Amount: {row[1]}")
+        # 1. Get Connection and 2. Connect (closed automatically when the block exits)
+        with DatabaseManager.get_connection('sqlite', SQLITE_CONFIG) as db_sqlite:
+            # 3. Execute: Create Table (and a second one for joins)
+            create_users_table_query = """
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                age INTEGER
+            );
+            """
+            db_sqlite.execute(create_users_table_query)
+
+            create_orders_table_query = """
+            CREATE TABLE IF NOT EXISTS orders (
+                order_id INTEGER PRIMARY KEY,
+                user_id INTEGER,
+                amount REAL
+            );
+            """
+            db_sqlite.execute(create_orders_table_query)
+            print("Tables 'users' and 'orders' created (if they didn't exist).")
+
+            # 4. Execute: Insert Data
+            # Both batches share one transaction, so there is a single commit.
+            insert_user_query = "INSERT INTO users (id, name, age) VALUES (?, ?, ?);"
+            user_rows = [(1, "Alice", 30), (2, "Bob", 25), (3, "Charlie", 40), (4, "Zoe", 20)]
+
+            insert_order_query = "INSERT INTO orders (user_id, amount) VALUES (?, ?);"
+            order_rows = [(1, 99.99), (3, 45.00), (1, 20.50)]
+
+            try:
+                with db_sqlite.transaction():
+                    db_sqlite.execute_many(insert_user_query, user_rows)
+                    db_sqlite.execute_many(insert_order_query, order_rows)
+                print("Data inserted.")
+            except sqlite3.Error as e:
+                # Expected on re-runs: the user ids already exist
+                print(f"Insert transaction rolled back: {e}")
+
+            # 5. Fetch Advanced Data (TOP 2, sorted descending by age)
+            print("\n--- Advanced Query Demo: TOP 2, Descending Sort (age) ---")
+            advanced_results_limit = db_sqlite.fetch_advanced(
+                select_fields="name, age",
+                table="users",
+                order_by="age DESC", # Decending sort
+                limit=2 # Top 2
+            )
+            print(f"Fetched Top 2 users (Count: {len(advanced_results_limit)}):")
+            print("\n".join(f"  Name: {row[0]}, Age: {row[1]}" for row in advanced_results_limit))
+
+            # 6. Fetch Advanced Data (All, ascending name)
+            print("\n--- Advanced Query Demo: Ascending Sort (name) ---")
+            advanced_results_asc = db_sqlite.fetch_advanced(
+                select_fields="name",
+                table="users",
+                order_by="name ASC" # Ascending sort
+            )
+            print(f"Fetched all users sorted by name (Count: {len(advanced_results_asc)}):")
+            print("\n".join(f"  Name: {row[0]}" for row in advanced_results_asc))
+
+            # 7. Fetch Advanced Data (JOIN Example)
+            print("\n--- Advanced Query Demo: JOIN and WHERE ---")
+            advanced_results_join = db_sqlite.fetch_advanced(
+                select_fields="T1.name, T2.amount",
+                table="users T1",
+                join_clause="INNER JOIN orders T2 ON T1.id = T2.user_id",
+                where_clause="T2.amount > 40"
+            )
+            print(f"Fetched users with orders > 40 (Count: {len(advanced_results_join)}):")
+            print("\n".join(f"  User: {row[0]}, Order Amount: {row[1]}" for row in advanced_results_join))
 
     except (DBNotSupportedError, DBConnectionError, ValueError) as e:
         print(f"An error occurred in SQLite demo: {e}")
-    finally:
-        if db_sqlite:
-            db_sqlite.close()
 
 
     # ----------------------------------------------------
@@ -345,17 +917,16 @@ if __name__ == '__main__':
         'password': 'mysecretpassword',
         'database': 'app_db'
     }
-    db_mysql = None
     try:
-        db_mysql = DatabaseManager.get_connection('mysql', MYSQL_CONFIG)
-        db_mysql.connect()
-        # Example of using the new advanced method on MySQL (if driver is installed)
-        # db_mysql.fetch_advanced(
-        #     select_fields="item_name, price",
-        #     table="products",
-        #     order_by="price DESC",
-        #     limit=10
-        # )
+        with DatabaseManager.get_connection('mysql', MYSQL_CONFIG) as db_mysql:
+            # Example of using the new advanced method on MySQL (if driver is installed)
+            # db_mysql.fetch_advanced(
+            #     select_fields="item_name, price",
+            #     table="products",
+            #     order_by="price DESC",
+            #     limit=10
+            # )
+            pass
 
     except DBConnectionError as e:
         # This is the expected path if the external library isn't installed
@@ -363,8 +934,4 @@ if __name__ == '__main__':
         print(f"Connection failed gracefully: {e}")
         print("--- GRACEFUL FAILURE ---\n")
     except DBNotSupportedError as e:
-        print(f"An error occurred in MySQL demo: {e}")
-    finally:
-        if db_mysql:
-            # Attempting to close will gracefully fail if connection wasn't established
-            db_mysql.close()
\ No newline at end of file
+        print(f"An error occurred in MySQL demo: {e}")
\ No newline at end of file
@@ -1,6 +1,140 @@
 import datetime
+import functools
+import logging
+import operator
 import re
-from typing import Optional, Union, Tuple
+import time
+import warnings
+from typing import Any, Iterable, Optional, Union, Tuple
+
+log = logging.getLogger(__name__)
+
+# Optional dependency: NumPy powers the vectorized *_many / parse_array helpers.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional dependency: ciso8601 is a faster ISO 8601 parser; the standard
+# library's fromisoformat (also a C parser, no format string) is the fallback.
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.datetime.fromisoformat
+
+# Fast-path patterns for the formats _parse_datetime supports; a match is turned
+# into a datetime directly, without running strptime's format interpreter.
+# 'YYYY-MM-DD', 'YYYY-MM-DD HH:MM', 'YYYY-MM-DD HH:MM:SS[.ffffff]' (space or 'T' separator)
+_DT_RE = re.compile(
+    r'(\d{4})-(\d{1,2})-(\d{1,2})(?:[ T](\d{1,2}):(\d{1,2})(?::(\d{1,2})(?:\.(\d{1,6}))?)?)?'
+)
+# 'MM/DD/YYYY' and 'MM/DD/YYYY HH:MM:SS AM|PM'
+_US_DT_RE = re.compile(
+    r'(\d{1,2})/(\d{1,2})/(\d{4})(?: (\d{1,2}):(\d{1,2}):(\d{1,2}) ([AaPp][Mm]))?'
+)
+# strftime patterns: format_datetime's default and get_day_name's full weekday name
+_DEFAULT_FORMAT = '%Y-%m-%d %H:%M:%S %Z'
+_DAY_NAME_FORMAT = '%A'
+
+# Units shown by simplify_time_duration above seconds: (name, seconds per unit)
+_DURATION_UNITS = (("day", 86400), ("hour", 3600), ("minute", 60))
+# convert_time_units lookup table: (from, to) -> (operation, integer factor).
+# Converting to a smaller unit multiplies, to a larger unit divides, so every
+# conversion is a single exact-factor operation.
+_TIME_UNIT_SECONDS = {'seconds': 1, 'minutes': 60, 'hours': 3600, 'days': 86400}
+_TIME_UNIT_CONVERSIONS = {
+    (from_unit, to_unit): (operator.mul, float(from_seconds // to_seconds)) if from_seconds >= to_seconds
+                          else (operator.truediv, float(to_seconds // from_seconds))
+    for from_unit, from_seconds in _TIME_UNIT_SECONDS.items()
+    for to_unit, to_seconds in _TIME_UNIT_SECONDS.items()
+}
+
+@functools.lru_cache(maxsize=None)
+def _duration_kernel() -> Optional[Any]:
+    """Returns the Numba-compiled decompose kernel, or None if numba is not installed."""
+    try:
+        from ._durationKernel import decompose
+    except ImportError:
+        return None
+    return decompose
+
+# UTC offsets such as '+05:30', '-0800' or '+5:30'
+_OFFSET_RE = re.compile(r'([+\-])(\d{1,2}):?(\d{2})$')
+
+@functools.lru_cache(maxsize=128)
+def _parse_offset_cached(offset_str: str) -> Optional[datetime.timezone]:
+    """Parses a stripped offset string into a timezone (cached, since timezones are immutable)."""
+    match = _OFFSET_RE.match(offset_str)
+    if not match:
+        return None
+
+    sign, hours, minutes = match.groups()
+    offset = datetime.timedelta(hours=int(hours), minutes=int(minutes))
+
+    if sign == '-':
+        offset = -offset
+
+    return datetime.timezone(offset)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime_cached(dt_str: str) -> Optional[datetime.datetime]:
+    """
+    Parses a datetime string in one of the supported formats, or returns None.
+    Cached per input string: repeated values (e.g., a batch timestamp column) are
+    parsed once, and sharing the result is safe since datetime objects are immutable.
+    """
+    # Fast path: build the datetime straight from the regex groups
+    match = _DT_RE.fullmatch(dt_str)
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        try:
+            return datetime.datetime(
+                int(year), int(month), int(day),
+                int(hour or 0), int(minute or 0), int(second or 0),
+                int(fraction.ljust(6, '0')) if fraction else 0
+            )
+        except ValueError:
+            return None
+
+    match = _US_DT_RE.fullmatch(dt_str)
+    if match:
+        month, day, year, hour, minute, second, meridiem = match.groups()
+        hour = int(hour or 12)
+        if not 1 <= hour <= 12:
+            return None
+        # 12 AM is midnight, 12 PM is noon
+        hour %= 12
+        if meridiem and meridiem.upper() == 'PM':
+            hour += 12
+        try:
+            return datetime.datetime(int(year), int(month), int(day),
+                                     hour, int(minute or 0), int(second or 0))
+        except ValueError:
+            return None
+
+    # ISO 8601 with 'Z' or an offset (+HH:MM), via a dedicated C parser
+    try:
+        if dt_str.endswith('Z'):
+            return _parse_iso(dt_str[:-1] + '+00:00')
+        return _parse_iso(dt_str)
+    except ValueError:
+        pass
+
+    # Last resort for inputs the patterns don't cover (e.g., extra whitespace)
+    formats = [
+        '%Y-%m-%d %H:%M:%S',
+        '%Y-%m-%d %H:%M',
+        '%Y-%m-%d',
+        '%m/%d/%Y %I:%M:%S %p',
+        '%m/%d/%Y'
+    ]
+    for fmt in formats:
+        try:
+            return datetime.datetime.strptime(dt_str, fmt)
+        except ValueError:
+            continue
+
+    return None
 
 class DateTimeManager:
     """
@@ -11,35 +145,52 @@ class DateTimeManager:
     
     Timezone operations are based on fixed UTC offsets rather than named timezones.
     """
+    __slots__ = ('default_tz', 'strict')
     
     # --- STATIC DATA: US TIME ZONES (Fixed UTC Offsets) ---
     # NOTE: These offsets are FIXED and do NOT automatically adjust for Daylight Saving Time (DST).
     # Both Standard Time (ST) and Daylight Time (DT) offsets are provided for convenience.
-    US_TIME_OFFSETS = {
+    _US_OFFSET_MINUTES = {
         # Pacific Time
-        "PST": "-08:00",  # Pacific Standard Time
-        "PDT": "-07:00",  # Pacific Daylight Time
+        "PST": -8 * 60,  # Pacific Standard Time
+        "PDT": -7 * 60,  # Pacific Daylight Time
         # Mountain Time
-        "MST": "-07:00",  # Mountain Standard Time (also used for AZ year-round)
-        "MDT": "-06:00",  # Mountain Daylight Time
+        "MST": -7 * 60,  # Mountain Standard Time (also used for AZ year-round)
+        "MDT": -6 * 60,  # Mountain Daylight Time
         # Central Time
-        "CST": "-06:00",  # Central Standard Time
-        "CDT": "-05:00",  # Central Daylight Time
+        "CST": -6 * 60,  # Central Standard Time
+        "CDT": -5 * 60,  # Central Daylight Time
         # Eastern Time
-        "EST": "-05:00",  # Eastern Standard Time
-        "EDT": "-04:00",  # Eastern Daylight Time
+        "EST": -5 * 60,  # Eastern Standard Time
+        "EDT": -4 * 60,  # Eastern Daylight Time
         # Alaska Time
-        "AKST": "-09:00", # Alaska Standard Time
-        "AKDT": "-08:00", # Alaska Daylight Time
+        "AKST": -9 * 60, # Alaska Standard Time
+        "AKDT": -8 * 60, # Alaska Daylight Time
         # Hawaii Time
-        "HST": "-10:00", # Hawaii Standard Time (No DST)
+        "HST": -10 * 60, # Hawaii Standard Time (No DST)
+    }
+    # Ready-to-use tzinfo objects, built once; each carries its abbreviation as the %Z name.
+    US_TIME_OFFSETS = {
+        name: datetime.timezone(datetime.timedelta(minutes=minutes), name)
+        for name, minutes in _US_OFFSET_MINUTES.items()
     }
 
-    def __init__(self):
+    def __init__(self, strict: bool = False):
         """
         Initializes the DateTimeManager. The default timezone is set to UTC.
+
+        :param strict: If True, methods that return None on bad input (add_time,
+                       to_iso_string, to_timestamp, get_day_name) raise ValueError
+                       instead of logging a warning.
         """
         self.default_tz = datetime.timezone.utc
+        self.strict = strict
+
+    def _fail(self, message: str, *args: Any) -> None:
+        """Reports bad input: raises ValueError in strict mode, otherwise logs a warning (lazily formatted)."""
+        if self.strict:
+            raise ValueError(message % args)
+        log.warning(message, *args)
 
     @staticmethod
     def _parse_datetime(dt_str: Union[str, datetime.datetime]) -> Optional[datetime.datetime]:
@@ -49,51 +200,38 @@ class DateTimeManager:
         """
         if isinstance(dt_str, datetime.datetime):
             return dt_str
-
-        # Common formats to try
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M',
-            '%Y-%m-%d',
-            '%m/%d/%Y %I:%M:%S %p',
-            '%m/%d/%Y'
-        ]
-        for fmt in formats:
-            try:
-                # Handle cases where microsecond precision is in the string but not format
-                if len(dt_str) > len(fmt) and '.' in dt_str:
-                    return datetime.datetime.strptime(dt_str.split('.')[0], fmt)
-                return datetime.datetime.strptime(dt_str, fmt)
-            except ValueError:
-                continue
-        
-        # Fallback for ISO format with Z or standard offset (+HH:MM)
-        try:
-            return datetime.datetime.fromisoformat(dt_str)
-        except ValueError:
-            pass
-
-        return None
+        return _parse_datetime_cached(dt_str)
     
     @staticmethod
     def _parse_offset_str(offset_str: str) -> Optional[datetime.timezone]:
         """
         Converts a UTC offset string (e.g., '+05:30', '-08:00') into a datetime.timezone object.
         """
-        match = re.match(r'([+\-])(\d{1,2}):?(\d{2})$', offset_str.strip())
-        if not match:
-            return None
-
-        sign, hours, minutes = match.groups()
-        offset = datetime.timedelta(hours=int(hours), minutes=int(minutes))
-        
-        if sign == '-':
-            offset = -offset
-            
-        return datetime.timezone(offset)
+        return _parse_offset_cached(offset_str.strip())
 
     def _ensure_aware(self, dt: datetime.datetime) -> datetime.datetime:
         """Helper to ensure a datetime object is timezone aware (defaulting to UTC if naive)."""
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=self.default_tz)
+        return dt
+
+    def _parse_and_ensure(self, dt_obj: Union[str, datetime.datetime]) -> Optional[datetime.datetime]:
+        """
+        Combined _parse_datetime + _ensure_aware: returns dt_obj as a timezone-aware
+        datetime (default timezone if naive), or None if it cannot be parsed.
+        """
+        if type(dt_obj) is datetime.datetime:
+            dt = dt_obj
+        else:
+            dt = self._parse_datetime(dt_obj)
+            if dt is None:
+                return None
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=self.default_tz)
+        return dt
+
+    def _ensure_aware_strict(self, dt: datetime.datetime) -> datetime.datetime:
+        """Like _ensure_aware, but also replaces a tzinfo whose utcoffset() returns None."""
         if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
             return dt.replace(tzinfo=self.default_tz)
         return dt
@@ -103,20 +241,22 @@ class DateTimeManager:
     def format_datetime(
         self,
         dt_obj: Union[str, datetime.datetime, None] = None,
-        format_spec: str = '%Y-%m-%d %H:%M:%S %Z'
+        format_spec: str = _DEFAULT_FORMAT
     ) -> str:
         """
         Formats a datetime object or string into a specified string format.
         If no object is provided, formats the current UTC time.
         """
+        # Fast path: an aware datetime needs no parsing or timezone defaulting
+        if type(dt_obj) is datetime.datetime and dt_obj.tzinfo is not None:
+            return dt_obj.strftime(format_spec)
+
         if dt_obj is None:
             dt = datetime.datetime.now(self.default_tz)
         else:
-            dt = self._parse_datetime(dt_obj)
+            dt = self._parse_and_ensure(dt_obj)
             if dt is None:
                 return f"Error: Could not parse datetime object/string: {dt_obj}"
-            
-            dt = self._ensure_aware(dt)
 
         return dt.strftime(format_spec)
 
@@ -129,28 +269,21 @@ class DateTimeManager:
         """
         Calculates the time difference between two datetime objects/strings.
         """
-        parsed_dt1 = self._parse_datetime(dt1)
-        parsed_dt2 = self._parse_datetime(dt2)
+        parsed_dt1 = self._parse_and_ensure(dt1)
+        parsed_dt2 = self._parse_and_ensure(dt2)
 
         if parsed_dt1 is None or parsed_dt2 is None:
             return "Error: Could not parse one or both datetime inputs."
 
-        parsed_dt1 = self._ensure_aware(parsed_dt1)
-        parsed_dt2 = self._ensure_aware(parsed_dt2)
-
-        difference = abs(parsed_dt1 - parsed_dt2)
-
-        if unit == 'seconds':
-            return difference.total_seconds()
-        elif unit == 'minutes':
-            return difference.total_seconds() / 60
-        elif unit == 'hours':
-            return difference.total_seconds() / 3600
-        elif unit == 'days':
-            return difference.total_seconds() / 86400
-        else:
+        try:
+            unit_seconds = _TIME_UNIT_SECONDS[unit]
+        except KeyError:
             return "Error: Invalid unit specified. Use 'seconds', 'minutes', 'hours', or 'days'."
 
+        # timedelta.total_seconds() keeps microsecond precision, which subtracting
+        # two float timestamps (~1.7e9) would not; abs() is applied to the float.
+        return abs((parsed_dt1 - parsed_dt2).total_seconds()) / unit_seconds
+
     def add_time(
         self,
         dt_obj: Union[str, datetime.datetime],
@@ -161,42 +294,48 @@ class DateTimeManager:
         """
         dt = self._parse_datetime(dt_obj)
         if dt is None:
-            print(f"Error: Could not parse datetime input: {dt_obj}")
+            self._fail("Could not parse datetime input: %s", dt_obj)
             return None
 
         try:
             delta = datetime.timedelta(**kwargs)
             return dt + delta
         except TypeError as e:
-            print(f"Error: Invalid time delta arguments provided: {e}")
+            self._fail("Invalid time delta arguments provided: %s", e)
             return None
 
     def convert_to_offset_timezone(
         self,
         dt_obj: Union[str, datetime.datetime],
-        target_offset_str: str
+        target_offset_str: Union[str, datetime.tzinfo]
     ) -> Union[datetime.datetime, str]:
         """
         Converts a datetime object/string from its current timezone (or assumed UTC
         if naive) to a new fixed UTC offset timezone.
+        The target is an offset string ('+HH:MM') or a tzinfo such as a US_TIME_OFFSETS value.
         """
-        dt = self._parse_datetime(dt_obj)
+        dt = self._parse_and_ensure(dt_obj)
         if dt is None:
             return "Error: Could not parse datetime input."
 
-        target_tz = self._parse_offset_str(target_offset_str)
+        if isinstance(target_offset_str, datetime.tzinfo):
+            target_tz = target_offset_str
+        else:
+            target_tz = self._parse_offset_str(target_offset_str)
         if target_tz is None:
             return f"Error: Invalid offset format '{target_offset_str}'. Use format like '+HH:MM' or '-HH:MM'."
 
-        dt = self._ensure_aware(dt)
         converted_dt = dt.astimezone(target_tz)
         return converted_dt
     
-    def get_current_time_with_offset(self, offset_str: str) -> Union[datetime.datetime, str]:
+    def get_current_time_with_offset(self, offset_str: Union[str, datetime.tzinfo]) -> Union[datetime.datetime, str]:
         """
-        Returns the current time localized to a specified UTC offset.
+        Returns the current time localized to a specified UTC offset (string or tzinfo).
         """
-        target_tz = self._parse_offset_str(offset_str)
+        if isinstance(offset_str, datetime.tzinfo):
+            target_tz = offset_str
+        else:
+            target_tz = self._parse_offset_str(offset_str)
         if target_tz is None:
             return f"Error: Invalid offset format '{offset_str}'. Use format like '+HH:MM' or '-HH:MM'."
 
@@ -212,13 +351,15 @@ class DateTimeManager:
         :param dt_obj: The datetime object or string.
         :return: The ISO 8601 string, or None on error.
         """
-        dt = self._parse_datetime(dt_obj)
+        if type(dt_obj) is datetime.datetime and dt_obj.tzinfo is not None:
+            return dt_obj.isoformat()
+
+        # Ensure aware before conversion to get proper offset in the string
+        dt = self._parse_and_ensure(dt_obj)
         if dt is None:
-            print(f"Error: Could not parse datetime input for ISO conversion: {dt_obj}")
+            self._fail("Could not parse datetime input for ISO conversion: %s", dt_obj)
             return None
-        
-        # Ensure aware before conversion to get proper offset in the string
-        dt = self._ensure_aware(dt)
+
         return dt.isoformat()
 
     def to_timestamp(self, dt_obj: Union[str, datetime.datetime]) -> Union[float, None]:
@@ -228,13 +369,15 @@ class DateTimeManager:
         :param dt_obj: The datetime object or string.
         :return: The Unix timestamp (float), or None on error.
         """
-        dt = self._parse_datetime(dt_obj)
+        if type(dt_obj) is datetime.datetime and dt_obj.tzinfo is not None:
+            return dt_obj.timestamp()
+
+        # Must be timezone aware for timestamp()
+        dt = self._parse_and_ensure(dt_obj)
         if dt is None:
-            print(f"Error: Could not parse datetime input for timestamp conversion: {dt_obj}")
+            self._fail("Could not parse datetime input for timestamp conversion: %s", dt_obj)
             return None
-        
-        # Must be timezone aware for timestamp()
-        dt = self._ensure_aware(dt)
+
         return dt.timestamp()
     
     @staticmethod
@@ -249,35 +392,17 @@ class DateTimeManager:
         if total_seconds is None or total_seconds < 0:
             return "Duration must be a non-negative number."
         
-        # Convert to integer seconds
-        total_seconds = int(total_seconds)
-        
-        seconds_in_minute = 60
-        seconds_in_hour = 3600
-        seconds_in_day = 86400
-
-        # Calculate time components
-        days = total_seconds // seconds_in_day
-        seconds_remainder = total_seconds % seconds_in_day
-
-        hours = seconds_remainder // seconds_in_hour
-        seconds_remainder %= seconds_in_hour
-
-        minutes = seconds_remainder // seconds_in_minute
-        seconds = seconds_remainder % seconds_in_minute
-        
-        # Build the descriptive string
+        # Convert to integer seconds, then peel off each unit with one divmod
+        remainder = int(total_seconds)
         parts = []
-        if days > 0:
-            parts.append(f"{days} day{'s' if days > 1 else ''}")
-        if hours > 0:
-            parts.append(f"{hours} hour{'s' if hours > 1 else ''}")
-        if minutes > 0:
-            parts.append(f"{minutes} minute{'s' if minutes > 1 else ''}")
+        for unit_name, unit_seconds in _DURATION_UNITS:
+            count, remainder = divmod(remainder, unit_seconds)
+            if count:
+                parts.append(f"{count} {unit_name}{'s'[:count != 1]}")
         # Include seconds if > 0 or if the total duration was 0
-        if seconds > 0 or not parts: 
-            parts.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-            
+        if remainder or not parts:
+            parts.append(f"{remainder} second{'s'[:remainder != 1]}")
+
         return ", ".join(parts)
 
     @staticmethod
@@ -295,29 +420,23 @@ class DateTimeManager:
         :param to_unit: The unit to convert the value to.
         :return: The converted value as a float, or an error string.
         """
-        unit_multipliers = {
-            'seconds': 1.0,
-            'minutes': 60.0,
-            'hours': 3600.0,
-            'days': 86400.0
-        }
-        
-        from_unit = from_unit.lower()
-        to_unit = to_unit.lower()
-
-        if from_unit not in unit_multipliers or to_unit not in unit_multipliers:
-            return "Error: Invalid unit specified. Supported units: 'seconds', 'minutes', 'hours', 'days'."
+        try:
+            op, factor = _TIME_UNIT_CONVERSIONS[(from_unit, to_unit)]
+        except KeyError:
+            try:
+                op, factor = _TIME_UNIT_CONVERSIONS[(from_unit.lower(), to_unit.lower())]
+            except KeyError:
+                return "Error: Invalid unit specified. Supported units: 'seconds', 'minutes', 'hours', 'days'."
 
-        # Convert to seconds first
-        seconds = value * unit_multipliers[from_unit]
-        
-        # Convert from seconds to target unit
-        return seconds / unit_multipliers[to_unit]
+        return op(value, factor)
 
     def is_weekend(self, dt_obj: Union[str, datetime.datetime]) -> Union[bool, str]:
         """
         Checks if the given date falls on a weekend (Saturday or Sunday).
         """
+        if type(dt_obj) is datetime.datetime:
+            return dt_obj.weekday() >= 5
+
         dt = self._parse_datetime(dt_obj)
         if dt is None:
             return "Error: Could not parse datetime input."
@@ -329,45 +448,177 @@ class DateTimeManager:
         """
         Returns a datetime object representing the start of the day (00:00:00).
         """
+        if type(dt_obj) is datetime.datetime:
+            return datetime.datetime(dt_obj.year, dt_obj.month, dt_obj.day, tzinfo=dt_obj.tzinfo)
+
         dt = self._parse_datetime(dt_obj)
         if dt is None:
             return "Error: Could not parse datetime input."
         
-        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        return datetime.datetime(dt.year, dt.month, dt.day, tzinfo=dt.tzinfo)
 
     def get_end_of_day(self, dt_obj: Union[str, datetime.datetime]) -> Union[datetime.datetime, str]:
         """
         Returns a datetime object representing the very end of the day (23:59:59.999999).
         """
+        if type(dt_obj) is datetime.datetime:
+            return datetime.datetime(dt_obj.year, dt_obj.month, dt_obj.day, 23, 59, 59, 999999, tzinfo=dt_obj.tzinfo)
+
         dt = self._parse_datetime(dt_obj)
         if dt is None:
             return "Error: Could not parse datetime input."
         
-        return dt.replace(hour=23, minute=59, second=59, microsecond=999999)
+        return datetime.datetime(dt.year, dt.month, dt.day, 23, 59, 59, 999999, tzinfo=dt.tzinfo)
 
     def get_day_name(self, dt_obj: Union[str, datetime.datetime]) -> Union[str, None]:
         """
         Gets the full name of the day (e.g., 'Monday').
         """
+        if type(dt_obj) is datetime.datetime:
+            return dt_obj.strftime(_DAY_NAME_FORMAT)
+
         dt = self._parse_datetime(dt_obj)
         if dt is None:
-            print(f"Error: Could not parse datetime input for day name: {dt_obj}")
+            self._fail("Could not parse datetime input for day name: %s", dt_obj)
             return None
 
-        return dt.strftime('%A')
+        return dt.strftime(_DAY_NAME_FORMAT)
 
     def is_future(self, dt_obj: Union[str, datetime.datetime]) -> Union[bool, str]:
         """
         Checks if the given datetime is in the future relative to the current UTC time.
         """
-        dt = self._parse_datetime(dt_obj)
+        # Compare epoch seconds: no 'now' datetime (or timezone conversion) is built
+        if type(dt_obj) is datetime.datetime and dt_obj.tzinfo is not None:
+            return dt_obj.timestamp() > time.time()
+
+        dt = self._parse_and_ensure(dt_obj)
         if dt is None:
             return "Error: Could not parse datetime input."
-        
-        dt = self._ensure_aware(dt)
-        now_utc = datetime.datetime.now(self.default_tz)
-        
-        return dt > now_utc
+
+        return dt.timestamp() > time.time()
+
+    # --- BULK OPERATIONS (optional NumPy) ---
+
+    @staticmethod
+    def _require_numpy() -> Any:
+        """Returns the numpy module, or raises ImportError if it is not installed."""
+        if np is None:
+            raise ImportError("NumPy is required for bulk datetime operations ('pip install numpy').")
+        return np
+
+    @classmethod
+    def parse_array(cls, values: Iterable[Union[str, datetime.datetime]]) -> Any:
+        """
+        Parses many datetime strings/objects at once into a NumPy datetime64[us] array.
+        Naive values are taken as UTC and aware values are converted to UTC.
+
+        :param values: An iterable of datetime strings or datetime objects.
+        :return: A numpy.ndarray with dtype datetime64[us].
+        :raises ImportError: If NumPy is not installed.
+        :raises ValueError: If a value cannot be parsed.
+        """
+        numpy = cls._require_numpy()
+        values = list(values)
+
+        # Whole-array parse in C, taken only when every value is a string the scalar
+        # parser accepts; numpy alone would also take '', 'NaT', '2024' or 'today'
+        if all(type(value) is str and _DT_RE.fullmatch(value) for value in values):
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('error')
+                    arr = numpy.array(values, dtype='datetime64[us]')
+            except (ValueError, TypeError, Warning):
+                pass # e.g., unpadded '2024-3-5': handled by the loop below
+            else:
+                if numpy.isnat(arr).any():
+                    raise ValueError(f"Could not parse datetime input: {values[int(numpy.isnat(arr).argmax())]}")
+                return arr
+
+        # Mixed shapes (US dates, offsets, datetime objects): parse element by element
+        parsed = []
+        for value in values:
+            dt = cls._parse_datetime(value)
+            if dt is None:
+                raise ValueError(f"Could not parse datetime input: {value}")
+            if dt.tzinfo is not None:
+                dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            parsed.append(dt)
+        return numpy.array(parsed, dtype='datetime64[us]')
+
+    @classmethod
+    def to_timestamp_many(cls, values: Iterable[Union[str, datetime.datetime]]) -> Any:
+        """
+        Vectorized to_timestamp(): Unix timestamps (float seconds) for many values.
+
+        :param values: An iterable of datetime strings/objects, or a datetime64 array.
+        :return: A numpy.ndarray of float64 timestamps.
+        """
+        numpy = cls._require_numpy()
+        arr = cls._as_datetime64(values)
+        return arr.astype('datetime64[us]', copy=False).view(numpy.int64) / 1_000_000
+
+    @classmethod
+    def is_weekend_many(cls, values: Iterable[Union[str, datetime.datetime]]) -> Any:
+        """
+        Vectorized is_weekend(): True for each value falling on a Saturday or Sunday
+        (evaluated on the UTC date, like every datetime64 value).
+
+        :param values: An iterable of datetime strings/objects, or a datetime64 array.
+        :return: A numpy.ndarray of bools.
+        """
+        numpy = cls._require_numpy()
+        # Day numbers since the epoch; a datetime64[D] array is reinterpreted without copying
+        days = cls._as_datetime64(values).astype('datetime64[D]', copy=False).view(numpy.int64)
+        # Day 0 (1970-01-01) was a Thursday, so (days + 3) % 7 is weekday() (Monday = 0)
+        return (days + 3) % 7 >= 5
+
+    @classmethod
+    def is_future_many(cls, values: Iterable[Union[str, datetime.datetime]]) -> Any:
+        """
+        Vectorized is_future(): True for each value later than the current time.
+
+        :param values: An iterable of datetime strings/objects, or a datetime64 array.
+        :return: A numpy.ndarray of bools.
+        """
+        numpy = cls._require_numpy()
+        now = numpy.datetime64(time.time_ns() // 1000, 'us')
+        return cls._as_datetime64(values) > now
+
+    @classmethod
+    def decompose_durations(cls, durations: Iterable[Union[int, float]]) -> Any:
+        """
+        Vectorized counterpart of simplify_time_duration(): splits many durations
+        (in seconds) into their day, hour, minute and second components.
+
+        Uses a parallel Numba kernel when 'numba' is installed (its first call
+        compiles it, which takes a few hundred milliseconds once; the result is
+        cached on disk) and NumPy divmod otherwise.
+
+        :param durations: An iterable or array of non-negative durations in seconds (fractions are truncated).
+        :return: An int64 numpy.ndarray of shape (N, 4): days, hours, minutes, seconds.
+        :raises ValueError: If any duration is negative.
+        """
+        numpy = cls._require_numpy()
+        seconds = numpy.asarray(durations).astype(numpy.int64).ravel()
+        if seconds.size and seconds.min() < 0:
+            raise ValueError("Durations must be non-negative numbers.")
+
+        kernel = _duration_kernel()
+        if kernel is not None:
+            return kernel(seconds)
+
+        days, remainder = numpy.divmod(seconds, 86400)
+        hours, remainder = numpy.divmod(remainder, 3600)
+        minutes, remainder = numpy.divmod(remainder, 60)
+        return numpy.stack((days, hours, minutes, remainder), axis=1)
+
+    @classmethod
+    def _as_datetime64(cls, values: Any) -> Any:
+        """Returns values unchanged if already a datetime64 array, otherwise parse_array(values)."""
+        if isinstance(values, np.ndarray) and values.dtype.kind == 'M':
+            return values
+        return cls.parse_array(values)
 
 
 # Example Usage Demonstration
@@ -403,7 +654,7 @@ if __name__ == '__main__':
     if est_offset:
         est_time = dt_manager.convert_to_offset_timezone(utc_time, est_offset)
         if isinstance(est_time, datetime.datetime):
-            print(f"Time {utc_time} (UTC) converted to EDT ({est_offset}):")
+            print(f"Time {utc_time} (UTC) converted to EDT ({est_time:%z}):")
             print(dt_manager.format_datetime(est_time, '%Y-%m-%d %H:%M:%S %Z'))
     
     print("\n--- 4. Calendar and Boundary Calculations (Existing) ---")
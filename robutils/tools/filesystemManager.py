@@ -1,21 +1,183 @@
+import errno
+import fnmatch
+import functools
 import os
+import re
 import shutil
+import stat
 from pathlib import Path
 import hashlib
+import mmap
 import tempfile
-from typing import List, Union, Optional, Tuple, Dict
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator, List, Union, Optional, Tuple, Dict
 import time
 
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+
 # --- Configuration & Helpers ---
 
+# Read size for the checksum loop (one reusable buffer per thread, see _checksum_buffer)
+_CHECKSUM_CHUNK_SIZE = 1 << 20
+# Files at least this large are memory-mapped and hashed in a single update() call
+_CHECKSUM_MMAP_THRESHOLD = 16 << 20
+# os.copy_file_range (Linux, Python 3.8+) copies inside the kernel and can reflink on CoW filesystems
+_HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+# copy_file_range errors that mean "not supported here" rather than a real I/O failure
+_COPY_FILE_RANGE_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EBADF,
+                                    errno.EOPNOTSUPP, getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP)}
+# batch_file_sizes reads a parent with os.scandir once this many requested files share it
+_BATCH_SCANDIR_MIN = 8
+# Content types written as-is in binary mode, skipping the text encoder
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+# Strings longer than this are written in slices so the encoder never holds a full encoded copy
+_LARGE_CONTENT_CHARS = 4 << 20
+_WRITE_CHUNK_CHARS = 1 << 20
+# os.replace with src_dir_fd/dst_dir_fd maps to renameat() (POSIX); not available on Windows
+_HAS_RENAMEAT = os.replace in os.supports_dir_fd
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+# posix_fadvise (POSIX, not macOS/Windows) lets the checksum reader steer kernel readahead and caching
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+# Direct constructors for the common algorithms (OpenSSL-backed, using SHA-NI /
+# ARMv8 SHA instructions where available); other names go through hashlib.new.
+_HASH_CONSTRUCTORS = {
+    'md5': hashlib.md5,
+    'sha1': hashlib.sha1,
+    'sha256': hashlib.sha256,
+    'sha512': hashlib.sha512,
+}
+
+def _fsync(fd: int) -> None:
+    """Flushes a file descriptor to stable storage (F_FULLFSYNC on macOS, where fsync only reaches the drive cache)."""
+    if fcntl is not None and hasattr(fcntl, 'F_FULLFSYNC'):
+        try:
+            fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+            return
+        except OSError:
+            pass # Not supported by this filesystem: fall back to fsync
+    os.fsync(fd)
+
+# Accepted by the write functions: text, bytes-like data, or an iterable of text chunks
+_FileContent = Union[str, bytes, bytearray, memoryview, Iterable[str]]
+
+@functools.lru_cache(maxsize=1024)
+def _path_from_str(path: str) -> Path:
+    """Cached str -> Path conversion; Path objects are immutable, so sharing them is safe."""
+    return Path(path)
+
 def get_path_object(path: Union[str, Path]) -> Path:
     """Converts a string or Path object into a Path object."""
     if isinstance(path, str):
-        return Path(path)
+        return _path_from_str(path)
     return path
 
+_stat_cache_local = threading.local()
+
+class StatCache:
+    """
+    Opt-in context manager that memoizes stat() results per path for the current thread.
+
+    Inside the block, is_file, is_directory, path_exists, get_file_size and
+    get_file_times share one stat() call per path instead of issuing their own.
+    Results (including "not found") are not refreshed, so use it around read-only
+    checks, or call clear() after modifying the filesystem. Nested blocks share
+    the outermost cache.
+
+    Example:
+        with StatCache():
+            if is_file(path) and get_file_size(path) > 0:
+                ...
+    """
+
+    def __enter__(self) -> 'StatCache':
+        self._previous = getattr(_stat_cache_local, 'cache', None)
+        if self._previous is None:
+            _stat_cache_local.cache = {}
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        _stat_cache_local.cache = self._previous
+        return False
+
+    def clear(self) -> None:
+        """Drops all cached results for the current thread."""
+        cache = getattr(_stat_cache_local, 'cache', None)
+        if cache is not None:
+            cache.clear()
+
+def _cached_stat(path: Union[str, Path]) -> os.stat_result:
+    """os.stat() that consults the active StatCache, if any. Raises OSError like os.stat."""
+    cache = getattr(_stat_cache_local, 'cache', None)
+    if cache is None:
+        return os.stat(path)
+    key = os.fspath(path)
+    result = cache.get(key)
+    if result is None:
+        try:
+            result = os.stat(key)
+        except OSError as e:
+            result = e
+        cache[key] = result
+    if isinstance(result, OSError):
+        raise result
+    return result
+
+def _copy_file(src: Union[str, Path], dst: Union[str, Path]) -> Union[str, Path]:
+    """
+    shutil.copy2-compatible file copy that tries os.copy_file_range first.
+
+    The data never passes through userspace, and btrfs/XFS can share extents
+    instead of copying them. Anything copy_file_range cannot handle falls back
+    to shutil.copy2 (which itself uses sendfile on Linux).
+    """
+    if not _HAS_COPY_FILE_RANGE:
+        return shutil.copy2(src, dst)
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+    try:
+        with open(src, 'rb') as fsrc:
+            st = os.fstat(fsrc.fileno())
+            # Pseudo-files (e.g., /proc) report size 0; let shutil read them
+            if not st.st_size or not stat.S_ISREG(st.st_mode):
+                return shutil.copy2(src, dst)
+            with open(dst, 'wb') as fdst:
+                remaining = st.st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break # Source shrank while copying
+                    remaining -= copied
+    except OSError as e:
+        if e.errno not in _COPY_FILE_RANGE_FALLBACK_ERRNOS:
+            raise
+        return shutil.copy2(src, dst)
+
+    shutil.copystat(src, dst)
+    return dst
+
 # --- File Operations (Read/Write/Checksum/Metadata) ---
 
+def _write_content(f, content: _FileContent) -> None:
+    """Writes content to an open file, slicing large strings and streaming iterables chunk by chunk."""
+    if isinstance(content, str):
+        if len(content) <= _LARGE_CONTENT_CHARS:
+            f.write(content)
+        else:
+            for i in range(0, len(content), _WRITE_CHUNK_CHARS):
+                f.write(content[i:i + _WRITE_CHUNK_CHARS])
+    elif isinstance(content, _BYTES_TYPES):
+        f.write(content)
+    else:
+        for chunk in content:
+            f.write(chunk)
+
 def read_file_content(filepath: Union[str, Path], encoding: str = 'utf-8') -> Optional[str]:
     """
     Reads the entire content of a text file.
@@ -27,9 +189,8 @@ def read_file_content(filepath: Union[str, Path], encoding: str = 'utf-8') -> Op
     Returns:
         The content of the file as a string, or None if an error occurs.
     """
-    file_path_obj = get_path_object(filepath)
     try:
-        with open(file_path_obj, 'r', encoding=encoding) as f:
+        with open(filepath, 'r', encoding=encoding) as f:
             return f.read()
     except FileNotFoundError:
         print(f"Error: File not found at {filepath}")
@@ -38,14 +199,43 @@ def read_file_content(filepath: Union[str, Path], encoding: str = 'utf-8') -> Op
         print(f"Error reading file {filepath}: {e}")
         return None
 
-def write_file_content(filepath: Union[str, Path], content: str, encoding: str = 'utf-8', overwrite: bool = True) -> bool:
+def read_files_batch(paths: Iterable[Union[str, Path]], encoding: str = 'utf-8',
+                     max_workers: Optional[int] = None) -> Dict[str, Optional[str]]:
+    """
+    Reads many text files concurrently.
+
+    open()/read() release the GIL, so a thread pool keeps several reads in flight
+    at once, which hides per-file latency on cold or network storage. For a
+    single file, call read_file_content directly.
+
+    Args:
+        paths: The file paths to read.
+        encoding: The character encoding to use (default: 'utf-8').
+        max_workers: Thread count; defaults to min(32, number of paths).
+
+    Returns:
+        A dictionary mapping each path (as a string, in input order) to its
+        content, or None for files that could not be read.
+    """
+    keys = [str(p) for p in paths]
+    if not keys:
+        return {}
+    workers = max_workers or min(32, len(keys))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        contents = executor.map(lambda p: read_file_content(p, encoding), keys)
+        return dict(zip(keys, contents))
+
+def write_file_content(filepath: Union[str, Path], content: _FileContent,
+                       encoding: str = 'utf-8', overwrite: bool = True) -> bool:
     """
     Writes content to a text file. Creates the file if it doesn't exist.
     Will create parent directories if they don't exist.
 
     Args:
         filepath: The path to the file.
-        content: The string content to write.
+        content: The string content to write. Bytes-like content is written
+                 unchanged in binary mode and `encoding` is ignored. An iterable
+                 of strings (e.g., a generator) is written chunk by chunk.
         encoding: The character encoding to use (default: 'utf-8').
         overwrite: If True (default), overwrites existing content. If False,
                    raises a FileExistsError if the file already exists.
@@ -55,14 +245,16 @@ def write_file_content(filepath: Union[str, Path], content: str, encoding: str =
     """
     file_path_obj = get_path_object(filepath)
     mode = 'w' if overwrite else 'x'
+    is_binary = isinstance(content, _BYTES_TYPES)
     
     try:
         # Ensure parent directories exist
         if file_path_obj.parent:
             file_path_obj.parent.mkdir(parents=True, exist_ok=True)
             
-        with open(file_path_obj, mode, encoding=encoding) as f:
-            f.write(content)
+        with open(file_path_obj, mode + 'b' if is_binary else mode,
+                  encoding=None if is_binary else encoding) as f:
+            _write_content(f, content)
         return True
     except FileExistsError:
         print(f"Error: File already exists at {filepath}. Set overwrite=True to force overwrite.")
@@ -71,41 +263,84 @@ def write_file_content(filepath: Union[str, Path], content: str, encoding: str =
         print(f"Error writing to file {filepath}: {e}")
         return False
 
-def atomic_write_file_content(filepath: Union[str, Path], content: str, encoding: str = 'utf-8') -> bool:
+def atomic_write_file_content(filepath: Union[str, Path], content: _FileContent,
+                              encoding: str = 'utf-8', durable: bool = True) -> bool:
     """
     Writes content to a file safely using a temporary file and atomic rename.
     This prevents data corruption if the write operation is interrupted.
 
     Args:
         filepath: The final destination path for the file.
-        content: The string content to write.
+        content: The string content to write. Bytes-like content is written
+                 unchanged in binary mode and `encoding` is ignored. An iterable
+                 of strings (e.g., a generator) is written chunk by chunk.
         encoding: The character encoding to use (default: 'utf-8').
+        durable: If True (default), fsyncs the temporary file before the rename and
+            the parent directory after it, so the new content survives a crash or
+            power loss. False skips both fsyncs for higher throughput; the rename
+            is still atomic, but a crash may leave an empty or old file.
 
     Returns:
         True if successful, False otherwise.
     """
     final_path = get_path_object(filepath)
+    # Short fixed-length sibling name, so a target name near NAME_MAX still has a
+    # valid temp name; O_EXCL below guarantees we never reuse an existing file
+    temp_name = f".tmp-{os.urandom(8).hex()}"
+    temp_path = final_path.parent / temp_name
     
+    dir_fd = None
+    created = False
     try:
         # 1. Ensure parent directories exist
         if final_path.parent:
             final_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # 2. Write to a temporary file in the same directory (for better atomicity)
-        temp_dir = final_path.parent or None
-        with tempfile.NamedTemporaryFile(mode='w', encoding=encoding, delete=False, dir=temp_dir) as tmp_file:
-            tmp_file.write(content)
-            temp_path = Path(tmp_file.name)
+        if _HAS_RENAMEAT:
+            # Hold the parent open: the rename and its fsync both resolve names
+            # relative to this fd instead of walking the full path again
+            dir_fd = os.open(final_path.parent, _DIR_OPEN_FLAGS)
+
+        # 2. Write to a temporary file in the same directory (for better atomicity).
+        # A plain os.open avoids tempfile's name-retry loop and cleanup finalizer.
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+        if dir_fd is not None:
+            fd = os.open(temp_name, flags, 0o666, dir_fd=dir_fd)
+        else:
+            fd = os.open(temp_path, flags, 0o666)
+        created = True
+        if isinstance(content, _BYTES_TYPES):
+            tmp_file = open(fd, 'wb')
+        else:
+            tmp_file = open(fd, 'w', encoding=encoding)
+        with tmp_file:
+            _write_content(tmp_file, content)
+            if durable:
+                tmp_file.flush()
+                _fsync(tmp_file.fileno())
         
         # 3. Atomically replace the final file with the temporary file
-        os.replace(temp_path, final_path)
+        if dir_fd is not None:
+            os.replace(temp_name, final_path.name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd) # renameat()
+            if durable:
+                _fsync(dir_fd)
+        else:
+            os.replace(temp_path, final_path)
         return True
     except Exception as e:
         print(f"Error during atomic write to {filepath}: {e}")
         # Ensure the temporary file is cleaned up if rename fails
-        if 'temp_path' in locals() and temp_path.exists():
-            delete_path(temp_path)
+        if created:
+            try:
+                if dir_fd is not None:
+                    os.unlink(temp_name, dir_fd=dir_fd)
+                else:
+                    os.unlink(temp_path)
+            except OSError:
+                pass
         return False
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
 
 def get_file_size(filepath: Union[str, Path]) -> Optional[int]:
     """
@@ -117,10 +352,10 @@ def get_file_size(filepath: Union[str, Path]) -> Optional[int]:
     Returns:
         The size in bytes (integer), or None if the path is not a file or an error occurs.
     """
-    file_path_obj = get_path_object(filepath)
     try:
-        if file_path_obj.is_file():
-            return file_path_obj.stat().st_size
+        stat_info = _cached_stat(filepath)
+        if stat.S_ISREG(stat_info.st_mode):
+            return stat_info.st_size
         else:
             print(f"Error: Path {filepath} is not a file.")
             return None
@@ -131,39 +366,162 @@ def get_file_size(filepath: Union[str, Path]) -> Optional[int]:
         print(f"Error getting file size for {filepath}: {e}")
         return None
 
-def get_file_checksum(filepath: Union[str, Path], algorithm: str = 'sha256') -> Optional[str]:
+def batch_file_sizes(paths: Iterable[Union[str, Path]]) -> Dict[str, Optional[int]]:
+    """
+    Gets the sizes of many files, grouping them by parent directory.
+
+    When at least _BATCH_SCANDIR_MIN of the paths share a parent, that directory
+    is read once with os.scandir and sizes come from its DirEntry objects (whose
+    stat data is free on Windows, and whose cached type lets non-files be skipped
+    without a stat() elsewhere). Smaller groups are stat()ed directly.
+
+    Args:
+        paths: The file paths to measure.
+
+    Returns:
+        A dictionary mapping each path (as a string, in input order) to its size
+        in bytes, or None if it is missing or not a regular file.
+    """
+    keys = [os.fspath(p) for p in paths]
+    sizes: Dict[str, Optional[int]] = dict.fromkeys(keys)
+
+    groups: Dict[str, Dict[str, List[str]]] = {}
+    for key in keys:
+        parent, name = os.path.split(key)
+        if name:
+            groups.setdefault(parent, {}).setdefault(name, []).append(key)
+        else:
+            groups.setdefault(key, {}) # Trailing separator: a directory, never a file
+
+    for parent, names in groups.items():
+        if len(names) >= _BATCH_SCANDIR_MIN:
+            try:
+                with os.scandir(parent or os.curdir) as it:
+                    for entry in it:
+                        wanted = names.get(entry.name)
+                        if wanted is None:
+                            continue
+                        try:
+                            if entry.is_file():
+                                size = entry.stat().st_size
+                                for key in wanted:
+                                    sizes[key] = size
+                        except OSError:
+                            pass # Vanished or unreadable: leave as None
+                continue
+            except OSError:
+                pass # Unreadable directory: fall back to per-path stat()
+        for wanted in names.values():
+            for key in wanted:
+                try:
+                    stat_info = os.stat(key)
+                except (OSError, ValueError):
+                    continue
+                if stat.S_ISREG(stat_info.st_mode):
+                    sizes[key] = stat_info.st_size
+    return sizes
+
+def _fadvise(fd: int, advice: int) -> None:
+    """Best-effort posix_fadvise over the whole file; the advice is only a hint, so failures are ignored."""
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+_checksum_local = threading.local()
+
+def _checksum_buffer() -> memoryview:
+    """Returns this thread's reusable checksum read buffer, allocating it on first use."""
+    buffer = getattr(_checksum_local, 'buffer', None)
+    if buffer is None:
+        buffer = _checksum_local.buffer = memoryview(bytearray(_CHECKSUM_CHUNK_SIZE))
+    return buffer
+
+def _hash_open_file(f, size: int, hash_func) -> str:
+    """Feeds an open binary file into hash_func and returns the hex digest."""
+    if size >= _CHECKSUM_MMAP_THRESHOLD:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL) # Hint aggressive readahead
+                hash_func.update(mm)
+            return hash_func.hexdigest()
+        except (OSError, ValueError):
+            pass # mmap unavailable for this file (e.g., special filesystem): read it instead
+
+    # Read file in 1 MiB chunks into the thread's pooled buffer: no per-call allocation
+    buffer = _checksum_buffer()
+    while n := f.readinto(buffer):
+        hash_func.update(buffer[:n])
+    return hash_func.hexdigest()
+
+def get_file_checksum(filepath: Union[str, Path], algorithm: str = 'sha256', drop_cache: bool = False) -> Optional[str]:
     """
     Calculates the cryptographic checksum (hash) of a file's content.
 
     Args:
         filepath: The path to the file.
         algorithm: The hashing algorithm to use (e.g., 'md5', 'sha1', 'sha256', 'sha512').
+        drop_cache: If True, advises the kernel to evict the file's pages from the
+            page cache afterwards (POSIX_FADV_DONTNEED), so one-off hashing of large
+            files does not push out other cached data. Ignored where unsupported.
 
     Returns:
         The hexadecimal digest string, or None if an error occurs.
     """
-    file_path_obj = get_path_object(filepath)
-    if not file_path_obj.is_file():
-        print(f"Error: File not found or not a file at {filepath}")
-        return None
-
     try:
         # Create hash object based on algorithm
-        hash_func = hashlib.new(algorithm)
+        constructor = _HASH_CONSTRUCTORS.get(algorithm)
+        hash_func = constructor() if constructor else hashlib.new(algorithm)
     except ValueError:
         print(f"Error: Unsupported hashing algorithm '{algorithm}'.")
         return None
 
     try:
-        # Read file in chunks to handle large files efficiently
-        with open(file_path_obj, 'rb') as f:
-            while chunk := f.read(4096):
-                hash_func.update(chunk)
-        return hash_func.hexdigest()
+        # No separate is_file() check: open() and fstat() report the same problems
+        with open(filepath, 'rb') as f:
+            stat_info = os.fstat(f.fileno())
+            if not stat.S_ISREG(stat_info.st_mode):
+                print(f"Error: File not found or not a file at {filepath}")
+                return None
+            if _HAS_FADVISE:
+                _fadvise(f.fileno(), os.POSIX_FADV_SEQUENTIAL) # Double the readahead window
+            digest = _hash_open_file(f, stat_info.st_size, hash_func)
+            if drop_cache and _HAS_FADVISE:
+                _fadvise(f.fileno(), os.POSIX_FADV_DONTNEED)
+            return digest
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        print(f"Error: File not found or not a file at {filepath}")
+        return None
     except Exception as e:
         print(f"Error calculating checksum for {filepath}: {e}")
         return None
 
+def get_file_checksums(paths: Iterable[Union[str, Path]], algorithm: str = 'sha256',
+                       max_workers: Optional[int] = None) -> Dict[str, Optional[str]]:
+    """
+    Calculates the checksums of many files concurrently.
+
+    OpenSSL releases the GIL while hashing, so a thread pool overlaps both disk
+    reads and hash computation across files.
+
+    Args:
+        paths: The file paths to hash.
+        algorithm: The hashing algorithm to use (see get_file_checksum).
+        max_workers: Thread count; defaults to min(32, number of paths).
+
+    Returns:
+        A dictionary mapping each path (as a string, in input order) to its
+        hexadecimal digest, or None for files that could not be hashed.
+    """
+    keys = [str(p) for p in paths]
+    if not keys:
+        return {}
+    workers = max_workers or min(32, len(keys))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = executor.map(lambda p: get_file_checksum(p, algorithm), keys)
+        return dict(zip(keys, digests))
+
 def get_file_times(filepath: Union[str, Path]) -> Optional[Dict[str, float]]:
     """
     Retrieves file creation and modification timestamps.
@@ -175,9 +533,8 @@ def get_file_times(filepath: Union[str, Path]) -> Optional[Dict[str, float]]:
         A dictionary containing 'modified' and 'created' timestamps (as seconds
         since the epoch), or None if an error occurs.
     """
-    file_path_obj = get_path_object(filepath)
     try:
-        stat_info = file_path_obj.stat()
+        stat_info = _cached_stat(filepath)
         # st_ctime is typically creation time on Unix/macOS, but might be
         # last metadata change time. st_mtime is consistently last modification time.
         return {
@@ -232,29 +589,44 @@ def create_temp_directory() -> Optional[str]:
         print(f"Error creating temporary directory: {e}")
         return None
 
-def delete_path(path: Union[str, Path]) -> bool:
+def delete_path(path: Union[str, Path], background: bool = False) -> bool:
     """
     Deletes a file or an entire directory tree.
 
     Args:
         path: The path to the file or directory to delete.
+        background: If True, a directory is first renamed to a hidden sibling
+            ('.trash-<random>'), which atomically removes it from
+            its path, and the tree is deleted by a daemon thread so the call
+            returns immediately. A tree still being deleted when the interpreter
+            exits is left behind under the trash name.
 
     Returns:
         True if successful, False otherwise.
     """
-    path_obj = get_path_object(path)
-    if not path_obj.exists():
-        print(f"Warning: Path not found, nothing to delete at {path}")
-        return True # Considered successful if the target doesn't exist
-
     try:
-        if path_obj.is_file():
-            path_obj.unlink()
-        elif path_obj.is_dir():
-            shutil.rmtree(path_obj)
+        try:
+            # Files, symlinks and other non-directories: one syscall, no prior stat()
+            os.unlink(path)
+            return True
+        except FileNotFoundError:
+            print(f"Warning: Path not found, nothing to delete at {path}")
+            return True # Considered successful if the target doesn't exist
+        except (IsADirectoryError, PermissionError):
+            # unlink() on a directory fails with EISDIR (Linux), EPERM (macOS)
+            # or access denied (Windows); anything else is a real error
+            if not os.path.isdir(path):
+                raise
+
+        path_obj = get_path_object(path)
+        if background:
+            # Fixed-length name: the original name may already be close to NAME_MAX
+            trash = path_obj.with_name(f".trash-{os.urandom(8).hex()}")
+            os.rename(path_obj, trash)
+            threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True},
+                             name='delete_path', daemon=True).start()
         else:
-            # Handle symlinks or other exotic file types
-            os.remove(path_obj)
+            shutil.rmtree(path_obj)
         return True
     except PermissionError:
         print(f"Error: Permission denied when trying to delete {path}.")
@@ -263,6 +635,33 @@ def delete_path(path: Union[str, Path]) -> bool:
         print(f"Error deleting path {path}: {e}")
         return False
 
+def iter_directory_contents(dirpath: Union[str, Path], include_files: bool = True, include_dirs: bool = True) -> Iterator[str]:
+    """
+    Lazily yields the names (not full paths) of files and/or directories in a given directory.
+
+    Names are produced as os.scandir reads them; file types come from the
+    directory entry itself, so usually no extra stat() is needed.
+
+    Args:
+        dirpath: The path to the directory to list.
+        include_files: Whether to include files in the result.
+        include_dirs: Whether to include directories in the result.
+
+    Yields:
+        Names (strings) of the contents.
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if include_files and entry.is_file():
+                    yield entry.name
+                elif include_dirs and entry.is_dir():
+                    yield entry.name
+    except (FileNotFoundError, NotADirectoryError):
+        print(f"Error: Path {dirpath} is not a directory.")
+    except Exception as e:
+        print(f"Error listing contents of {dirpath}: {e}")
+
 def list_directory_contents(dirpath: Union[str, Path], include_files: bool = True, include_dirs: bool = True) -> List[str]:
     """
     Lists the names (not full paths) of files and/or directories in a given directory.
@@ -275,22 +674,66 @@ def list_directory_contents(dirpath: Union[str, Path], include_files: bool = Tru
     Returns:
         A list of names (strings) of the contents.
     """
-    dir_path_obj = get_path_object(dirpath)
-    if not dir_path_obj.is_dir():
-        print(f"Error: Path {dirpath} is not a directory.")
-        return []
+    return list(iter_directory_contents(dirpath, include_files, include_dirs))
+
+@functools.lru_cache(maxsize=128)
+def _compile_glob(pattern: str):
+    """Compiles a name-only glob pattern to a regex match function (None for '*'), cached across walks."""
+    if pattern == '*':
+        return None
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE if os.name == 'nt' else 0).match
+
+def iwalk_directory_contents(dirpath: Union[str, Path], pattern: str = '*', recursive: bool = True) -> Iterator[str]:
+    """
+    Lazily yields paths within a directory that match a glob pattern.
+
+    Simple name patterns (e.g., '*.txt') are compiled to a regex once and matched
+    against entry names from os.walk, without creating a Path per entry. Patterns
+    containing a path separator or '**' are delegated to Path.glob/rglob.
+
+    Args:
+        dirpath: The path to the directory to start walking from.
+        pattern: The glob pattern to match. Default is '*' (all contents).
+        recursive: If True (default), searches recursively into subdirectories.
+
+    Yields:
+        Full path strings matching the pattern.
+    """
+    top = os.fspath(dirpath)
+
+    def on_error(e: OSError) -> None:
+        # os.walk reports errors instead of raising; only a bad starting point is worth a message
+        if e.filename == top:
+            print(f"Error: Path {dirpath} is not a directory.")
 
-    contents = []
     try:
-        for item in dir_path_obj.iterdir():
-            if include_files and item.is_file():
-                contents.append(item.name)
-            elif include_dirs and item.is_dir():
-                contents.append(item.name)
-        return contents
+        if '/' in pattern or os.sep in pattern or '**' in pattern:
+            if not os.path.isdir(top):
+                print(f"Error: Path {dirpath} is not a directory.")
+                return
+            dir_path_obj = get_path_object(dirpath)
+            glob_method = dir_path_obj.rglob if recursive else dir_path_obj.glob
+            for p in glob_method(pattern):
+                yield str(p)
+            return
+
+        match = _compile_glob(pattern)
+        join = os.path.join
+        for root, dirs, files in os.walk(top, onerror=on_error):
+            if match is None: # '*' matches every name: skip the regex entirely
+                yield from (join(root, name) for name in dirs)
+                yield from (join(root, name) for name in files)
+            else:
+                for name in dirs:
+                    if match(name):
+                        yield join(root, name)
+                for name in files:
+                    if match(name):
+                        yield join(root, name)
+            if not recursive:
+                break
     except Exception as e:
-        print(f"Error listing contents of {dirpath}: {e}")
-        return []
+        print(f"Error walking directory {dirpath}: {e}")
 
 def walk_directory_contents(dirpath: Union[str, Path], pattern: str = '*', recursive: bool = True) -> List[str]:
     """
@@ -304,47 +747,72 @@ def walk_directory_contents(dirpath: Union[str, Path], pattern: str = '*', recur
     Returns:
         A list of full path strings matching the pattern.
     """
-    dir_path_obj = get_path_object(dirpath)
-    if not dir_path_obj.is_dir():
-        print(f"Error: Path {dirpath} is not a directory.")
-        return []
+    return list(iwalk_directory_contents(dirpath, pattern, recursive))
 
-    glob_method = dir_path_obj.rglob if recursive else dir_path_obj.glob
-    
+def _scan_directory_level(dirpath: str, strict: bool = False) -> Tuple[int, List[str]]:
+    """
+    Sums the regular-file sizes directly inside dirpath and returns them with its subdirectory paths.
+    An unreadable dirpath is only a warning unless strict is True, in which case the OSError propagates.
+    """
+    total_size = 0
+    subdirs = []
     try:
-        # Use rglob for recursive search, glob for non-recursive
-        # Note: glob/rglob yields Path objects, convert to string list
-        return [str(p) for p in glob_method(pattern)]
-    except Exception as e:
-        print(f"Error walking directory {dirpath}: {e}")
-        return []
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                except OSError as e:
+                    # Log error but continue calculation
+                    print(f"Warning: Could not get size for file {entry.path}: {e}")
+    except OSError as e:
+        if strict:
+            raise
+        print(f"Warning: Could not read directory {dirpath}: {e}")
+    return total_size, subdirs
 
-def get_directory_size(dirpath: Union[str, Path]) -> Optional[int]:
+def get_directory_size(dirpath: Union[str, Path], max_workers: Optional[int] = None) -> Optional[int]:
     """
     Calculates the total size of a directory in bytes, including all files and subdirectories.
 
+    Directories are scanned with os.scandir (file types come from the directory
+    read, so only regular files cost one lstat() each). Subdirectories are
+    scanned concurrently, since the underlying system calls release the GIL.
+
     Args:
         dirpath: The path to the directory.
+        max_workers: Threads scanning subdirectories; defaults to min(CPU count, 16).
+            1 scans serially.
 
     Returns:
         The total size in bytes (integer), or None if an error occurs.
     """
-    dir_path_obj = get_path_object(dirpath)
-    if not dir_path_obj.is_dir():
-        print(f"Error: Path {dirpath} is not a directory.")
-        return None
-
-    total_size = 0
+    workers = max_workers or min(os.cpu_count() or 1, 16)
     try:
-        # Recursively glob all files and directories
-        for item in dir_path_obj.rglob('*'):
-            if item.is_file():
-                # Safely get size, handling potential errors for specific files
-                try:
-                    total_size += item.stat().st_size
-                except Exception as e:
-                    # Log error but continue calculation
-                    print(f"Warning: Could not get size for file {item}: {e}")
+        try:
+            total_size, pending = _scan_directory_level(os.fspath(dirpath), strict=True)
+        except (FileNotFoundError, NotADirectoryError):
+            print(f"Error: Path {dirpath} is not a directory.")
+            return None
+        if workers <= 1 or not pending:
+            while pending:
+                size, subdirs = _scan_directory_level(pending.pop())
+                total_size += size
+                pending.extend(subdirs)
+            return total_size
+
+        # Each finished scan submits its subdirectories, so the pool keeps
+        # pulling work until the whole tree has been visited
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_scan_directory_level, d) for d in pending}
+            while futures:
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    size, subdirs = future.result()
+                    total_size += size
+                    futures.update(executor.submit(_scan_directory_level, d) for d in subdirs)
         return total_size
     except Exception as e:
         print(f"Error calculating directory size for {dirpath}: {e}")
@@ -397,11 +865,11 @@ def copy_path(src: Union[str, Path], dst: Union[str, Path]) -> bool:
 
     try:
         if src_obj.is_file():
-            # Copy a single file
-            shutil.copy2(src_obj, dst_obj) # copy2 preserves metadata
+            # Copy a single file, preserving metadata like copy2
+            _copy_file(src_obj, dst_obj)
         elif src_obj.is_dir():
             # Copy directory tree
-            shutil.copytree(src_obj, dst_obj)
+            shutil.copytree(src_obj, dst_obj, copy_function=_copy_file)
         else:
             # Handle special cases like symbolic links
             shutil.copy2(src_obj, dst_obj)
@@ -461,17 +929,32 @@ def get_filename_and_extension(filepath: Union[str, Path]) -> Tuple[str, str]:
     path_obj = get_path_object(filepath)
     return (path_obj.stem, path_obj.suffix)
 
+def _cached_mode(path: Union[str, Path]) -> Optional[int]:
+    """st_mode from the active StatCache, or None if the path cannot be stat()ed."""
+    try:
+        return _cached_stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+
 def is_file(path: Union[str, Path]) -> bool:
     """Checks if the path is an existing file."""
-    return get_path_object(path).is_file()
+    if getattr(_stat_cache_local, 'cache', None) is not None:
+        mode = _cached_mode(path)
+        return mode is not None and stat.S_ISREG(mode)
+    return os.path.isfile(path)
 
 def is_directory(path: Union[str, Path]) -> bool:
     """Checks if the path is an existing directory."""
-    return get_path_object(path).is_dir()
+    if getattr(_stat_cache_local, 'cache', None) is not None:
+        mode = _cached_mode(path)
+        return mode is not None and stat.S_ISDIR(mode)
+    return os.path.isdir(path)
 
 def path_exists(path: Union[str, Path]) -> bool:
     """Checks if the path exists (either file or directory)."""
-    return get_path_object(path).exists()
+    if getattr(_stat_cache_local, 'cache', None) is not None:
+        return _cached_mode(path) is not None
+    return os.path.exists(path)
 
 # --- Example Usage (Self-Test) ---
 
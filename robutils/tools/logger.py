@@ -1,19 +1,81 @@
 import abc
+import http.client
+import atexit
 import datetime
+import functools
 import sqlite3
 import os
 import sys
 import socket
 import json
+import queue
+import threading
 import time 
+import urllib.parse
 import glob
-from typing import List, Dict, Any, Optional
+import inspect
+import io
+import weakref
+from typing import List, Dict, Any, Optional, Callable, Iterable
 
 # --- Configuration Constants ---
 # Updated LOG_FORMAT to include space for context data if available
 LOG_FORMAT = "{timestamp} [{level}] {message}{context_str}"
+# format_log builds the default layout with an f-string; a reassigned LOG_FORMAT is still honored
+_DEFAULT_LOG_FORMAT = LOG_FORMAT
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40, 'CRITICAL': 50}
+# Level spelling -> (upper-case name, value); seeded with the canonical names, other casings added on first use
+_LEVEL_CACHE = {name: (name, value) for name, value in LOG_LEVELS.items()}
+
+def _resolve_level(level: str) -> tuple:
+    """Returns (upper-case name, value) for a level name; value is 0 for unknown levels."""
+    resolved = _LEVEL_CACHE.get(level)
+    if resolved is None:
+        name = level.upper()
+        resolved = (name, LOG_LEVELS.get(name, 0))
+        if name in LOG_LEVELS:
+            _LEVEL_CACHE[level] = resolved
+    return resolved
+
+# Logger name -> lower-cased name, filled in by Logger so name filtering never lower-cases per record
+_LOWER_NAMES: Dict[str, str] = {}
+
+# Context values whose JSON is fully determined by (type, value); floats are left out since 0.0 == -0.0
+_CACHEABLE_CONTEXT_TYPES = frozenset((str, int, bool, type(None)))
+
+@functools.lru_cache(maxsize=1024)
+def _cached_context_json(items: tuple) -> str:
+    """JSON for a context given as (key, value, type(value)) triples; the type keeps 1 and True apart."""
+    return json.dumps({key: value for key, value, _ in items})
+
+def _context_json(context: Dict[str, Any]) -> str:
+    """json.dumps(context), memoized for contexts made only of strings, ints, booleans and None."""
+    items = tuple([(key, value, type(value)) for key, value in context.items()])
+    for _, _, value_type in items:
+        if value_type not in _CACHEABLE_CONTEXT_TYPES:
+            return json.dumps(context)
+    return _cached_context_json(items)
+
+# Handlers with background writers, flushed and closed at interpreter exit
+_live_handlers: "weakref.WeakSet[AbstractHandler]" = weakref.WeakSet()
+
+@atexit.register
+def _close_live_handlers() -> None:
+    for handler in list(_live_handlers):
+        handler.close()
+
+# (epoch second, formatted timestamp); replaced as a whole so threads never see a torn pair
+_ts_cache = (0, "")
+
+def _now_str() -> str:
+    """Current local time formatted with DATE_FORMAT, formatted at most once per wall-clock second."""
+    global _ts_cache
+    now = int(time.time())
+    cached = _ts_cache
+    if cached[0] != now:
+        cached = _ts_cache = (now, time.strftime(DATE_FORMAT, time.localtime(now)))
+    return cached[1]
 
 
 # --- 1. Filter Mechanism ---
@@ -40,18 +102,18 @@ class LevelFilter(AbstractFilter):
 
     def filter(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]]) -> bool:
         """Allow log records whose level is >= min_level."""
-        log_level_val = LOG_LEVELS.get(level.upper(), 0)
-        return log_level_val >= self.min_level_val
+        return _resolve_level(level)[1] >= self.min_level_val
 
 class NameFilter(AbstractFilter):
     """Filters logs based on the logger's name (only allows logs from specified names)."""
 
     def __init__(self, allowed_names: List[str]):
-        self.allowed_names = set(n.lower() for n in allowed_names)
+        self.allowed_names = frozenset(n.lower() for n in allowed_names)
 
     def filter(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]]) -> bool:
         """Allow log records only if the logger_name is in the allowed list."""
-        return logger_name.lower() in self.allowed_names
+        lname = _LOWER_NAMES.get(logger_name) or logger_name.lower()
+        return lname in self.allowed_names
 
 class ContextFilter(AbstractFilter):
     """Filters logs based on required key-value pairs in the context dictionary."""
@@ -76,42 +138,112 @@ class ContextFilter(AbstractFilter):
 class AbstractHandler(abc.ABC):
     """Abstract base class for all log handlers, now supporting filters."""
 
+    # Highest LevelFilter floor among this handler's filters (0 = no level filter)
+    _min_level_val: int = 0
+    # Lower-cased logger names every NameFilter allows (None = no name filter)
+    _allowed_names: Optional[frozenset] = None
+    # (key, value) pairs required by the ContextFilters
+    _required_context: tuple = ()
+    # Filters of any other type, checked through their filter() method
+    _custom_filters: tuple = ()
+    # Whether emit() takes the pre-serialized context_json argument (see __init_subclass__)
+    _emit_accepts_json: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Handlers written against the original emit() signature still work; they just
+        # don't receive the context JSON that Logger serialized once for all handlers
+        cls._emit_accepts_json = 'context_json' in inspect.signature(cls.emit).parameters
+
     def __init__(self):
         self._filters: List[AbstractFilter] = []
+        self._min_level_val = 0
+        self._owners: "weakref.WeakSet[Logger]" = weakref.WeakSet() # Loggers this handler is attached to
 
     def add_filter(self, filter_obj: AbstractFilter) -> None:
-        """Adds a filter to this specific handler."""
+        """
+        Adds a filter to this specific handler. The built-in filter types are folded
+        into a level floor, a set of allowed names and a tuple of required context
+        pairs, so is_allowed() checks them inline instead of calling each filter.
+        """
         self._filters.append(filter_obj)
+        filter_type = type(filter_obj)
+        if filter_type is LevelFilter:
+            self._min_level_val = max(self._min_level_val, filter_obj.min_level_val)
+        elif filter_type is NameFilter:
+            names = filter_obj.allowed_names
+            self._allowed_names = names if self._allowed_names is None else self._allowed_names & names
+        elif filter_type is ContextFilter:
+            self._required_context += tuple(filter_obj.required_context.items())
+        else:
+            # Subclasses of the built-in filters may override filter(), so they take the
+            # generic path and are not folded into the level floor used by handle()
+            self._custom_filters += (filter_obj,)
+        for logger in self._owners:
+            logger._recompute_effective()
+
+    def handle(self, logger_name: str, level_val: int, level: str, message: str,
+               context: Optional[Dict[str, Any]] = None, context_json: Optional[str] = None) -> None:
+        """
+        Entry point used by Logger: rejects records below the handler's level
+        filters with a single integer comparison, before emit() does any filtering
+        or formatting work.
+        """
+        if level_val < self._min_level_val:
+            return
+        if self._emit_accepts_json:
+            self.emit(logger_name, level, message, context, context_json)
+        else:
+            self.emit(logger_name, level, message, context)
 
     def is_allowed(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]]) -> bool:
         """Checks if the log record passes all associated filters."""
-        for filter_obj in self._filters:
+        if self._min_level_val and _resolve_level(level)[1] < self._min_level_val:
+            return False
+        if self._allowed_names is not None:
+            lname = _LOWER_NAMES.get(logger_name) or logger_name.lower()
+            if lname not in self._allowed_names:
+                return False
+        if self._required_context:
+            if not context:
+                return False
+            for key, value in self._required_context:
+                if context.get(key) != value:
+                    return False
+        for filter_obj in self._custom_filters:
             if not filter_obj.filter(logger_name, level, message, context):
                 return False
         return True
 
     @abc.abstractmethod
-    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None) -> None:
-        """Process the log record and send it to the final output."""
+    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None,
+             context_json: Optional[str] = None) -> None:
+        """
+        Process the log record and send it to the final output.
+        context_json, when given, is json.dumps(context) already computed by the Logger
+        (shared by all of its handlers); subclasses may omit the parameter.
+        """
         pass
 
-    def format_log(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]]) -> str:
-        """Formats the log record into a string, including context if present."""
-        timestamp = datetime.datetime.now().strftime(DATE_FORMAT)
-        
+    def format_log(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]],
+                   context_json: Optional[str] = None, end: str = '') -> str:
+        """
+        Formats the log record into a string, including context if present.
+        `end` is appended in the same build step (e.g., '\\n' for a complete file line).
+        """
+        # Only show context for console/file if it contains actual data
         context_str = ""
         if context:
-             # Only show context for console/file if it contains actual data
-             context_str = f" | Context: {json.dumps(context)}"
-             
-        full_message = f"[{logger_name}] {message}"
+            context_str = f" | Context: {context_json if context_json is not None else json.dumps(context)}"
+        if LOG_FORMAT is _DEFAULT_LOG_FORMAT:
+            return f"{_now_str()} [{level}] [{logger_name}] {message}{context_str}{end}"
         
         return LOG_FORMAT.format(
-            timestamp=timestamp, 
+            timestamp=_now_str(), 
             level=level, 
-            message=full_message,
+            message=f"[{logger_name}] {message}",
             context_str=context_str
-        )
+        ) + end
 
 
 # --- 3. Concrete Handler Implementations ---
@@ -119,11 +251,12 @@ class AbstractHandler(abc.ABC):
 class ConsoleHandler(AbstractHandler):
     """Writes log records to standard output (stdout)."""
 
-    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None,
+             context_json: Optional[str] = None) -> None:
         if not self.is_allowed(logger_name, level, message, context):
             return 
 
-        formatted_log = self.format_log(logger_name, level, message, context)
+        formatted_log = self.format_log(logger_name, level, message, context, context_json)
         sys.stdout.write(f"CONSOLE: {formatted_log}\n")
         sys.stdout.flush()
 
@@ -134,11 +267,12 @@ class MemoryHandler(AbstractHandler):
         super().__init__()
         self.log_records: List[str] = []
 
-    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None,
+             context_json: Optional[str] = None) -> None:
         if not self.is_allowed(logger_name, level, message, context):
             return
 
-        formatted_log = self.format_log(logger_name, level, message, context)
+        formatted_log = self.format_log(logger_name, level, message, context, context_json)
         self.log_records.append(formatted_log)
 
     def get_records(self) -> List[str]:
@@ -146,88 +280,237 @@ class MemoryHandler(AbstractHandler):
         return self.log_records
 
 class FileHandler(AbstractHandler):
-    """Writes log records to a file."""
+    """
+    Writes log records to a file.
 
-    def __init__(self, filename: str, mode: str = 'a'):
+    The file is opened on the first record and kept open behind a write buffer,
+    so most records cost no system call; records at flush_level or above are
+    flushed to the OS immediately. For very high log rates, a larger buffer_size
+    (e.g., 1 MiB) batches thousands of records into each write() call. Call
+    close() when done; open handlers are flushed and closed at interpreter exit.
+    """
+
+    def __init__(self, filename: str, mode: str = 'a', flush_level: str = 'WARNING',
+                 buffer_size: int = io.DEFAULT_BUFFER_SIZE):
         super().__init__()
         self.filename = filename
         self.mode = mode
-
-    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+        self.flush_level_val = LOG_LEVELS.get(flush_level.upper(), 0)
+        self.buffer_size = buffer_size
+        self._fp: Optional[io.TextIOWrapper] = None
+        self._open_mode = mode # Becomes 'a' after the first open, so reopening never truncates
+        self._lock = threading.Lock()
+
+    def _write(self, text: str, level: str) -> None:
+        """Writes to the kept-open file, opening it on first use. The caller holds self._lock."""
+        if self._fp is None:
+            # Text mode on purpose: TextIOWrapper encodes ASCII records straight into its pending
+            # buffer, which measured faster than encoding each record to bytes for a binary file
+            self._fp = open(self.filename, self._open_mode, encoding='utf-8', buffering=self.buffer_size)
+            self._open_mode = 'a'
+            _live_handlers.add(self)
+        self._fp.write(text)
+        if _resolve_level(level)[1] >= self.flush_level_val:
+            self._fp.flush()
+
+    def _close_file(self) -> None:
+        """Flushes and closes the current file, if open. The caller holds self._lock."""
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None,
+             context_json: Optional[str] = None) -> None:
         if not self.is_allowed(logger_name, level, message, context):
             return
 
-        formatted_log = self.format_log(logger_name, level, message, context)
+        record = self.format_log(logger_name, level, message, context, context_json, end='\n')
         try:
-            with open(self.filename, self.mode) as f:
-                f.write(formatted_log + '\n')
-        except IOError as e:
+            with self._lock:
+                self._write(record, level)
+        except (IOError, ValueError) as e:
             print(f"ERROR: Could not write to file {self.filename}: {e}")
 
+    def flush(self) -> None:
+        """Pushes buffered records to the OS."""
+        with self._lock:
+            if self._fp is not None:
+                self._fp.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the file. A later record reopens it."""
+        with self._lock:
+            self._close_file()
+        _live_handlers.discard(self)
+
 class RotatingFileHandler(FileHandler):
     """
     Writes log records to a file, rotating the file when it reaches a certain size.
     It keeps a configurable number of backup files.
     """
-    def __init__(self, filename: str, max_bytes: int = 1048576, backup_count: int = 5):
+    def __init__(self, filename: str, max_bytes: int = 1048576, backup_count: int = 5,
+                 flush_level: str = 'WARNING', buffer_size: int = io.DEFAULT_BUFFER_SIZE):
         # max_bytes default is 1MB
-        super().__init__(filename, 'a')
+        super().__init__(filename, 'a', flush_level, buffer_size)
         self.max_bytes = max_bytes
         self.backup_count = backup_count
         self.base_filename = filename
+        # Size of the current file, tracked in memory so emit() never has to stat() it
+        try:
+            self._bytes_written = os.path.getsize(filename)
+        except OSError:
+            self._bytes_written = 0
 
     def _do_roll_over(self) -> None:
         """Performs the log file rotation."""
         
-        # 1. Rename existing backups (e.g., file.log.4 -> file.log.5)
-        for i in range(self.backup_count - 1, 0, -1):
-            s_name = f"{self.base_filename}.{i}"
-            d_name = f"{self.base_filename}.{i + 1}"
-            if os.path.exists(s_name):
-                if os.path.exists(d_name):
-                    os.remove(d_name)
-                os.rename(s_name, d_name)
-
-        # 2. Move current file to backup 1 (e.g., file.log -> file.log.1)
-        if os.path.exists(self.base_filename):
-            d_name = f"{self.base_filename}.1"
-            if os.path.exists(d_name):
-                os.remove(d_name)
-            os.rename(self.base_filename, d_name)
+        # Shift backups up by one (file.log.4 -> file.log.5, ..., file.log -> file.log.1).
+        # os.replace overwrites an existing target in one atomic call; missing files are skipped.
+        for i in range(max(self.backup_count, 1) - 1, -1, -1):
+            s_name = f"{self.base_filename}.{i}" if i else self.base_filename
+            try:
+                os.replace(s_name, f"{self.base_filename}.{i + 1}")
+            except FileNotFoundError:
+                pass
             
         print(f"INFO: Log file rotated: {self.base_filename}")
         
-    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None,
+             context_json: Optional[str] = None) -> None:
         if not self.is_allowed(logger_name, level, message, context):
             return
 
-        formatted_log = self.format_log(logger_name, level, message, context)
+        record = self.format_log(logger_name, level, message, context, context_json, end='\n')
         
-        # Check if rollover is necessary before writing
-        if os.path.exists(self.base_filename) and os.path.getsize(self.base_filename) >= self.max_bytes:
-            self._do_roll_over()
-
-        # Write to the file (uses the parent's file writing logic)
         try:
-            with open(self.base_filename, self.mode) as f:
-                f.write(formatted_log + '\n')
-        except IOError as e:
+            with self._lock:
+                # Check if rollover is necessary before writing
+                if self._bytes_written >= self.max_bytes:
+                    self._close_file()
+                    self._do_roll_over()
+                    self._bytes_written = 0
+
+                # Write to the file (uses the parent's file writing logic)
+                self._write(record, level)
+                self._bytes_written += len(record) if record.isascii() else len(record.encode('utf-8'))
+        except (IOError, ValueError) as e:
             print(f"ERROR: Could not write to rotating file {self.base_filename}: {e}")
 
 
-class SQLiteHandler(AbstractHandler):
-    """Writes log records to a SQLite database."""
+class _QueuedHandler(AbstractHandler):
+    """
+    Base for handlers whose emit() only queues a record: a daemon thread gathers
+    queued records into batches (up to batch_size, or whatever arrived within
+    flush_interval seconds) and passes each batch to _write_batch(). Open
+    handlers are drained and closed at interpreter exit.
+    """
 
-    def __init__(self, db_name: str = 'app_logs.db', table_name: str = 'logs'):
+    _STOP = object() # Queue sentinel that ends the writer thread
+
+    def __init__(self, batch_size: int, flush_interval: float, thread_name: str):
         super().__init__()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._closed = False
+        self._state_lock = threading.Lock() # Orders emit()'s enqueue against close()'s stop sentinel
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer = threading.Thread(target=self._run, name=thread_name, daemon=True)
+        self._writer.start()
+        _live_handlers.add(self)
+
+    @abc.abstractmethod
+    def _write_batch(self, batch: List[Any]) -> None:
+        """Delivers one batch of queued records (runs on the writer thread)."""
+        pass
+
+    def _close_resources(self) -> None:
+        """Releases the handler's resources once the writer thread has stopped."""
+        pass
+
+    def _enqueue(self, record: Any) -> bool:
+        """Queues a record for the writer thread; returns False if the handler is closed."""
+        with self._state_lock:
+            if self._closed:
+                return False
+            self._queue.put_nowait(record)
+        return True
+
+    def _run(self) -> None:
+        """Writer thread: gathers queued records into batches and delivers each with one _write_batch() call."""
+        q = self._queue
+        stop = False
+        while not stop:
+            record = q.get()
+            if record is self._STOP:
+                q.task_done()
+                break
+            batch = [record]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    record = q.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if record is self._STOP:
+                    stop = True
+                    break
+                batch.append(record)
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                # Keep the writer alive: a dead writer would make every later flush() hang
+                print(f"ERROR: {type(self).__name__} dropped {len(batch)} record(s): {e}")
+            finally:
+                for _ in range(len(batch) + stop):
+                    q.task_done()
+
+    def flush(self) -> None:
+        """Blocks until every record queued so far has been delivered."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Delivers pending records, stops the writer thread and releases the handler's resources."""
+        with self._state_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(self._STOP)
+        self._writer.join()
+        _live_handlers.discard(self)
+        self._close_resources()
+
+
+class SQLiteHandler(_QueuedHandler):
+    """
+    Writes log records to a SQLite database.
+
+    emit() only queues the record; a background thread writes queued records in
+    batches (up to batch_size rows, or whatever arrived within flush_interval
+    seconds) with one executemany() per transaction. The connection is opened
+    once (WAL journal, synchronous=NORMAL). Call flush() to wait for pending
+    records and close() when done; open handlers are closed at interpreter exit.
+    """
+
+    def __init__(self, db_name: str = 'app_logs.db', table_name: str = 'logs',
+                 batch_size: int = 100, flush_interval: float = 0.05):
         self.db_name = db_name
         self.table_name = table_name
+        self._conn = sqlite3.connect(db_name, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._insert_sql = (
+            f"INSERT INTO {table_name} (timestamp, logger_name, level, message, context_json) "
+            "VALUES (?, ?, ?, ?, ?)"
+        )
         self._ensure_table_exists()
+        super().__init__(batch_size, flush_interval, f"SQLiteHandler({db_name})")
 
     def _ensure_table_exists(self):
         """Creates the log table if it doesn't exist."""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
         create_table_sql = f"""
         CREATE TABLE IF NOT EXISTS {self.table_name} (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -237,93 +520,246 @@ class SQLiteHandler(AbstractHandler):
             message TEXT,
             context_json TEXT
         );"""
-        cursor.execute(create_table_sql)
-        conn.commit()
-        conn.close()
+        self._conn.execute(create_table_sql)
 
-    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None,
+             context_json: Optional[str] = None) -> None:
         if not self.is_allowed(logger_name, level, message, context):
             return
-
-        timestamp = datetime.datetime.now().strftime(DATE_FORMAT)
-        context_json = json.dumps(context) if context else "{}" 
-
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        insert_sql = f"""
-        INSERT INTO {self.table_name} (timestamp, logger_name, level, message, context_json)
-        VALUES (?, ?, ?, ?, ?);
-        """
+        timestamp = _now_str()
+        if not context:
+            context_json = "{}"
+        elif context_json is None:
+            context_json = json.dumps(context)
+
+        if not self._enqueue((timestamp, logger_name, _resolve_level(level)[0], message, context_json)):
+            print("ERROR: SQLite write error: handler is closed")
+
+    def _write_batch(self, batch: List[tuple]) -> None:
+        if len(batch) == 1:
+            # A lone record (the usual case at low log rates) is its own autocommit transaction
+            try:
+                self._conn.execute(self._insert_sql, batch[0])
+            except sqlite3.Error as e:
+                print(f"ERROR: SQLite write error: {e}")
+            return
         try:
-            cursor.execute(insert_sql, (timestamp, logger_name, level.upper(), message, context_json))
-            conn.commit()
+            self._conn.execute("BEGIN")
+            self._conn.executemany(self._insert_sql, batch)
+            self._conn.execute("COMMIT")
         except sqlite3.Error as e:
             print(f"ERROR: SQLite write error: {e}")
-        finally:
-            conn.close()
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+
+    def _close_resources(self) -> None:
+        """Closes the database connection (after close() has written pending records)."""
+        self._conn.close()
 
 class SocketHandler(AbstractHandler):
-    """Sends log records over a TCP socket to a remote logging server."""
+    """
+    Sends log records over a TCP socket to a remote logging server.
+
+    One connection (TCP_NODELAY) is reused for all records. If connecting or
+    sending fails, the socket is dropped and no reconnect is attempted until an
+    exponentially growing delay (capped at max_backoff seconds) has passed;
+    records emitted meanwhile are discarded rather than blocking the caller.
+    """
+
+    _INITIAL_BACKOFF = 0.5
 
-    def __init__(self, host: str, port: int):
+    def __init__(self, host: str, port: int, timeout: float = 0.1, max_backoff: float = 30.0):
         super().__init__()
         self.host = host
         self.port = port
-
-    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self._sock: Optional[socket.socket] = None
+        self._backoff = 0.0
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def _connection(self) -> Optional[socket.socket]:
+        """Returns the open socket, connecting first if needed and not backing off. The caller holds self._lock."""
+        if self._sock is not None:
+            return self._sock
+        if time.monotonic() < self._retry_at:
+            return None
+        try:
+            sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            self._back_off()
+            return None
+        print(f"SUCCESS: SocketHandler connected to {self.host}:{self.port}")
+        self._sock = sock
+        self._backoff = 0.0
+        return sock
+
+    def _back_off(self) -> None:
+        """Drops the connection and schedules the next connect attempt. The caller holds self._lock."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self._backoff = min(self.max_backoff, self._backoff * 2 if self._backoff else self._INITIAL_BACKOFF)
+        self._retry_at = time.monotonic() + self._backoff
+
+    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None,
+             context_json: Optional[str] = None) -> None:
         if not self.is_allowed(logger_name, level, message, context):
             return
 
-        # Prepare a JSON object for network transfer
-        log_record = {
-            'timestamp': datetime.datetime.now().strftime(DATE_FORMAT),
-            'logger_name': logger_name,
-            'level': level,
-            'message': message,
-            'context': context
-        }
-        data = (json.dumps(log_record) + '\n').encode('utf-8')
+        # Prepare a JSON object for network transfer, splicing in the already-serialized context
+        if not context:
+            context_json = "{}"
+        elif context_json is None:
+            context_json = json.dumps(context)
+        data = (
+            f'{{"timestamp": {json.dumps(_now_str())}, "logger_name": {json.dumps(logger_name)}, '
+            f'"level": {json.dumps(level)}, "message": {json.dumps(message)}, "context": {context_json}}}\n'
+        ).encode('utf-8')
+
+        with self._lock:
+            sock = self._connection()
+            if sock is None:
+                return # Silent failure, as the listener is rarely running
+            try:
+                sock.sendall(data)
+            except OSError:
+                self._back_off() # Broken connection: reconnect later, don't retry inline
+            except Exception as e:
+                print(f"ERROR: SocketHandler unexpected error: {e}")
 
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(0.1) 
-                s.connect((self.host, self.port))
-                s.sendall(data)
-            print(f"SUCCESS: SocketHandler sent log to {self.host}:{self.port}")
-        except (ConnectionRefusedError, socket.timeout):
-            pass # Silent failure for example, as listener is rarely running
-        except Exception as e:
-            print(f"ERROR: SocketHandler unexpected error: {e}")
-
-class HTTPHandler(AbstractHandler):
-    """Sends log records as a JSON POST request to a remote HTTP endpoint."""
-
-    def __init__(self, url: str):
-        super().__init__()
-        self.url = url
+    def close(self) -> None:
+        """Closes the connection. A later record reconnects."""
+        with self._lock:
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
 
-    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+class HTTPHandler(_QueuedHandler):
+    """
+    Sends log records as JSON POST requests to a remote HTTP(S) endpoint.
+
+    emit() only queues the record; a background thread posts queued records as
+    one JSON array per request (up to batch_size records, or whatever arrived
+    within flush_interval seconds) over a single kept-alive connection. Call
+    flush() to wait for pending records and close() when done.
+    """
+
+    # Fixed shape of one posted record; the writer thread fills in the values
+    _RECORD_TEMPLATE = '{"timestamp": "%s", "logger": %s, "severity": "%s", "message": %s, "data": %s}'
+
+    def __init__(self, url: str, batch_size: int = 64, flush_interval: float = 0.025, timeout: float = 1.0):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"HTTPHandler needs an http:// or https:// URL, got: {url}")
+        self.url = url
+        self.timeout = timeout
+        self._connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self._netloc = (parts.hostname, parts.port)
+        self._path = urllib.parse.urlunsplit(('', '', parts.path or '/', parts.query, ''))
+        self._conn: Optional[http.client.HTTPConnection] = None
+        super().__init__(batch_size, flush_interval, f"HTTPHandler({url})")
+
+    def emit(self, logger_name: str, level: str, message: str, context: Optional[Dict[str, Any]] = None,
+             context_json: Optional[str] = None) -> None:
         if not self.is_allowed(logger_name, level, message, context):
             return
-
-        log_payload = {
-            'timestamp': datetime.datetime.now().isoformat(),
-            'logger': logger_name,
-            'severity': level.upper(),
-            'message': message,
-            'data': context if context else {}
-        }
-        
-        # --- HTTP Post Simulation ---
-        payload_json = json.dumps(log_payload, indent=2)
-        print(f"\n--- HTTPHandler (POST to {self.url}) ---")
-        print(f"Simulating POST request with payload:\n{payload_json}")
-        time.sleep(0.01) 
-        print("---------------------------------")
+        if not context:
+            context_json = "{}"
+        elif context_json is None:
+            context_json = json.dumps(context)
+
+        if not self._enqueue((datetime.datetime.now().isoformat(), logger_name, _resolve_level(level)[0],
+                              message, context_json)):
+            print(f"ERROR: HTTPHandler for {self.url} is closed")
+
+    def _write_batch(self, batch: List[tuple]) -> None:
+        # Records are spliced into the template rather than built as dicts and
+        # serialized; only the free-text fields need JSON string escaping
+        template = self._RECORD_TEMPLATE
+        encode_str = json.encoder.encode_basestring_ascii
+        body = ("[" + ", ".join([
+            template % (timestamp, encode_str(logger_name), severity, encode_str(message), context_json)
+            for timestamp, logger_name, severity, message, context_json in batch
+        ]) + "]").encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+        # A kept-alive connection may have been closed by the server in the
+        # meantime: retry once on a fresh connection before giving up
+        for attempt in range(2):
+            if self._conn is None:
+                host, port = self._netloc
+                self._conn = self._connection_class(host, port, timeout=self.timeout)
+            try:
+                self._conn.request('POST', self._path, body=body, headers=headers)
+                response = self._conn.getresponse()
+                response.read() # Drain so the connection can be reused
+                if response.status >= 400:
+                    print(f"ERROR: HTTPHandler POST to {self.url} returned {response.status} {response.reason}")
+                return
+            except (OSError, http.client.HTTPException) as e:
+                self._conn.close()
+                self._conn = None
+                if attempt:
+                    print(f"ERROR: HTTPHandler could not POST to {self.url}: {e}")
+
+    def _close_resources(self) -> None:
+        """Closes the kept-alive connection (after close() has posted pending records)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+# Config 'type' names used by LoggerManager.configure_logging; register custom types here
+_HANDLER_REGISTRY: Dict[str, type] = {
+    'ConsoleHandler': ConsoleHandler,
+    'MemoryHandler': MemoryHandler,
+    'FileHandler': FileHandler,
+    'RotatingFileHandler': RotatingFileHandler,
+    'SQLiteHandler': SQLiteHandler,
+    'SocketHandler': SocketHandler,
+    'HTTPHandler': HTTPHandler,
+}
+_FILTER_REGISTRY: Dict[str, type] = {
+    'LevelFilter': LevelFilter,
+    'NameFilter': NameFilter,
+    'ContextFilter': ContextFilter,
+}
 
 
 # --- 4. The Logger (Main Dispatcher) ---
 
+def _emit_adapter(handler: Any) -> Callable[..., None]:
+    """handle()-style entry point for a duck-typed handler that only defines emit()."""
+    def handle(logger_name: str, level_val: int, level: str, message: str,
+               context: Optional[Dict[str, Any]] = None, context_json: Optional[str] = None) -> None:
+        handler.emit(logger_name, level, message, context=context or {})
+    return handle
+
+def _notifying(name: str) -> Callable[..., Any]:
+    """Wraps a list method so the owning Logger refreshes its dispatch state after the call."""
+    method = getattr(list, name)
+
+    def wrapper(self, *args):
+        result = method(self, *args)
+        self._logger._recompute_effective()
+        return result
+    wrapper.__name__ = name
+    return wrapper
+
+class _HandlerList(list):
+    """A Logger's handler list: any in-place change refreshes the logger's dispatch threshold."""
+
+    def __init__(self, logger: 'Logger', handlers: Iterable[Any] = ()):
+        super().__init__(handlers)
+        self._logger = logger
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+              '__setitem__', '__delitem__', '__iadd__', '__imul__'):
+    setattr(_HandlerList, _name, _notifying(_name))
+del _name
+
 class Logger:
     """
     The main Logger class that dispatches log records to multiple handlers.
@@ -332,44 +768,97 @@ class Logger:
 
     def __init__(self, name: str, level: str = 'INFO'):
         self.name = name
-        self.level = level.upper()
-        self.handlers: List[AbstractHandler] = []
+        self._lname = _LOWER_NAMES.setdefault(name, name.lower())
+        self._handlers = _HandlerList(self)
+        self._dispatch: tuple = ()
+        self._effective_min = sys.maxsize
+        self.level = level
+
+    @property
+    def handlers(self) -> List[AbstractHandler]:
+        """The attached handlers; changing the list (or assigning a new one) updates dispatch."""
+        return self._handlers
+
+    @handlers.setter
+    def handlers(self, handlers: Iterable[AbstractHandler]) -> None:
+        self._handlers = _HandlerList(self, handlers)
+        self._recompute_effective()
+
+    @property
+    def level(self) -> str:
+        """The logger's minimum level name; assigning it is the same as set_level()."""
+        return self._level
+
+    @level.setter
+    def level(self, level: str) -> None:
+        self._level, self._level_val = _resolve_level(level)
+        self._recompute_effective()
+
+    def _recompute_effective(self) -> None:
+        """
+        Updates the lowest level any record must reach to be accepted by this logger
+        and at least one of its handlers (sys.maxsize when there are no handlers).
+        """
+        handler_min = sys.maxsize
+        dispatch = []
+        for handler in self._handlers:
+            # Duck-typed handlers (emit() only) have no level floor and no handle()
+            handler_min = min(handler_min, getattr(handler, '_min_level_val', 0))
+            owners = getattr(handler, '_owners', None)
+            if owners is not None:
+                owners.add(self)
+            handle = getattr(handler, 'handle', None)
+            dispatch.append(handle if handle is not None else _emit_adapter(handler))
+        self._dispatch = tuple(dispatch)
+        self._effective_min = max(self._level_val, handler_min)
 
     def add_handler(self, handler: AbstractHandler) -> None:
         """Adds a handler to the logger."""
-        self.handlers.append(handler)
+        self._handlers.append(handler)
 
     def set_level(self, level: str) -> None:
         """Sets the minimum log level for this logger."""
-        self.level = level.upper()
+        self.level = level
 
     def log(self, level: str, message: str, **kwargs) -> None:
         """The core logging method that checks the logger's level and dispatches to handlers."""
-        level = level.upper()
-        
-        # 1. Logger Level Check (The global minimum level)
-        if LOG_LEVELS.get(level, 0) < LOG_LEVELS.get(self.level, 0):
+        level, level_val = _resolve_level(level)
+        self._log(level, level_val, message, kwargs)
+
+    def _log(self, level: str, level_val: int, message: str, context: Dict[str, Any]) -> None:
+        """
+        Dispatches a record whose level is already resolved. The context dict is passed
+        as-is (not re-packed through **kwargs); handlers get None when it is empty.
+        """
+        # 1. Level Check: below the logger's level, or below every handler's level filters
+        if level_val < self._effective_min:
             return
 
-        # 2. Dispatch to all registered handlers
-        for handler in self.handlers:
-            handler.emit(self.name, level, message, context=kwargs)
+        # 2. Serialize the context once for all handlers
+        if context:
+            context_json = _context_json(context)
+        else:
+            context = context_json = None
+
+        # 3. Dispatch to all registered handlers (each rejects below its level filters up front)
+        for handle in self._dispatch:
+            handle(self.name, level_val, level, message, context, context_json)
 
     # Convenience methods
     def debug(self, message: str, **kwargs):
-        self.log('DEBUG', message, **kwargs)
+        self._log('DEBUG', 10, message, kwargs)
 
     def info(self, message: str, **kwargs):
-        self.log('INFO', message, **kwargs)
+        self._log('INFO', 20, message, kwargs)
 
     def warning(self, message: str, **kwargs):
-        self.log('WARNING', message, **kwargs)
+        self._log('WARNING', 30, message, kwargs)
 
     def error(self, message: str, **kwargs):
-        self.log('ERROR', message, **kwargs)
+        self._log('ERROR', 40, message, kwargs)
 
     def critical(self, message: str, **kwargs):
-        self.log('CRITICAL', message, **kwargs)
+        self._log('CRITICAL', 50, message, kwargs)
 
 
 # --- 5. Logger Manager (Singleton & Configuration API) ---
@@ -382,6 +871,7 @@ class LoggerManager:
     _instance = None
     _loggers: Dict[str, Logger] = {}
     _handlers: List[AbstractHandler] = []
+    _lock = threading.Lock() # Held only while a new logger is created
     
     DEFAULT_LEVEL = 'INFO'
 
@@ -394,13 +884,18 @@ class LoggerManager:
     @classmethod
     def get_logger(cls, name: str = 'root') -> Logger:
         """Retrieves or creates a named logger instance."""
-        if name not in cls._loggers:
-            new_logger = Logger(name=name, level=cls.DEFAULT_LEVEL)
-            # Add all centrally configured handlers
-            for handler in cls._handlers:
-                new_logger.add_handler(handler)
-            cls._loggers[name] = new_logger
-        return cls._loggers[name]
+        logger = cls._loggers.get(name)
+        if logger is None:
+            with cls._lock:
+                # Another thread may have created it while we waited for the lock
+                logger = cls._loggers.get(name)
+                if logger is None:
+                    logger = Logger(name=name, level=cls.DEFAULT_LEVEL)
+                    # Add all centrally configured handlers
+                    for handler in cls._handlers:
+                        logger.add_handler(handler)
+                    cls._loggers[name] = logger
+        return logger
 
     @classmethod
     def add_handler(cls, handler: AbstractHandler) -> None:
@@ -410,6 +905,14 @@ class LoggerManager:
         for logger in cls._loggers.values():
             logger.add_handler(handler)
             
+    @classmethod
+    def shutdown(cls) -> None:
+        """Closes every centrally configured handler that holds resources (e.g., SQLiteHandler)."""
+        for handler in cls._handlers:
+            close = getattr(handler, 'close', None)
+            if close is not None:
+                close()
+
     @classmethod
     def configure_logging(cls, config: Dict[str, Any]) -> None:
         """
@@ -447,35 +950,20 @@ class LoggerManager:
             
             # Instantiate handler
             try:
-                if handler_type == 'ConsoleHandler':
-                    handler = ConsoleHandler(**h_config)
-                elif handler_type == 'MemoryHandler':
-                    handler = MemoryHandler(**h_config)
-                elif handler_type == 'FileHandler':
-                    handler = FileHandler(**h_config)
-                elif handler_type == 'RotatingFileHandler':
-                    handler = RotatingFileHandler(**h_config)
-                elif handler_type == 'SQLiteHandler':
-                    handler = SQLiteHandler(**h_config)
-                elif handler_type == 'SocketHandler':
-                    handler = SocketHandler(**h_config)
-                elif handler_type == 'HTTPHandler':
-                    handler = HTTPHandler(**h_config)
-                else:
+                handler_class = _HANDLER_REGISTRY.get(handler_type)
+                if handler_class is None:
                     print(f"WARNING: Unknown handler type: {handler_type}. Skipping.")
                     continue
+                handler = handler_class(**h_config)
                 
                 # Apply filters to handler
                 for f_config in filter_configs:
                     filter_type = f_config.pop('type')
-                    if filter_type == 'LevelFilter':
-                        handler.add_filter(LevelFilter(**f_config))
-                    elif filter_type == 'NameFilter':
-                        handler.add_filter(NameFilter(**f_config))
-                    elif filter_type == 'ContextFilter':
-                        handler.add_filter(ContextFilter(**f_config))
-                    else:
+                    filter_class = _FILTER_REGISTRY.get(filter_type)
+                    if filter_class is None:
                         print(f"WARNING: Unknown filter type: {filter_type}. Skipping filter on {handler_name}.")
+                        continue
+                    handler.add_filter(filter_class(**f_config))
                         
                 handler_instances[handler_name] = handler
                 cls.add_handler(handler) # Add to central list for unlisted loggers
@@ -493,6 +981,7 @@ class LoggerManager:
             # Clear default handlers and add specific ones
             if 'handlers' in l_config:
                 logger.handlers = [] # Clear the default handlers added by get_logger
+                logger._recompute_effective()
                 for h_name in l_config['handlers']:
                     if h_name in handler_instances:
                         logger.add_handler(handler_instances[h_name])
@@ -512,12 +1001,34 @@ def get_logger(name: str = 'root') -> Logger:
 if __name__ == "__main__":
     
     # --- Cleanup from previous runs ---
-    for f in glob.glob("test_log.*") + glob.glob("test_log") + ["app_database.db"]:
+    for f in glob.glob("test_log.*") + glob.glob("test_log") + glob.glob("app_database.db*"):
         try:
             os.remove(f)
         except OSError:
             pass
-            
+
+    # --- Local endpoint standing in for a remote audit service ---
+    import http.server
+
+    received_posts = []
+
+    class _AuditEndpoint(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1' # Keep-alive, like a real service
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            received_posts.append(json.loads(body))
+            self.send_response(204)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    audit_server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _AuditEndpoint)
+    audit_server.daemon_threads = True
+    threading.Thread(target=audit_server.serve_forever, daemon=True).start()
+
     # --- 1. Define Configuration Dictionary ---
     LOGGING_CONFIG = {
         'default_level': 'INFO',
@@ -540,7 +1051,7 @@ if __name__ == "__main__":
             },
             'http_audit': {
                 'type': 'HTTPHandler',
-                'url': 'https://audit.example.com',
+                'url': f'http://127.0.0.1:{audit_server.server_port}/audit',
                 'filters': [{'type': 'ContextFilter', 'required_context': {'user_id': 123}}]
             }
         },
@@ -585,6 +1096,7 @@ if __name__ == "__main__":
     root_logger.critical("System shutdown imminent.")
     
     print("\n--- 3. Verifying Outputs ---")
+    LoggerManager.shutdown() # Write pending SQLite/HTTP records and close their connections
     
     # Check Rollover
     print(f"\nFiles found after rotation: {sorted(glob.glob('test_log*'))}")
@@ -602,10 +1114,15 @@ if __name__ == "__main__":
     conn.close()
     
     # Check HTTP (Expected: Log 3 and Log 6)
-    print("\nHTTP Handler output checked above (should show two POST simulations).")
+    print("\n--- HTTP Posts (Expected: Log 3 and Log 6) ---")
+    for records in received_posts:
+        for record in records:
+            print(f"HTTP Record: [{record['logger']}] [{record['severity']}] {record['message']} ({record['data']})")
+    audit_server.shutdown()
+    audit_server.server_close()
     
     # --- Cleanup after example ---
-    for f in glob.glob("test_log*") + ["app_database.db"]:
+    for f in glob.glob("test_log*") + glob.glob("app_database.db*"):
         try:
             os.remove(f)
         except OSError:
@@ -1,7 +1,18 @@
+import functools
 import hashlib
 import secrets
 import string
 import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, Optional
+
+# Optional dependency: NumPy powers calculate_entropy_many.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # --- Custom Exceptions ---
 
@@ -12,25 +23,40 @@ class InvalidCredentialsError(Exception):
 # --- Configuration Constants ---
 
 # Define the currently recommended schema version.
-CURRENT_SCHEMA_VERSION = "v1.1" 
+CURRENT_SCHEMA_VERSION = "v1.2" 
 
-# Centralized history of hashing configurations. 
+# Centralized history of hashing configurations as (key derivation, cost), oldest first.
+# For PBKDF2 the derivation is the HMAC digest and the cost the iteration count; the
+# derived key is as long as the digest output (32 bytes for SHA-256, 64 for SHA-512).
+# For "scrypt" the cost is N (with r=8, p=1) and the derived key is 64 bytes.
 # ONLY ADD new versions/iteration counts; NEVER change or remove old ones.
 HASH_CONFIG_HISTORY = {
     # v1.0: Initial strong configuration
-    "v1.0": 50000,   
-    # v1.1: Increased iteration count for future-proofing (current recommendation)
-    "v1.1": 100000, 
-    # v1.2: Example of a future planned upgrade
-    # "v1.2": 150000, 
+    "v1.0": ("sha256", 50000),
+    # v1.1: Increased iteration count for future-proofing
+    "v1.1": ("sha256", 100000),
+    # v1.2: PBKDF2-HMAC-SHA512 at the OWASP-recommended iteration count (current recommendation)
+    "v1.2": ("sha512", 210000),
+    # v2.0: Memory-hard scrypt (N=2**17, 128 MiB per hash); opt-in via hash_password(schema_version="v2.0")
+    "v2.0": ("scrypt", 2 ** 17),
 }
 
-# The currently required iteration count is derived from the history dictionary
+# Position of each schema in the history; stored hashes from older schemas are re-hashed
+_SCHEMA_ORDER = {version: index for index, version in enumerate(HASH_CONFIG_HISTORY)}
+
+# scrypt block size and parallelization (fixed for every scrypt schema)
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+
+# The currently required digest and iteration count are derived from the history dictionary
 try:
-    CURRENT_ITERATIONS = HASH_CONFIG_HISTORY[CURRENT_SCHEMA_VERSION]
+    CURRENT_DIGEST, CURRENT_ITERATIONS = HASH_CONFIG_HISTORY[CURRENT_SCHEMA_VERSION]
 except KeyError:
     raise RuntimeError(f"CURRENT_SCHEMA_VERSION '{CURRENT_SCHEMA_VERSION}' not defined in HASH_CONFIG_HISTORY.")
 
+# Leading 'SCHEMA_VERSION:ITERATIONS:' fields shared by every hash_password() result
+_CURRENT_PREFIX = f"{CURRENT_SCHEMA_VERSION}:{CURRENT_ITERATIONS}:"
+
 SALT_LENGTH = 16  # Bytes
 
 # Character Sets for Password Generation
@@ -40,64 +66,129 @@ _DIGITS = string.digits
 # Define a safe, commonly-allowed subset of special characters
 _SPECIAL = "!@#$%^&*()_+-=[]{}|;:,.<>?" 
 
+# Byte -> bit mask of the character sets above that contain it (1=lower, 2=upper, 4=digit, 8=special)
+_CHARSET_BITS = ((_LOWERCASE, 1), (_UPPERCASE, 2), (_DIGITS, 4), (_SPECIAL, 8))
+_CLASS_TABLE = bytes(
+    sum(bit for charset, bit in _CHARSET_BITS if chr(b) in charset) for b in range(256)
+)
+# ASCII byte -> bit mask of the is_strong_password checks it satisfies (1=upper, 2=lower, 4=digit, 8=not alphanumeric)
+_STRENGTH_TABLE = bytes(
+    (chr(b).isupper() and 1) | (chr(b).islower() and 2) | (chr(b).isdigit() and 4) | ((not chr(b).isalnum()) and 8)
+    if b < 128 else 0
+    for b in range(256)
+)
+# Combined character space size for each of the 16 possible bit masks
+_SPACE_FOR_MASK = tuple(
+    sum(len(charset) for charset, bit in _CHARSET_BITS if mask & bit) for mask in range(16)
+)
+# log2 of each space size (0.0 for the empty space), as used by calculate_entropy
+_LOG2_SPACE_FOR_MASK = tuple(math.log2(size) if size else 0.0 for size in _SPACE_FOR_MASK)
+
+@functools.lru_cache(maxsize=None)
+def _entropy_kernel() -> Optional[Any]:
+    """Returns the Numba-compiled entropy kernel, or None if numba is not installed."""
+    try:
+        from ._entropyKernel import entropies
+    except ImportError:
+        return None
+    return entropies
+
 def _generate_salt(length: int = SALT_LENGTH) -> bytes:
     """
     Generates a cryptographically secure random salt.
     """
     return secrets.token_bytes(length)
 
+def _derive_key(digest: str, password_bytes: bytes, salt: bytes, iterations: int) -> bytes:
+    """
+    Runs PBKDF2-HMAC with the given digest (the key is as long as the digest output),
+    or scrypt with N=iterations when digest is "scrypt".
+
+    hashlib.pbkdf2_hmac calls OpenSSL's PKCS5_PBKDF2_HMAC directly (releasing the GIL),
+    so there is no faster route to the same primitive from Python.
+    """
+    if digest == "scrypt":
+        # scrypt needs 128 * r * N bytes; allow twice that on top of OpenSSL's default limit
+        return hashlib.scrypt(password_bytes, salt=salt, n=iterations, r=_SCRYPT_R, p=_SCRYPT_P,
+                              maxmem=256 * _SCRYPT_R * iterations, dklen=64)
+    return hashlib.pbkdf2_hmac(digest, password_bytes, salt, iterations)
+
 # --- Core Hashing and Verification ---
 
-def hash_password(password: str) -> str:
+def hash_password(password: str, schema_version: Optional[str] = None) -> str:
     """
-    Hashes a plaintext password using PBKDF2-HMAC-SHA256 with the CURRENT configuration.
+    Hashes a plaintext password using PBKDF2-HMAC with the CURRENT configuration
+    (digest and iteration count from HASH_CONFIG_HISTORY[CURRENT_SCHEMA_VERSION]).
     
     The output format is a self-describing string:
     'SCHEMA_VERSION:ITERATIONS:salt_hex:hash_hex'
     
     Args:
         password: The plaintext password string.
+        schema_version: Hash with this HASH_CONFIG_HISTORY entry instead of the current
+            one, e.g. "v2.0" to opt in to scrypt.
         
     Returns:
         A string containing the version, iteration count, salt, and hash for storage.
+
+    Raises:
+        ValueError: If schema_version is not in HASH_CONFIG_HISTORY.
     """
+    return _hash_password_bytes(password.encode('utf-8'), schema_version)
+
+def _hash_password_bytes(password_bytes: bytes, schema_version: Optional[str] = None) -> str:
+    """hash_password() for a password that is already UTF-8 encoded."""
     # 1. Generate Salt
     salt = _generate_salt()
     
-    # 2. Derive Key (Hash) using CURRENT ITERATIONS
-    password_bytes = password.encode('utf-8')
-    derived_key = hashlib.pbkdf2_hmac(
-        'sha256',
-        password_bytes,
-        salt,
-        CURRENT_ITERATIONS, # Use the latest iteration count
-        dklen=32
-    )
-    
-    # 3. Format for Storage
-    salt_hex = salt.hex()
-    hash_hex = derived_key.hex()
+    # 2. Derive Key (Hash) using CURRENT DIGEST and ITERATIONS (or the requested schema's)
+    if schema_version is None or schema_version == CURRENT_SCHEMA_VERSION:
+        derived_key = _derive_key(CURRENT_DIGEST, password_bytes, salt, CURRENT_ITERATIONS)
+        prefix = _CURRENT_PREFIX
+    else:
+        if schema_version not in HASH_CONFIG_HISTORY:
+            raise ValueError(f"Unknown hash schema version: {schema_version}")
+        digest, iterations = HASH_CONFIG_HISTORY[schema_version]
+        derived_key = _derive_key(digest, password_bytes, salt, iterations)
+        prefix = f"{schema_version}:{iterations}:"
     
-    # Store all config details with the hash
-    return f"{CURRENT_SCHEMA_VERSION}:{CURRENT_ITERATIONS}:{salt_hex}:{hash_hex}"
+    # 3. Format for Storage: all config details (precomputed prefix) with the salt and hash
+    return f"{prefix}{salt.hex()}:{derived_key.hex()}"
 
-def verify_password(password: str, stored_credentials: str) -> tuple[bool, str | None]:
+def hash_passwords(passwords: Iterable[str], max_workers: Optional[int] = None,
+                   schema_version: Optional[str] = None) -> List[str]:
     """
-    Verifies a plaintext password against stored credentials and checks if re-hashing is needed.
-    
-    The function uses the version and iteration count embedded in the stored_credentials
-    to perform the correct comparison.
-    
+    Hashes many passwords concurrently (e.g., when re-hashing stored credentials in bulk).
+
+    PBKDF2 runs inside OpenSSL with the GIL released, so a thread pool scales with
+    the number of CPU cores.
+
     Args:
-        password: The plaintext password entered by the user.
-        stored_credentials: The credential string retrieved from the database.
-        
+        passwords: The plaintext password strings.
+        max_workers: Thread count; defaults to the number of CPUs.
+        schema_version: As for hash_password (default: the current schema).
+
     Returns:
-        A tuple (is_valid: bool, new_hash_string_if_rehash_needed: str | None).
-        If the hash is valid but outdated, the new hash string is returned.
+        The hash_password() result for each password, in input order.
+    """
+    passwords = list(passwords)
+    if not passwords:
+        return []
+    workers = max_workers or min(os.cpu_count() or 1, len(passwords))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(functools.partial(hash_password, schema_version=schema_version), passwords))
+
+@functools.lru_cache(maxsize=4096)
+def _parse_stored_credentials(stored_credentials: str) -> tuple[str, str, int, bytes, bytes]:
+    """
+    Splits a stored credential string into (version, digest, iterations, salt, stored_hash).
+
+    Results are cached, so verifying the same stored credentials again (session
+    refreshes, repeated API authentication) skips the parsing; only the stored
+    string is kept, never a plaintext password. Invalid strings raise
+    InvalidCredentialsError (and are not cached).
     """
     try:
-        # 1. Parse Stored Credentials
         parts = stored_credentials.split(':')
         
         if len(parts) != 4:
@@ -105,42 +196,126 @@ def verify_password(password: str, stored_credentials: str) -> tuple[bool, str |
 
         version, stored_iterations_str, salt_hex, stored_hash_hex = parts
 
-        # Check if the stored version is outdated
-        needs_rehash = (version != CURRENT_SCHEMA_VERSION)
+        if version not in HASH_CONFIG_HISTORY:
+            raise InvalidCredentialsError(f"Unknown hash schema version: {version}")
+        digest = HASH_CONFIG_HISTORY[version][0]
 
         stored_iterations = int(stored_iterations_str)
         salt = bytes.fromhex(salt_hex)
+        stored_hash = bytes.fromhex(stored_hash_hex)
         
     except (ValueError, TypeError, KeyError) as e:
         # Catch errors from int() conversion or fromhex()
         raise InvalidCredentialsError(f"Error parsing stored credentials: {e}")
 
+    return version, digest, stored_iterations, salt, stored_hash
+
+def verify_password(password: str, stored_credentials: str) -> tuple[bool, str | None]:
+    """
+    Verifies a plaintext password against stored credentials and checks if re-hashing is needed.
+    
+    The function uses the version and iteration count embedded in the stored_credentials
+    (and the digest registered for that version) to perform the correct comparison.
+    
+    Args:
+        password: The plaintext password entered by the user.
+        stored_credentials: The credential string retrieved from the database.
+        
+    Returns:
+        A tuple (is_valid: bool, new_hash_string_if_rehash_needed: str | None).
+        If the hash is valid but outdated, the new hash string is returned.
+    """
+    # 1. Parse Stored Credentials
+    version, digest, stored_iterations, salt, stored_hash = _parse_stored_credentials(stored_credentials)
+
+    # Check if the stored version is outdated (older than the current one; newer opt-in schemas are kept)
+    needs_rehash = _SCHEMA_ORDER[version] < _SCHEMA_ORDER[CURRENT_SCHEMA_VERSION]
+
     # 2. Re-hash the provided password using the STORED iteration count
     password_bytes = password.encode('utf-8')
-    derived_key = hashlib.pbkdf2_hmac(
-        'sha256',
-        password_bytes,
-        salt,
-        stored_iterations, # IMPORTANT: Must use the stored iteration count!
-        dklen=32
-    )
+    # IMPORTANT: Must use the stored digest and iteration count!
+    derived_key = _derive_key(digest, password_bytes, salt, stored_iterations)
     
-    # 3. Compare the new hash with the stored hash using constant-time comparison
-    is_match = secrets.compare_digest(derived_key.hex(), stored_hash_hex)
+    # 3. Compare the new hash with the stored hash (raw bytes) using constant-time comparison
+    is_match = secrets.compare_digest(derived_key, stored_hash)
     
     if is_match:
         # 4. Handle Re-hashing
         if needs_rehash:
             # Password is correct, but needs to be re-hashed with the current settings
-            new_hash = hash_password(password)
+            new_hash = _hash_password_bytes(password_bytes)
             return (True, new_hash)
         else:
             return (True, None) # Valid, no re-hash needed
     else:
         return (False, None) # Invalid password
 
+def calibrate_iterations(target_ms: float = 100.0, digest: str = CURRENT_DIGEST) -> int:
+    """
+    Measures PBKDF2 speed on this machine and returns the iteration count that takes
+    about target_ms milliseconds per hash.
+
+    The measurement reflects the actual hashing throughput, including hardware SHA
+    support (x86 SHA-NI, ARMv8 SHA2) in the running OpenSSL build. Use the result
+    when choosing the iteration count for a new HASH_CONFIG_HISTORY entry; it should
+    not be lower than the current recommendation.
+
+    Args:
+        target_ms: The desired time per hash, in milliseconds.
+        digest: The PBKDF2 digest to measure (default: the current schema's digest).
+
+    Returns:
+        The iteration count, rounded to a multiple of 1000 (at least 1000).
+    """
+    iterations = 10000
+    while True:
+        start = time.perf_counter()
+        _derive_key(digest, b'calibration', bytes(SALT_LENGTH), iterations)
+        elapsed = time.perf_counter() - start
+        # Keep doubling until one run is long enough to time reliably
+        if elapsed >= 0.05:
+            break
+        iterations *= 2
+
+    return max(1000, int(round(iterations * target_ms / 1000 / elapsed, -3)))
+
 # --- Password Generation Functions ---
 
+def _random_below_each(bounds: List[int]) -> List[int]:
+    """
+    Returns one uniformly distributed random integer in [0, bound) for each bound.
+
+    Randomness is read from os.urandom in blocks rather than one system call per
+    value; each value is masked to the bit length of its bound and redrawn when it
+    is out of range (rejection sampling), so there is no modulo bias.
+    """
+    results = []
+    buf = b""
+    pos = 0
+    for index, bound in enumerate(bounds):
+        bits = (bound - 1).bit_length()
+        width = (bits + 7) // 8 or 1
+        mask = (1 << bits) - 1
+        while True:
+            if pos + width > len(buf):
+                # Enough for every remaining value at the worst-case 50% acceptance rate
+                buf = os.urandom(2 * width * (len(bounds) - index) + 16)
+                pos = 0
+            value = int.from_bytes(buf[pos:pos + width], 'little') & mask
+            pos += width
+            if value < bound:
+                results.append(value)
+                break
+    return results
+
+# Selected character sets, their combined pool and the size of each set, indexed by the
+# 4-bit mask of enabled sets (same bits as _CHARSET_BITS: 1=lower, 2=upper, 4=digit, 8=special)
+_POOL_BY_MASK = tuple(
+    (charsets, "".join(charsets), [len(charset) for charset in charsets])
+    for mask in range(16)
+    for charsets in [tuple(charset for charset, bit in _CHARSET_BITS if mask & bit)]
+)
+
 def generate_strong_password(
     length: int = 16, 
     use_uppercase: bool = True, 
@@ -164,39 +339,34 @@ def generate_strong_password(
     if length < 8:
         length = 8
         
-    # Build character pool and required characters
-    required_chars = []
-    char_pool = []
-    
-    if use_lowercase:
-        required_chars.append(secrets.choice(_LOWERCASE))
-        char_pool.append(_LOWERCASE)
-    if use_uppercase:
-        required_chars.append(secrets.choice(_UPPERCASE))
-        char_pool.append(_UPPERCASE)
-    if use_digits:
-        required_chars.append(secrets.choice(_DIGITS))
-        char_pool.append(_DIGITS)
-    if use_special:
-        required_chars.append(secrets.choice(_SPECIAL))
-        char_pool.append(_SPECIAL)
+    # Look up the character pool and the sets that each need one required character
+    char_pool, full_pool, charset_sizes = _POOL_BY_MASK[
+        (1 if use_lowercase else 0) | (2 if use_uppercase else 0) | (4 if use_digits else 0) | (8 if use_special else 0)
+    ]
 
     if not char_pool:
         raise ValueError("Must enable at least one character set for generation.")
-        
-    full_pool = "".join(char_pool)
     
     # Fill the rest of the password length randomly
-    remaining_length = length - len(required_chars)
+    remaining_length = length - len(char_pool)
     if remaining_length < 0:
         # Handle case where required components are longer than length (shouldn't happen with min 8)
         remaining_length = 0 
-        
-    random_fill = [secrets.choice(full_pool) for _ in range(remaining_length)]
+    total = len(char_pool) + remaining_length
+
+    # Draw every random index at once: one per required character, one per fill
+    # character, then the Fisher-Yates swap positions (total - 1 down to 1)
+    indices = _random_below_each(
+        charset_sizes
+        + [len(full_pool)] * remaining_length
+        + list(range(total, 1, -1))
+    )
     
     # Combine all characters and shuffle to randomize positions
-    password_list = required_chars + random_fill
-    secrets.SystemRandom().shuffle(password_list) 
+    password_list = [charset[i] for charset, i in zip(char_pool, indices)]
+    password_list += [full_pool[i] for i in indices[len(char_pool):total]]
+    for i, j in zip(range(total - 1, 0, -1), indices[total:]):
+        password_list[i], password_list[j] = password_list[j], password_list[i]
     
     return "".join(password_list)
 
@@ -213,7 +383,8 @@ def generate_pin(length: int = 6) -> str:
     if length < 4:
         length = 4
     
-    return "".join(secrets.choice(_DIGITS) for _ in range(length))
+    # One uniform draw over all 10**length PINs (leading zeros kept) instead of one draw per digit
+    return f"{secrets.randbelow(10 ** length):0{length}d}"
 
 # --- Password Quality Functions ---
 
@@ -227,16 +398,13 @@ def calculate_entropy(password: str) -> float:
     Returns:
         The entropy value in bits (float).
     """
-    # Determine the size of the character space (N) by checking which sets are present.
-    char_space_size = 0
-    if any(c in _LOWERCASE for c in password):
-        char_space_size += len(_LOWERCASE)
-    if any(c in _UPPERCASE for c in password):
-        char_space_size += len(_UPPERCASE)
-    if any(c in _DIGITS for c in password):
-        char_space_size += len(_DIGITS)
-    if any(c in _SPECIAL for c in password):
-        char_space_size += len(_SPECIAL)
+    # Determine the size of the character space (N) by checking which sets are present:
+    # translate() maps every byte to its set bits in one C-level pass (characters outside
+    # ASCII belong to no set), leaving at most 16 distinct masks to combine.
+    mask = 0
+    for bits in set(password.encode('ascii', 'ignore').translate(_CLASS_TABLE)):
+        mask |= bits
+    char_space_size = _SPACE_FOR_MASK[mask]
         
     if char_space_size == 0:
         return 0.0
@@ -246,6 +414,47 @@ def calculate_entropy(password: str) -> float:
     return length * math.log2(char_space_size)
 
 
+def calculate_entropy_many(passwords: Iterable[str]) -> Any:
+    """
+    Vectorized counterpart of calculate_entropy() for auditing many passwords.
+
+    Uses a parallel Numba kernel when 'numba' is installed (its first call
+    compiles it once; the result is cached on disk) and NumPy otherwise.
+
+    Args:
+        passwords: An iterable of password strings.
+
+    Returns:
+        A float64 numpy.ndarray with the entropy (in bits) of each password.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for calculate_entropy_many ('pip install numpy').")
+
+    passwords = list(passwords)
+    # Characters outside ASCII belong to no character set, so only the ASCII bytes are kept
+    encoded = [password.encode('ascii', 'ignore') for password in passwords]
+    buf = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    lengths = np.fromiter(map(len, passwords), dtype=np.float64, count=len(passwords))
+    class_table = np.frombuffer(_CLASS_TABLE, dtype=np.uint8)
+    log2_space = np.array(_LOG2_SPACE_FOR_MASK)
+
+    kernel = _entropy_kernel()
+    if kernel is not None:
+        return kernel(buf, offsets, lengths, class_table, log2_space)
+
+    # OR together the class bits of each password's bytes; empty passwords keep mask 0
+    masks = np.zeros(len(passwords), dtype=np.uint8)
+    non_empty = offsets[1:] > offsets[:-1]
+    if buf.size:
+        masks[non_empty] = np.bitwise_or.reduceat(class_table[buf], offsets[:-1][non_empty])
+    return lengths * log2_space[masks]
+
+
 def is_strong_password(password: str, min_length: int = 12) -> dict:
     """
     Checks if a password meets basic strength requirements.
@@ -257,19 +466,54 @@ def is_strong_password(password: str, min_length: int = 12) -> dict:
     Returns:
         A dictionary of requirements and their fulfillment status.
     """
-    results = {
-        'length': len(password) >= min_length,
-        'uppercase': any(c.isupper() for c in password),
-        'lowercase': any(c.islower() for c in password),
-        'digit': any(c.isdigit() for c in password),
-        'special_char': any(not c.isalnum() for c in password)
-    }
+    if password.isascii():
+        # One C-level pass: map each byte to the checks it satisfies, then combine the distinct masks
+        mask = 0
+        for bits in set(password.encode('ascii').translate(_STRENGTH_TABLE)):
+            mask |= bits
+        results = {
+            'length': len(password) >= min_length,
+            'uppercase': bool(mask & 1),
+            'lowercase': bool(mask & 2),
+            'digit': bool(mask & 4),
+            'special_char': bool(mask & 8)
+        }
+    else:
+        # Unicode letters and digits need the full str methods; each distinct character is checked once
+        distinct = set(password)
+        results = {
+            'length': len(password) >= min_length,
+            'uppercase': any(c.isupper() for c in distinct),
+            'lowercase': any(c.islower() for c in distinct),
+            'digit': any(c.isdigit() for c in distinct),
+            'special_char': any(not c.isalnum() for c in distinct)
+        }
     results['overall'] = all(results.values())
     return results
 
 # --- Example Usage ---
 
+def _tune_main(target_ms: float) -> None:
+    """Prints the PBKDF2 iteration count that takes about target_ms on this machine."""
+    iterations = calibrate_iterations(target_ms)
+    print(f"{CURRENT_DIGEST} PBKDF2 iterations for ~{target_ms:g} ms per hash on this machine: {iterations}")
+    if iterations < CURRENT_ITERATIONS:
+        print(f"Below the current schema ({CURRENT_SCHEMA_VERSION}: {CURRENT_ITERATIONS}); keep the current settings.")
+    else:
+        print("To adopt it, add a new HASH_CONFIG_HISTORY entry and point CURRENT_SCHEMA_VERSION at it, e.g.:")
+        print(f'    "vX.Y": ("{CURRENT_DIGEST}", {iterations}),')
+
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Password manager demo and PBKDF2 tuning.")
+    parser.add_argument('--tune', type=float, metavar='MS',
+                        help="benchmark PBKDF2 and print the iteration count for a target time per hash")
+    args = parser.parse_args()
+    if args.tune is not None:
+        _tune_main(args.tune)
+        raise SystemExit(0)
+
     print("--- ADVANCED Secure Password Manager Demo (Multi-Version Support) ---")
     
     # Note: For this demo, we access the configuration constants directly to simulate old data.
@@ -281,17 +525,11 @@ if __name__ == '__main__':
     test_password = "UserPassword123!"
     
     # 1. Temporarily calculate an "old" hash using v1.0 settings
-    OLD_ITERATIONS = HASH_CONFIG_HISTORY["v1.0"] 
     OLD_VERSION = "v1.0"
+    OLD_DIGEST, OLD_ITERATIONS = HASH_CONFIG_HISTORY[OLD_VERSION]
     
     old_salt = _generate_salt()
-    old_derived_key = hashlib.pbkdf2_hmac(
-        'sha256',
-        test_password.encode('utf-8'),
-        old_salt,
-        OLD_ITERATIONS,
-        dklen=32
-    )
+    old_derived_key = _derive_key(OLD_DIGEST, test_password.encode('utf-8'), old_salt, OLD_ITERATIONS)
     old_stored_hash = f"{OLD_VERSION}:{OLD_ITERATIONS}:{old_salt.hex()}:{old_derived_key.hex()}"
     print(f"\n[DEMO SETUP] Stored Hash (OLD SCHEMA {OLD_VERSION}, {OLD_ITERATIONS} iter):")
     print(f"  {old_stored_hash[:30]}...{old_stored_hash[-30:]}")
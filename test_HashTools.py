@@ -0,0 +1,30 @@
+import hmac
+import hashlib
+from robutils.tools.HashTools import HashTools
+
+KEY = b'secret key'
+
+def test_keyed_blake2_custom_size():
+    message = b'header|body'
+    expected = hmac.new(KEY, message, lambda d=b'': hashlib.blake2b(d, digest_size=20)).hexdigest()
+    assert HashTools.calculate_digest(message, 'blake2b', key=KEY, digest_length=20) == expected
+
+def test_prefix_hasher_matches_calculate_digest():
+    cases = (
+        ('sha256', None, None),
+        ('sha256', KEY, None),
+        ('blake2b', None, 20),
+        ('blake2b', KEY, 20),
+        ('shake_128', None, 24),
+    )
+    for algorithm, key, length in cases:
+        hasher = HashTools.prefix_hasher(b'header|', algorithm, key=key, digest_length=length)
+        for suffix in (b'', b'body one', b'body two'):
+            assert hasher.digest_of(suffix) == HashTools.calculate_digest(
+                b'header|' + suffix, algorithm, key=key, digest_length=length
+            ), (algorithm, key, length, suffix)
+
+if __name__ == "__main__":
+    test_keyed_blake2_custom_size()
+    test_prefix_hasher_matches_calculate_digest()
+    print("All HashTools tests passed!")
@@ -0,0 +1,104 @@
+import os
+import json
+import tempfile
+from robutils.tools.configFactory import INIConfig, JSONConfig, XMLConfig
+
+def test_ini_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.ini')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("[file]\npath.name = /var/x\n\n[empty]\n")
+        cfg = INIConfig(path)
+        cfg.load()
+        # Option names containing a dot stay a single key
+        assert cfg.data['file']['path.name'] == '/var/x'
+        cfg.save()
+        reloaded = INIConfig(path)
+        reloaded.load()
+        assert reloaded.data == {'file': {'path.name': '/var/x'}, 'empty': {}}
+
+def test_json_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.json')
+        original = {'db.example.com': {'port': 5432}, 'server': {'tls': {'cert': 'a.pem'}}, 'tags': []}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(original, f)
+        cfg = JSONConfig(path)
+        cfg.load()
+        assert cfg.get('server.tls.cert') == 'a.pem'
+        assert cfg.data['db.example.com']['port'] == 5432
+        cfg.save()
+        with open(path, encoding='utf-8') as f:
+            assert json.load(f) == original
+
+def test_xml_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.xml')
+        cfg = XMLConfig(path)
+        cfg.set('users.max', '100')
+        cfg.set('theme.color', '#1E90FF')
+        cfg.save()
+        reloaded = XMLConfig(path)
+        reloaded.load()
+        assert reloaded.data == {'users': {'max': '100'}, 'theme': {'color': '#1E90FF'}}
+
+def test_data_is_live():
+    cfg = JSONConfig('unused.json')
+    cfg.data['new'] = 1
+    cfg.data['server'] = {'host': 'localhost'}
+    cfg.data['server']['port'] = 8080
+    assert cfg.get('new') == 1
+    assert cfg.get('server.port') == 8080
+    del cfg.data['new']
+    assert cfg.get('new') is None
+    assert cfg.data == {'server': {'host': 'localhost', 'port': 8080}}
+
+def test_set_section_from_get_and_save():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.json')
+        cfg = JSONConfig(path)
+        cfg.set('server.host', 'localhost')
+        cfg.set('server.port', 8080)
+        section = cfg.get('server')
+        assert isinstance(section, dict)
+        cfg.set('backup', dict(section))
+        cfg.save()
+        assert json.loads(json.dumps(cfg.data)) == cfg.data
+        reloaded = JSONConfig(path)
+        reloaded.load()
+        assert reloaded.get('backup.port') == 8080
+        assert reloaded.section('backup') == {'host': 'localhost', 'port': 8080}
+
+def test_json_root_must_be_object():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('[1, 2]')
+        try:
+            JSONConfig(path).load()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("a JSON array root must raise ValueError")
+
+def test_set_replaces_ancestors_and_descendants():
+    cfg = JSONConfig('unused.json')
+    cfg.set('a.b', 1)
+    cfg.set('a.b.c', 2)
+    assert cfg.get('a.b.c') == 2
+    assert cfg.get('a.b') == {'c': 2}
+    assert cfg.data == {'a': {'b': {'c': 2}}}
+    cfg.set('a', 3)
+    assert cfg.get('a.b.c') is None
+    assert cfg.data == {'a': 3}
+    assert cfg.section('a') == {}
+
+if __name__ == "__main__":
+    test_ini_round_trip()
+    test_json_round_trip()
+    test_xml_round_trip()
+    test_data_is_live()
+    test_set_section_from_get_and_save()
+    test_json_root_must_be_object()
+    test_set_replaces_ancestors_and_descendants()
+    print("All configFactory tests passed!")
@@ -0,0 +1,99 @@
+import os
+import tempfile
+from robutils.tools.databaseManager import DatabaseManager
+
+CONFIG = {'database': ':memory:', 'result_cache_size': 16}
+
+def test_rollback_clears_result_cache():
+    with DatabaseManager.get_connection('sqlite', CONFIG) as db:
+        db.execute("CREATE TABLE t (x INTEGER)")
+        try:
+            with db.transaction():
+                db.execute("INSERT INTO t VALUES (9)")
+                assert db.fetch_all("SELECT x FROM t") == [(9,)]
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        assert db.fetch_all("SELECT x FROM t") == []
+
+def test_transaction_commits_once():
+    with DatabaseManager.get_connection('sqlite', CONFIG) as db:
+        db.execute("CREATE TABLE t (x INTEGER)")
+        with db.transaction():
+            db.execute("INSERT INTO t VALUES (1)")
+            db.execute_many("INSERT INTO t VALUES (?)", [(2,), (3,)])
+        assert db.fetch_all("SELECT x FROM t ORDER BY x") == [(1,), (2,), (3,)]
+        # Served from the cache until the next write
+        assert db.fetch_all("SELECT x FROM t ORDER BY x") == [(1,), (2,), (3,)]
+        db.execute("DELETE FROM t")
+        assert db.fetch_all("SELECT x FROM t ORDER BY x") == []
+
+def test_cached_dict_rows_are_not_shared():
+    with DatabaseManager.get_connection('sqlite', {**CONFIG, 'row_factory': 'dict'}) as db:
+        db.execute("CREATE TABLE t (x INTEGER)")
+        db.execute("INSERT INTO t VALUES (1)")
+        first = db.fetch_all("SELECT x FROM t")
+        first[0]['x'] = 99
+        second = db.fetch_all("SELECT x FROM t")
+        assert second == [{'x': 1}]
+        second[0]['x'] = 42
+        assert db.fetch_all("SELECT x FROM t") == [{'x': 1}]
+
+def test_pool_rollback_clears_result_cache():
+    pool = DatabaseManager.get_pooled('sqlite', CONFIG, min_size=1, max_size=1)
+    try:
+        with pool.acquire() as db:
+            db.execute("CREATE TABLE t (x INTEGER)")
+        try:
+            with pool.acquire() as db:
+                db.execute("INSERT INTO t VALUES (9)", commit=False)
+                assert db.fetch_all("SELECT x FROM t") == [(9,)]
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        with pool.acquire() as db:
+            assert db.fetch_all("SELECT x FROM t") == []
+    finally:
+        DatabaseManager.close_pools()
+
+def test_get_pooled_key_and_sizes():
+    base = {'database': ':memory:', 'password': 'secret-a'}
+    try:
+        pool = DatabaseManager.get_pooled('sqlite', base, 0, 2)
+        assert DatabaseManager.get_pooled('sqlite', dict(base), 0, 2) is pool
+        # A different password or option gets its own pool
+        assert DatabaseManager.get_pooled('sqlite', {**base, 'password': 'secret-b'}, 0, 2) is not pool
+        dict_pool = DatabaseManager.get_pooled('sqlite', {**base, 'row_factory': 'dict', 'result_cache_size': 0}, 0, 2)
+        assert dict_pool is not pool
+        with dict_pool.acquire() as db:
+            assert db.fetch_all("SELECT 1 AS x") == [{'x': 1}]
+            assert db.result_cache_size == 0
+        # The password itself is never kept in the registry
+        assert all('secret' not in repr(key) for key in DatabaseManager._pools)
+        try:
+            DatabaseManager.get_pooled('sqlite', base, 0, 5)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("different pool sizes must raise ValueError")
+    finally:
+        DatabaseManager.close_pools()
+
+def test_sqlite_pragmas():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.db')
+        with DatabaseManager.get_connection('sqlite', {'database': path}) as db:
+            assert db.fetch_all("PRAGMA journal_mode") == [('wal',)]
+        other = os.path.join(tmp, 'plain.db')
+        # None opts out of every default PRAGMA
+        with DatabaseManager.get_connection('sqlite', {'database': other, 'pragmas': None}) as db:
+            assert db.fetch_all("PRAGMA journal_mode") == [('delete',)]
+
+if __name__ == "__main__":
+    test_sqlite_pragmas()
+    test_rollback_clears_result_cache()
+    test_transaction_commits_once()
+    test_cached_dict_rows_are_not_shared()
+    test_pool_rollback_clears_result_cache()
+    test_get_pooled_key_and_sizes()
+    print("All databaseManager tests passed!")
@@ -0,0 +1,27 @@
+import datetime
+import numpy as np
+from robutils.tools.datetimeManager import DateTimeManager
+
+def test_parse_array_fast_path():
+    arr = DateTimeManager.parse_array(['2024-03-05', '2024-03-05T10:20:30.5'])
+    assert arr.dtype == np.dtype('datetime64[us]')
+    assert arr[1] == np.datetime64('2024-03-05T10:20:30.500000')
+
+def test_parse_array_mixed_inputs():
+    arr = DateTimeManager.parse_array(['03/05/2024', '2024-3-5', datetime.datetime(2024, 3, 5, 12)])
+    assert list(arr.astype('datetime64[D]')) == [np.datetime64('2024-03-05')] * 3
+
+def test_parse_array_rejects_invalid():
+    for bad in ['', 'NaT', '2024', '2024-03', 'today', 'nonsense']:
+        try:
+            DateTimeManager.parse_array(['2024-03-05', bad])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"parse_array accepted {bad!r}")
+
+if __name__ == "__main__":
+    test_parse_array_fast_path()
+    test_parse_array_mixed_inputs()
+    test_parse_array_rejects_invalid()
+    print("All datetimeManager tests passed!")
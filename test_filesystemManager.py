@@ -0,0 +1,36 @@
+import os
+import tempfile
+from robutils.tools import filesystemManager as fm
+
+def test_atomic_write_file_content():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sub', 'out.txt')
+        assert fm.atomic_write_file_content(path, "first")
+        assert fm.atomic_write_file_content(path, "second", durable=False)
+        assert fm.read_file_content(path) == "second"
+        assert fm.atomic_write_file_content(path, b"\x00\x01")
+        with open(path, 'rb') as f:
+            assert f.read() == b"\x00\x01"
+        # No temporary files are left next to the target
+        assert os.listdir(os.path.dirname(path)) == ['out.txt']
+
+def test_atomic_write_long_filename():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'x' * 240)
+        assert fm.atomic_write_file_content(path, "content")
+        assert fm.read_file_content(path) == "content"
+        assert os.listdir(tmp) == ['x' * 240]
+
+def test_delete_path_background_long_name():
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = os.path.join(tmp, 'd' * 240)
+        os.makedirs(os.path.join(tree, 'inner'))
+        assert fm.atomic_write_file_content(os.path.join(tree, 'inner', 'f.txt'), "x")
+        assert fm.delete_path(tree, background=True)
+        assert not os.path.exists(tree)
+
+if __name__ == "__main__":
+    test_atomic_write_file_content()
+    test_atomic_write_long_filename()
+    test_delete_path_background_long_name()
+    print("All filesystemManager tests passed!")
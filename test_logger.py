@@ -0,0 +1,156 @@
+import os
+import json
+import sqlite3
+import tempfile
+import threading
+from robutils.tools.logger import _QueuedHandler, LevelFilter, Logger, MemoryHandler, RotatingFileHandler, SQLiteHandler
+
+def test_sqlite_handler_batches():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'logs.db')
+        handler = SQLiteHandler(db_path, batch_size=10, flush_interval=0.01)
+        handler.emit('app', 'INFO', 'single record')
+        handler.flush()
+        for i in range(25):
+            handler.emit('app', 'warning', f'message {i}', {'i': i})
+        handler.close()
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute("SELECT level, message, context_json FROM logs ORDER BY id").fetchall()
+        assert len(rows) == 26
+        assert rows[0] == ('INFO', 'single record', '{}')
+        assert rows[-1][:2] == ('WARNING', 'message 24')
+        assert json.loads(rows[-1][2]) == {'i': 24}
+
+class _FlakyHandler(_QueuedHandler):
+    """Queued handler whose writer fails on messages starting with 'boom'."""
+
+    def __init__(self):
+        self.written = []
+        super().__init__(batch_size=1, flush_interval=0.01, thread_name='flaky')
+
+    def emit(self, logger_name, level, message, context=None, context_json=None):
+        if not self._enqueue(message):
+            self.written.append('rejected')
+
+    def _write_batch(self, batch):
+        if batch[0].startswith('boom'):
+            raise RuntimeError(batch[0])
+        self.written.extend(batch)
+
+def _finishes(func, timeout=5.0):
+    thread = threading.Thread(target=func, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+def test_queued_handler_survives_write_errors():
+    handler = _FlakyHandler()
+    handler.emit('app', 'INFO', 'boom one')
+    handler.emit('app', 'INFO', 'after')
+    assert _finishes(handler.flush)
+    assert handler.written == ['after']
+    handler.close()
+
+def test_queued_handler_emit_after_close():
+    handler = _FlakyHandler()
+    handler.close()
+    handler.emit('app', 'INFO', 'late')
+    assert handler.written == ['rejected']
+    assert _finishes(handler.flush)
+
+def test_rotating_file_handler():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        handler = RotatingFileHandler(path, max_bytes=1, backup_count=2)
+        for i in range(4):
+            handler.emit('app', 'INFO', f'record {i}')
+        handler.close()
+        assert sorted(os.listdir(tmp)) == ['app.log', 'app.log.1', 'app.log.2']
+        # Newest record in the live file, older ones shifted up; 'record 0' fell off the end
+        for name, expected in (('app.log', 'record 3'), ('app.log.1', 'record 2'), ('app.log.2', 'record 1')):
+            with open(os.path.join(tmp, name), encoding='utf-8') as f:
+                assert f.read().rstrip().endswith(expected)
+
+def test_rotating_file_handler_without_backups():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        handler = RotatingFileHandler(path, max_bytes=1, backup_count=0)
+        handler.emit('app', 'INFO', 'first')
+        handler.emit('app', 'INFO', 'second')
+        handler.close()
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+        assert 'second' in content and 'first' not in content
+
+def test_logger_level_assignment():
+    logger = Logger('level-test')
+    handler = MemoryHandler()
+    logger.add_handler(handler)
+    logger.debug('dropped')
+    logger.level = 'debug'
+    assert logger.level == 'DEBUG'
+    logger.debug('kept')
+    logger.set_level('ERROR')
+    logger.warning('dropped too')
+    records = handler.get_records()
+    assert len(records) == 1 and 'kept' in records[0]
+
+def test_direct_handler_list_changes():
+    logger = Logger('direct-test')
+    handler = MemoryHandler()
+    logger.handlers.append(handler)
+    logger.info('appended')
+    logger.handlers.remove(handler)
+    logger.info('removed')
+    logger.handlers = [handler]
+    logger.info('assigned')
+    records = handler.get_records()
+    assert len(records) == 2 and 'appended' in records[0] and 'assigned' in records[1]
+
+class _DuckHandler:
+    """Not an AbstractHandler: only has emit()."""
+
+    def __init__(self):
+        self.records = []
+
+    def emit(self, logger_name, level, message, context=None):
+        self.records.append((logger_name, level, message, context))
+
+def test_duck_typed_handler():
+    logger = Logger('duck-test')
+    duck = _DuckHandler()
+    logger.add_handler(duck)
+    logger.handlers.append(_DuckHandler())
+    logger.warning('hello', user='a')
+    logger.debug('below level')
+    assert duck.records == [('duck-test', 'WARNING', 'hello', {'user': 'a'})]
+    assert len(logger.handlers[1].records) == 1
+
+class _NotBelowLevelFilter(LevelFilter):
+    """A LevelFilter subclass with its own rule: let one message through regardless of level."""
+
+    def filter(self, logger_name, level, message, context):
+        return message == 'always' or super().filter(logger_name, level, message, context)
+
+def test_level_filter_subclass_decides():
+    logger = Logger('filter-test', level='DEBUG')
+    handler = MemoryHandler()
+    handler.add_filter(_NotBelowLevelFilter('ERROR'))
+    logger.add_handler(handler)
+    logger.debug('always')
+    logger.debug('dropped')
+    logger.error('error')
+    records = handler.get_records()
+    assert len(records) == 2 and 'always' in records[0] and 'error' in records[1]
+
+if __name__ == "__main__":
+    test_sqlite_handler_batches()
+    test_logger_level_assignment()
+    test_level_filter_subclass_decides()
+    test_direct_handler_list_changes()
+    test_duck_typed_handler()
+    test_queued_handler_survives_write_errors()
+    test_queued_handler_emit_after_close()
+    test_rotating_file_handler()
+    test_rotating_file_handler_without_backups()
+    print("All logger tests passed!")
@@ -0,0 +1,81 @@
+import hashlib
+import string
+from collections import Counter
+from robutils.tools import passwordManager as pm
+
+def _legacy_hash(password, version, iterations, salt=b"0123456789abcdef"):
+    # Same format the SHA-256 schemas have always written: 'version:iterations:salt:hash'
+    key = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+    return f"{version}:{iterations}:{salt.hex()}:{key.hex()}"
+
+def test_verify_legacy_hashes():
+    for version, iterations in (("v1.0", 50000), ("v1.1", 100000)):
+        stored = _legacy_hash("correct horse", version, iterations)
+        valid, new_hash = pm.verify_password("correct horse", stored)
+        assert valid
+        # Outdated schemas are re-hashed with the current one
+        assert new_hash.startswith(f"{pm.CURRENT_SCHEMA_VERSION}:{pm.CURRENT_ITERATIONS}:")
+        assert pm.verify_password("correct horse", new_hash) == (True, None)
+        assert pm.verify_password("wrong horse", stored) == (False, None)
+
+def test_verify_current_and_scrypt_hashes():
+    stored = pm.hash_password("s3cret")
+    assert pm.verify_password("s3cret", stored) == (True, None)
+    assert pm.verify_password("S3cret", stored) == (False, None)
+    # The opt-in scrypt schema is newer than the current one and is kept as is
+    stored = pm.hash_password("s3cret", schema_version="v2.0")
+    assert stored.startswith("v2.0:")
+    assert pm.verify_password("s3cret", stored) == (True, None)
+
+def test_verify_rejects_malformed_credentials():
+    for stored in ("v1.2:210000:abcd", "v9.9:1:00:00", "v1.2:many:00:00", "v1.2:1:zz:00"):
+        try:
+            pm.verify_password("x", stored)
+        except pm.InvalidCredentialsError:
+            pass
+        else:
+            raise AssertionError(f"accepted malformed credentials {stored!r}")
+
+def test_random_below_each_uniform():
+    # 7 is not a power of two, so this exercises the rejection step
+    counts = Counter(pm._random_below_each([7] * 70000))
+    assert set(counts) == set(range(7))
+    assert all(abs(count - 10000) < 600 for count in counts.values())
+
+def test_generated_passwords_uniform():
+    passwords = [pm.generate_strong_password(16, use_uppercase=False, use_digits=False, use_special=False)
+                 for _ in range(2000)]
+    counts = Counter("".join(passwords))
+    assert set(counts) == set(string.ascii_lowercase)
+    expected = 2000 * 16 / 26
+    assert all(abs(count - expected) < expected * 0.2 for count in counts.values())
+
+def test_generated_password_shuffle():
+    # With every set enabled, the required characters must not stay at fixed positions
+    first = Counter()
+    for _ in range(4000):
+        password = pm.generate_strong_password(8)
+        assert len(password) == 8
+        assert any(c.islower() for c in password) and any(c.isupper() for c in password)
+        assert any(c.isdigit() for c in password) and any(not c.isalnum() for c in password)
+        first[password[0].isdigit()] += 1
+    # After the shuffle every position is alike: one required digit plus four fill
+    # characters drawn from the full pool, spread over eight positions
+    pool_size = len(pm._POOL_BY_MASK[15][1])
+    assert abs(first[True] / 4000 - (1 + 4 * 10 / pool_size) / 8) < 0.03
+
+def test_generate_pin():
+    pins = [pm.generate_pin(4) for _ in range(5000)]
+    assert all(len(pin) == 4 and pin.isdigit() for pin in pins)
+    counts = Counter(pin[0] for pin in pins)
+    assert all(abs(counts[d] - 500) < 150 for d in string.digits)
+
+if __name__ == "__main__":
+    test_verify_legacy_hashes()
+    test_verify_current_and_scrypt_hashes()
+    test_verify_rejects_malformed_credentials()
+    test_random_below_each_uniform()
+    test_generated_passwords_uniform()
+    test_generated_password_shuffle()
+    test_generate_pin()
+    print("All passwordManager tests passed!")